@@ -0,0 +1,213 @@
+# Copyright (c) 2024, InterlockLedger Network
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+import socket
+import ssl
+import threading
+from typing import Dict
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.poolmanager import PoolManager
+
+
+class ConnectionStats:
+    """
+    Thread-safe counter of the connections opened and the requests sent by an adapter.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._new_connections = 0
+        self._resumed_connections = 0
+        self._requests = 0
+
+    def count_connection(self) -> None:
+        """
+        Count a new connection to the node.
+        """
+        with self._lock:
+            self._new_connections += 1
+
+    def count_resumed_connection(self) -> None:
+        """
+        Count a new connection whose TLS session was resumed, without a full handshake.
+        """
+        with self._lock:
+            self._resumed_connections += 1
+
+    def count_request(self) -> None:
+        """
+        Count a request sent to the node.
+        """
+        with self._lock:
+            self._requests += 1
+
+    def as_dict(self) -> Dict[str, int]:
+        """
+        Get the current values of the counters.
+
+        Returns:
+            {:obj:`str`: :obj:`int`}: Number of opened connections (`new_connections`), \
+                opened connections that resumed a TLS session (`resumed_connections`), \
+                sent requests (`requests`) and requests that reused an already opened \
+                connection (`reused_connections`).
+        """
+        with self._lock:
+            return {
+                'new_connections': self._new_connections,
+                'resumed_connections': self._resumed_connections,
+                'reused_connections': max(self._requests - self._new_connections, 0),
+                'requests': self._requests,
+            }
+
+
+class _CountedHTTPConnection(HTTPConnection):
+    def __init__(self, *args, connection_stats: ConnectionStats = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._connection_stats = connection_stats
+
+    def connect(self):
+        super().connect()
+        if self._connection_stats is not None:
+            self._connection_stats.count_connection()
+
+
+class _CountedHTTPSConnection(HTTPSConnection):
+    def __init__(self, *args, connection_stats: ConnectionStats = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._connection_stats = connection_stats
+
+    def connect(self):
+        super().connect()
+        if self._connection_stats is not None:
+            self._connection_stats.count_connection()
+            if getattr(self.sock, 'session_reused', False):
+                self._connection_stats.count_resumed_connection()
+
+
+class _CountedPoolManager(PoolManager):
+    def __init__(self, *args, connection_stats: ConnectionStats = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.connection_stats = connection_stats
+
+    def _new_pool(self, scheme, host, port, request_context=None):
+        pool = super()._new_pool(scheme, host, port, request_context)
+        if scheme == 'https':
+            pool.ConnectionCls = _CountedHTTPSConnection
+        else:
+            pool.ConnectionCls = _CountedHTTPConnection
+        pool.conn_kw['connection_stats'] = self.connection_stats
+        return pool
+
+
+class IL2HTTPAdapter(HTTPAdapter):
+    """
+    HTTP adapter used by the :obj:`pyil2.IL2Client` sessions.
+
+    It works like the :obj:`requests.adapters.HTTPAdapter`, adding the TCP keep-alive
+    option to the pooled connections and counting how many connections were opened.
+    If an SSL context is given, it is used by every HTTPS connection of the adapter,
+    and the CA bundle and the verification mode come from the context, so the `verify`
+    option of `requests` is ignored.
+
+    Args:
+        keep_alive (`bool`): If `True`, enables the TCP keep-alive in the pooled connections.
+        pool_connections (:obj:`int`): Number of connection pools to cache.
+        pool_maxsize (:obj:`int`): Maximum number of connections to keep in each pool.
+        pool_block (`bool`): If `True`, blocks when no free connections are available.
+        stats (:obj:`ConnectionStats`): Counters to be updated by this adapter. \
+            Can be shared by many adapters (default: new counters).
+        ssl_context (:obj:`ssl.SSLContext`): SSL context with the client certificate \
+            (default: the context created by `requests`).
+    """
+
+    def __init__(
+            self,
+            keep_alive: bool = True,
+            pool_connections: int = 10,
+            pool_maxsize: int = 10,
+            pool_block: bool = False,
+            stats: ConnectionStats = None,
+            ssl_context: ssl.SSLContext = None,
+        ) -> None:
+        self.keep_alive = keep_alive
+        self.ssl_context = ssl_context
+        self.stats = stats if stats is not None else ConnectionStats()
+        super().__init__(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+        if self.keep_alive:
+            pool_kwargs.setdefault(
+                'socket_options',
+                HTTPConnection.default_socket_options + [
+                    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+                ]
+            )
+        if self.ssl_context is not None:
+            pool_kwargs['ssl_context'] = self.ssl_context
+        self.poolmanager = _CountedPoolManager(
+            num_pools=connections,
+            maxsize=maxsize,
+            block=block,
+            connection_stats=self.stats,
+            **pool_kwargs,
+        )
+
+    def build_connection_pool_key_attributes(self, request, verify, cert=None):
+        host_params, pool_kwargs = super().build_connection_pool_key_attributes(
+            request, verify, cert)
+        if self.ssl_context is not None:
+            # urllib3 would load the CA bundle in the shared context and change its
+            # verification mode before each connection.
+            for key in ('cert_reqs', 'ca_certs', 'ca_cert_dir'):
+                pool_kwargs.pop(key, None)
+        return host_params, pool_kwargs
+
+    def cert_verify(self, conn, url, verify, cert):
+        if self.ssl_context is None:
+            super().cert_verify(conn, url, verify, cert)
+
+    def send(self, request, *args, **kwargs):
+        self.stats.count_request()
+        return super().send(request, *args, **kwargs)
+
+    @property
+    def connection_stats(self) -> Dict[str, int]:
+        """
+        {:obj:`str`: :obj:`int`}: Number of opened connections (`new_connections`), \
+            opened connections that resumed a TLS session (`resumed_connections`), \
+            sent requests (`requests`) and requests that reused an already opened \
+            connection (`reused_connections`).
+        """
+        return self.stats.as_dict()
@@ -0,0 +1,128 @@
+# Copyright (c) 2024, InterlockLedger Network
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+from __future__ import annotations
+from abc import ABC
+import asyncio
+from collections import deque
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+)
+
+from ...models.base import ListModel
+from ...models.errors import ErrorDetailsModel
+
+if TYPE_CHECKING:
+    from ..client import AsyncIL2Client
+
+
+class BaseAsyncApi(ABC):
+    """
+    Base class for the asynchronous APIs.
+
+    Args:
+        client (:obj:`AsyncIL2Client`): Asynchronous IL2 client to be used to send requests.
+    """
+
+    def __init__(self, client: AsyncIL2Client) -> None:
+        self._client = client
+
+    def _iter_pages(
+            self,
+            list_page: Callable[[int], Awaitable[ListModel | ErrorDetailsModel]],
+            read_ahead: bool = False,
+            workers: int = 1,
+            max_buffered_pages: int = None,
+        ) -> AsyncIterator[Any | ErrorDetailsModel]:
+        """
+        Asynchronously iterate over the items of every page of a paginated list.
+
+        The items are always yielded in the order of the pages. If a request fails,
+        the error is yielded and the iteration stops.
+
+        Args:
+            list_page (`Callable`): Coroutine function that returns a page given its number.
+            read_ahead (`bool`): If `True`, requests the next page in a background \
+                task while the items of the current page are consumed.
+            workers (`int`): Number of pages requested concurrently. If greater than 1, \
+                the remaining pages are requested in parallel once the first page is received.
+            max_buffered_pages (`int`): Maximum number of pages requested ahead of the page \
+                being consumed. Default: twice the number of workers.
+        """
+        if workers < 1:
+            raise ValueError('The number of workers must be at least 1.')
+        if workers > 1:
+            window = max(max_buffered_pages or 2 * workers, workers)
+        else:
+            window = 1 if read_ahead else 0
+        return self._iter_pages_items(list_page, workers, window)
+
+    @staticmethod
+    async def _iter_pages_items(
+            list_page: Callable[[int], Awaitable[ListModel | ErrorDetailsModel]],
+            workers: int,
+            window: int,
+        ) -> AsyncIterator[Any | ErrorDetailsModel]:
+        semaphore = asyncio.Semaphore(workers)
+
+        async def fetch(page: int) -> ListModel | ErrorDetailsModel:
+            async with semaphore:
+                return await list_page(page)
+
+        pending = deque()
+        try:
+            resp = await list_page(0)
+            if isinstance(resp, ErrorDetailsModel):
+                yield resp
+                return
+            total_pages = resp.total_number_of_pages if resp.items else 1
+            next_page = 1
+            while True:
+                while next_page < total_pages and len(pending) < window:
+                    pending.append(asyncio.ensure_future(fetch(next_page)))
+                    next_page += 1
+                for item in resp.items:
+                    yield item
+                if pending:
+                    resp = await pending.popleft()
+                elif next_page < total_pages:
+                    resp = await list_page(next_page)
+                    next_page += 1
+                else:
+                    return
+                if isinstance(resp, ErrorDetailsModel):
+                    yield resp
+                    return
+                if not resp.items:
+                    return
+        finally:
+            for task in pending:
+                task.cancel()
@@ -0,0 +1,226 @@
+# Copyright (c) 2024, InterlockLedger Network
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+import os
+from typing import Any, AsyncIterator, Dict
+try:
+    import httpx
+except ImportError as e:
+    raise ImportError(
+        'The asynchronous client requires the httpx package: pip install pyil2[async]'
+    ) from e
+from ..client import BaseIL2Client
+from ..models.errors import ErrorDetailsModel
+from ..utils.stream import content_disposition_filename
+from . import api
+
+
+class AsyncIL2Client(BaseIL2Client):
+    """
+    Asynchronous REST API client to the InterlockLedger node.
+
+    It works like the :obj:`pyil2.IL2Client`, using the same certificate and
+    returning the same models, but every request is a coroutine, so many
+    requests to the node can run concurrently in a single event loop.
+
+    This client requires the `httpx` package (`pip install pyil2[async]`).
+
+    Args:
+        host (`str`): Host address in the format: scheme://hostmane[:port][/].
+        cert_filepath (:obj:`str`): Path to the .pfx certificate. \
+            Please refer to the InterlockLedger manual to see how to create \
+            and import the certificate into the node.
+        cert_password (:obj:`str`): Password of the .pfx certificate.
+        verify_ca (`bool`): If `True`, verifies the SSL certificate in a CA (default: True).
+        timeout (:obj:`int`): Request timeout in seconds (default 30s).
+        max_connections (:obj:`int`): Maximum number of concurrent connections \
+            to the node (default: 100).
+    """
+
+    def __init__(
+            self,
+            host: str,
+            cert_filepath: str,
+            cert_password: str,
+            verify_ca: bool = True,
+            timeout: int = 30,
+            max_connections: int = 100,
+        ):
+        super().__init__(
+            host=host,
+            cert_filepath=cert_filepath,
+            cert_password=cert_password,
+            verify_ca=verify_ca,
+            timeout=timeout,
+        )
+        self.max_connections = max_connections
+
+    def api(self, name: str) -> api.AsyncNodeApi | api.AsyncChainApi | \
+                                api.AsyncRecordApi | api.AsyncOpaqueApi | \
+                                api.AsyncJsonApi | api.AsyncDocumentsApi:
+        """
+        Get an instance of an asynchronous API.
+
+        Args:
+            name (:obj:`str`): API name.
+
+        Returns:
+            `BaseAsyncApi`: Instance of an asynchronous API.
+        """
+        name = name.lower()
+        match name:
+            case 'node':
+                return api.AsyncNodeApi(self)
+            case 'chain':
+                return api.AsyncChainApi(self)
+            case 'record':
+                return api.AsyncRecordApi(self)
+            case 'opaque':
+                return api.AsyncOpaqueApi(self)
+            case 'json':
+                return api.AsyncJsonApi(self)
+            case 'documents':
+                return api.AsyncDocumentsApi(self)
+            case _:
+                raise ValueError(
+                    f'No API with name {name} found. Must be in {self._available_apis}'
+                )
+
+    def _get_session(self) -> httpx.AsyncClient:
+        if not self._session:
+            self._session = httpx.AsyncClient(
+                verify=self._get_ssl_context(),
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=self.max_connections),
+            )
+        return self._session
+
+    async def aclose(self) -> None:
+        """
+        Close the connections with the node.
+        """
+        if self._session:
+            await self._session.aclose()
+            self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.aclose()
+
+    async def request(
+            self,
+            url: str,
+            method: str,
+            accept: str = 'application/json',
+            content_type: str = 'application/json',
+            body: Dict[str, Any]=None,
+            params: Dict[str, str]=None,
+            data: bytes | AsyncIterator[bytes]=None,
+            headers: Dict[str, str]=None,
+        ) -> httpx.Response:
+        '''
+        This method is used to wrap IL2 requests.
+        We do not recommend using this method directly.
+        '''
+        method = method.upper()
+        cur_uri = self._join_uri(url)
+        match method:
+            case 'GET' | 'DELETE':
+                resp = await self._get_session().request(
+                    method,
+                    cur_uri,
+                    headers=self._prepare_headers(accept, headers=headers),
+                    params=params,
+                )
+            case 'POST' | 'PATCH' | 'PUT':
+                if method != 'POST':
+                    params = None
+                if data is not None:
+                    resp = await self._get_session().request(
+                        method,
+                        cur_uri,
+                        headers=self._prepare_headers(
+                            accept, content_type, headers=headers),
+                        content=data,
+                        params=params,
+                    )
+                else:
+                    resp = await self._get_session().request(
+                        method,
+                        cur_uri,
+                        headers=self._prepare_headers(
+                            accept, content_type, headers=headers),
+                        json=body,
+                        params=params,
+                    )
+        return self._handle_error_response(resp)
+
+    async def download_file(
+            self,
+            url: str,
+            dst_path: str = './',
+            params: Dict[str, str]=None,
+        ) -> str:
+        """
+        Method to download a file to a destination path.
+
+        We do not recommend using this method directly.
+        """
+        cur_uri = self._join_uri(url)
+        async with self._get_session().stream('GET', cur_uri, params=params) as r:
+            if 400 <= r.status_code <= 599:
+                await r.aread()
+            err = self._handle_error_response(r)
+            if isinstance(err, ErrorDetailsModel):
+                return err
+            filename = content_disposition_filename(r.headers.get('content-disposition')) \
+                or os.path.basename(url)
+            filepath = os.path.expanduser(os.path.join(dst_path, filename))
+            with open(filepath, 'wb') as f:
+                async for chunk in r.aiter_raw():
+                    f.write(chunk)
+        return filepath
+
+    async def download_response(
+            self,
+            url: str,
+            params: Dict[str, str]=None,
+        ) -> httpx.Response:
+        """
+        Method to retrieve an stream GET response directly.
+        The response must be closed with `await response.aclose()`.
+
+        We do not recommend using this method directly.
+        """
+        session = self._get_session()
+        request = session.build_request('GET', self._join_uri(url), params=params)
+        resp = await session.send(request, stream=True)
+        if 400 <= resp.status_code <= 599:
+            await resp.aread()
+        return self._handle_error_response(resp)
@@ -28,6 +28,6 @@
 from .node import NodeApi
 from .chain import ChainApi
 from .record import RecordApi
-from .opaque import OpaqueApi
+from .opaque import OpaqueApi, OpaqueAppender
 from .json import JsonApi
 from .documents import DocumentsApi
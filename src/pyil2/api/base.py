@@ -27,7 +27,21 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 from __future__ import annotations
 from abc import ABC
-from typing import TYPE_CHECKING
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+import json
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+)
+
+from ..models.base import ListModel
+from ..models.errors import ErrorDetailsModel
 
 if TYPE_CHECKING:
     from ..client import IL2Client
@@ -43,3 +57,188 @@ class BaseApi(ABC):
 
     def __init__(self, client: IL2Client) -> None:
         self._client = client
+
+    def _get_cached_record(
+            self,
+            kind: str,
+            chain_id: str,
+            serial: int,
+            fetch: Callable[[], Any],
+            build: Callable[[bytes, Mapping[str, str]], Any],
+            validate: bool = True,
+        ) -> Any:
+        """
+        Get a record from the record cache of the client, requesting it to the node \
+            if it is not cached.
+
+        If `validate` is `True`, the cached record is only returned if it belongs \
+            to the requested chain and to the network of the node. Otherwise it is \
+            removed from the cache and the record is requested again.
+
+        Args:
+            kind (`str`): Kind of the response (e.g. 'record', 'opaque').
+            chain_id (`str`): Chain ID.
+            serial (`int`): Record serial number.
+            fetch (`Callable`): Function that sends the request of the record.
+            build (`Callable`): Function that builds the model of the record from \
+                the content and the headers of the response.
+            validate (`bool`): If `True`, checks the chain, serial and network of the \
+                record built from the content. Use `False` when the model takes them \
+                from the request instead of the content.
+
+        Returns:
+            Model of the record or the error returned by `fetch`.
+        """
+        cache = getattr(self._client, 'record_cache', None)
+        network = self._client.network if cache is not None else None
+        if network is None:
+            resp = fetch()
+            if isinstance(resp, ErrorDetailsModel):
+                return resp
+            return build(resp.content, resp.headers)
+        cached = cache.get(network, chain_id, serial, kind)
+        if cached is not None:
+            content, headers = cached
+            model = build(content, json.loads(headers) if headers else {})
+            if not validate or self._is_record_of(model, network, chain_id, serial):
+                return model
+            cache.invalidate(network, chain_id, serial)
+        resp = fetch()
+        if isinstance(resp, ErrorDetailsModel):
+            return resp
+        model = build(resp.content, resp.headers)
+        if not validate or self._is_record_of(model, network, chain_id, serial):
+            headers = {
+                key.lower(): value
+                for key, value in resp.headers.items()
+                if key.lower().startswith('x-')
+            }
+            cache.put(network, chain_id, serial, kind, resp.content, json.dumps(headers))
+        return model
+
+    @staticmethod
+    def _is_record_of(model: Any, network: str, chain_id: str, serial: int) -> bool:
+        return (
+            model.chain_id == chain_id
+            and model.serial == serial
+            and getattr(model, 'network', None) in (None, network)
+        )
+
+    def _run_batch(
+            self,
+            task: Callable[[Any, Future | None], Any],
+            items: Iterable[Any],
+            max_in_flight: int = 8,
+        ) -> List[Any]:
+        """
+        Run a request for each item keeping up to `max_in_flight` requests in flight.
+
+        An exception raised by the task of an item is returned as the result of \
+            that item, so the results of the other items are never lost.
+
+        Args:
+            task (`Callable`): Function that sends the request of an item. It receives \
+                the item and the future of the previous item (`None` for the first one). \
+                The result of this future is never an exception raised by the task.
+            items (`Iterable`): Items to be sent.
+            max_in_flight (`int`): Maximum number of concurrent requests.
+
+        Returns:
+            `list`: Results of the task (or the raised exceptions) in the same order \
+                of the items.
+        """
+        if max_in_flight < 1:
+            raise ValueError('The number of requests in flight must be at least 1.')
+        results = []
+        pending = deque()
+        previous = None
+        with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+            try:
+                for item in items:
+                    if len(pending) >= max_in_flight:
+                        results.append(pending.popleft().result())
+                    previous = executor.submit(self._run_batch_item, task, item, previous)
+                    pending.append(previous)
+                while pending:
+                    results.append(pending.popleft().result())
+            finally:
+                for future in pending:
+                    future.cancel()
+        return results
+
+    @staticmethod
+    def _run_batch_item(
+            task: Callable[[Any, Future | None], Any],
+            item: Any,
+            previous: Future | None,
+        ) -> Any:
+        try:
+            return task(item, previous)
+        except Exception as e:
+            return e
+
+    def _iter_pages(
+            self,
+            list_page: Callable[[int], ListModel | ErrorDetailsModel],
+            read_ahead: bool = False,
+            workers: int = 1,
+            max_buffered_pages: int = None,
+        ) -> Iterator[Any | ErrorDetailsModel]:
+        """
+        Iterate over the items of every page of a paginated list.
+
+        The items are always yielded in the order of the pages. If a request fails,
+        the error is yielded and the iteration stops.
+
+        Args:
+            list_page (`Callable`): Function that returns a page given its number.
+            read_ahead (`bool`): If `True`, requests the next page in a background \
+                thread while the items of the current page are consumed.
+            workers (`int`): Number of pages requested concurrently. If greater than 1, \
+                the remaining pages are requested in parallel once the first page is received.
+            max_buffered_pages (`int`): Maximum number of pages requested ahead of the page \
+                being consumed. Default: twice the number of workers.
+        """
+        if workers < 1:
+            raise ValueError('The number of workers must be at least 1.')
+        if workers > 1:
+            window = max(max_buffered_pages or 2 * workers, workers)
+        else:
+            window = 1 if read_ahead else 0
+        return self._iter_pages_items(list_page, workers, window)
+
+    @staticmethod
+    def _iter_pages_items(
+            list_page: Callable[[int], ListModel | ErrorDetailsModel],
+            workers: int,
+            window: int,
+        ) -> Iterator[Any | ErrorDetailsModel]:
+        executor = ThreadPoolExecutor(max_workers=workers) if window else None
+        pending = deque()
+        try:
+            resp = list_page(0)
+            if isinstance(resp, ErrorDetailsModel):
+                yield resp
+                return
+            total_pages = resp.total_number_of_pages if resp.items else 1
+            next_page = 1
+            while True:
+                while executor and next_page < total_pages and len(pending) < window:
+                    pending.append(executor.submit(list_page, next_page))
+                    next_page += 1
+                yield from resp.items
+                if pending:
+                    resp = pending.popleft().result()
+                elif next_page < total_pages:
+                    resp = list_page(next_page)
+                    next_page += 1
+                else:
+                    return
+                if isinstance(resp, ErrorDetailsModel):
+                    yield resp
+                    return
+                if not resp.items:
+                    return
+        finally:
+            if executor:
+                executor.shutdown(wait=False, cancel_futures=True)
@@ -25,13 +25,40 @@
 # CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+import datetime
+import io
 import os
 import mimetypes
+import threading
+import time
+from typing import (
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Tuple,
+)
 import requests
 from .base import BaseApi
 
 from ..models.errors import ErrorDetailsModel
 from ..models import documents as documents_models
+from ..utils.stream import (
+    BytesLike,
+    DownloadStream,
+    UploadStream,
+    map_file,
+)
+from ..utils.zipstream import (
+    ZipEntryStream,
+    iter_zip_entries,
+)
 
 
 class DocumentsApi(BaseApi):
@@ -154,6 +181,56 @@ class DocumentsApi(BaseApi):
             return resp
         return documents_models.DocumentTransactionModel(**resp.json())
 
+    def upload_document_stream(
+            self,
+            transaction_id: str,
+            filename: str,
+            content_type: str,
+            source: BytesLike | io.BufferedIOBase | Iterable[BytesLike],
+            size: int = None,
+            comment: str = None,
+            relative_path: str = "/",
+            chunk_size: int = 1024 * 1024,
+            progress: Callable[[int, int | None], None] = None,
+            check_size_limit: bool = True,
+        ) -> documents_models.DocumentTransactionModel | ErrorDetailsModel:
+        """
+        Add a file to a document upload transaction streaming its content in chunks.
+
+        The source can be a bytes-like object (including :obj:`memoryview` and \
+            :obj:`mmap.mmap`), a binary file object or an iterable of chunks. \
+            See :obj:`pyil2.utils.stream.UploadStream`.
+
+        Args:
+            transaction_id (:obj:`str`): Document upload transaction ID.
+            filename (:obj:`str`): File name.
+            content_type (:obj:`str`): File mime-type
+            source (`bytes`/`memoryview`/`mmap.mmap`/`file`/`Iterable`): File content.
+            size (:obj:`int`): File size in bytes. If `None`, it is taken from the source \
+                when possible.
+            comment (:obj:`str`): Additional comment.
+            relative_path (:obj:`str`): Relative path of the file inside the record.
+            chunk_size (:obj:`int`): Size of the chunks read from the source.
+            progress (`Callable`): Function called after each chunk is sent with the number \
+                of bytes sent so far and the file size (or `None` if unknown).
+            check_size_limit (:obj:`bool`): If `True`, checks the file size against the \
+                `file_size_limit` of the documents configuration before sending it.
+
+        Returns:
+            :obj:`pyil2.models.documents.DocumentTransactionModel`: Document upload transaction \
+                status.
+
+        Raises:
+            ValueError: If the file size is greater than the `file_size_limit`.
+        """
+        stream = UploadStream(source, size=size, chunk_size=chunk_size, progress=progress)
+        if check_size_limit and stream.size is not None:
+            err = self._check_file_size_limit(stream.size)
+            if isinstance(err, ErrorDetailsModel):
+                return err
+        return self._upload_stream(
+            transaction_id, filename, content_type, stream, comment, relative_path)
+
     def upload_document_file(
             self,
             transaction_id: str,
@@ -162,12 +239,17 @@ class DocumentsApi(BaseApi):
             relative_path: str = "/",
             filename: str = None,
             content_type: str = None,
+            chunk_size: int = 1024 * 1024,
+            progress: Callable[[int, int | None], None] = None,
+            check_size_limit: bool = True,
         ) -> documents_models.DocumentTransactionModel | ErrorDetailsModel:
         """
         Add a file to a document upload transaction using file path.
         This method will try to get the filename and the MIME-type from the filepath.
         If needed, you can force the filename and/or the content-type.
 
+        The file is memory-mapped and sent in chunks, so it is never fully loaded in memory.
+
         Args:
             transaction_id (:obj:`str`): Document upload transaction ID.
             filepath (:obj:`str`): File path.
@@ -177,30 +259,68 @@ class DocumentsApi(BaseApi):
                 If None, it will try to use the filename in the filepath.
             content_type (:obj:`str`): File mime-type. \
                 If None, it will try to guess the mime-type based on the file extension.
+            chunk_size (:obj:`int`): Size of the chunks sent.
+            progress (`Callable`): Function called after each chunk is sent with the number \
+                of bytes sent so far and the file size.
+            check_size_limit (:obj:`bool`): If `True`, checks the file size against the \
+                `file_size_limit` of the documents configuration before sending it.
 
         Returns:
             :obj:`pyil2.models.documents.DocumentTransactionModel`: Document upload transaction \
                 status.
+
+        Raises:
+            ValueError: If the file size is greater than the `file_size_limit`.
         """
         if not filename:
             filename = os.path.basename(filepath)
         if not content_type:
             content_type = mimetypes.MimeTypes().guess_type(filepath)[0]
 
+        with open(filepath, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if check_size_limit:
+                err = self._check_file_size_limit(size)
+                if isinstance(err, ErrorDetailsModel):
+                    return err
+            with map_file(f) as data:
+                stream = UploadStream(data, size=size, chunk_size=chunk_size, progress=progress)
+                return self._upload_stream(
+                    transaction_id, filename, content_type, stream, comment, relative_path)
+
+    def _check_file_size_limit(self, size: int) -> ErrorDetailsModel | None:
+        configuration = self.documents_configuration
+        if isinstance(configuration, ErrorDetailsModel):
+            return configuration
+        if configuration.file_size_limit and size > configuration.file_size_limit:
+            raise ValueError(
+                f'File size ({size} bytes) is greater than the limit '
+                f'({configuration.file_size_limit} bytes).'
+            )
+        return None
+
+    def _upload_stream(
+            self,
+            transaction_id: str,
+            filename: str,
+            content_type: str,
+            stream: UploadStream,
+            comment: str = None,
+            relative_path: str = "/",
+        ) -> documents_models.DocumentTransactionModel | ErrorDetailsModel:
         params = {
             "name": filename,
             "path": relative_path,
         }
         if comment:
             params['comment'] = comment
-        with open(filepath, 'rb') as f:
-            resp = self._client.request(
-                f'{self.base_url}/transaction/{transaction_id}',
-                method='post',
-                params=params,
-                content_type=content_type,
-                data=f,
-            )
+        resp = self._client.request(
+            f'{self.base_url}/transaction/{transaction_id}',
+            method='post',
+            params=params,
+            content_type=content_type,
+            data=stream,
+        )
         if isinstance(resp, ErrorDetailsModel):
             return resp
         return documents_models.DocumentTransactionModel(**resp.json())
@@ -223,6 +343,206 @@ class DocumentsApi(BaseApi):
             return resp
         return resp.json()
 
+    def upload_files(
+            self,
+            new_transaction: documents_models.BeginDocumentTransactionModel,
+            files: Iterable[str | Tuple[str, str]],
+            workers: int = 4,
+            max_retries: int = 2,
+            retry_delay: float = 1.0,
+            status_interval: float = 10.0,
+            progress: Callable[[int, int], None] = None,
+        ) -> str | ErrorDetailsModel:
+        """
+        Upload many files in a single document transaction and commit it.
+
+        The files are uploaded concurrently by `workers` threads, so they may be stored in \
+            the record in a different order (use `workers=1` to keep the order). \
+            Uploads that fail with a server error (or a connection error) are retried. \
+            While the files are uploaded, the transaction status is checked every \
+            `status_interval` seconds, and the upload is aborted if the transaction times out.
+
+        If a file still fails after the retries (or the status check or the commit fails), \
+            the remaining uploads are stopped and the transaction is left open, without \
+            being committed. The node aborts it after its timeout. The returned error is \
+            a :obj:`pyil2.models.documents.DocumentTransactionErrorModel` with the ID of \
+            the transaction, and the ID is also added as a note to any raised exception.
+
+        Args:
+            new_transaction (:obj:`pyil2.models.documents.BeginDocumentTransactionModel`): \
+                Begin transaction details.
+            files ([`str` | (`str`, `str`)]): File paths, or tuples with the file path and \
+                the relative path of the file inside the record (default: '/').
+            workers (:obj:`int`): Maximum number of concurrent uploads.
+            max_retries (:obj:`int`): Maximum number of retries of each file.
+            retry_delay (:obj:`float`): Delay (in seconds) before the first retry. \
+                The delay doubles in each retry.
+            status_interval (:obj:`float`): Interval (in seconds) between transaction \
+                status checks.
+            progress (`Callable`): Function called after each file is uploaded with the \
+                number of uploaded files and the total number of files.
+
+        Returns:
+            :obj:`str`: Document locator.
+
+        Raises:
+            ValueError: If a file size is greater than the `file_size_limit`.
+            TimeoutError: If the transaction times out before all the files are uploaded.
+            requests.RequestException: If a file upload still fails after the retries.
+        """
+        if workers < 1:
+            raise ValueError('The number of workers must be at least 1.')
+        files = [
+            (item, '/') if isinstance(item, str) else tuple(item)
+            for item in files
+        ]
+        configuration = self.documents_configuration
+        if isinstance(configuration, ErrorDetailsModel):
+            return configuration
+        if configuration.file_size_limit:
+            for filepath, _ in files:
+                size = os.path.getsize(filepath)
+                if size > configuration.file_size_limit:
+                    raise ValueError(
+                        f"File '{filepath}' size ({size} bytes) is greater than the limit "
+                        f'({configuration.file_size_limit} bytes).'
+                    )
+
+        transaction = self.begin_document_transaction(new_transaction)
+        if isinstance(transaction, ErrorDetailsModel):
+            return transaction
+        transaction_id = transaction.transaction_id
+        timeout_limit = transaction.timeout_limit
+
+        stop = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=workers)
+        try:
+            not_done = {
+                executor.submit(
+                    self._upload_file_with_retries,
+                    transaction_id,
+                    filepath,
+                    relative_path,
+                    max_retries,
+                    retry_delay,
+                    stop,
+                )
+                for filepath, relative_path in files
+            }
+            uploaded = 0
+            last_check = time.monotonic()
+            while not_done:
+                done, not_done = wait(
+                    not_done, timeout=status_interval, return_when=FIRST_COMPLETED)
+                for future in done:
+                    resp = future.result()
+                    if isinstance(resp, ErrorDetailsModel):
+                        return self._transaction_error(resp, transaction_id)
+                    timeout_limit = max(timeout_limit, resp.timeout_limit)
+                    uploaded += 1
+                    if progress:
+                        progress(uploaded, len(files))
+                if not_done and time.monotonic() - last_check >= status_interval:
+                    status = self.get_document_transaction_status(transaction_id)
+                    if isinstance(status, ErrorDetailsModel):
+                        return self._transaction_error(status, transaction_id)
+                    timeout_limit = status.timeout_limit
+                    last_check = time.monotonic()
+                if not_done and self._is_timed_out(timeout_limit):
+                    raise TimeoutError(
+                        f'The document transaction {transaction_id} timed out '
+                        f'after {uploaded} of {len(files)} files were uploaded.'
+                    )
+        except Exception as e:
+            e.add_note(f'The document transaction {transaction_id} was not committed.')
+            raise
+        finally:
+            stop.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+        locator = self.commit_document_transaction(transaction_id)
+        if isinstance(locator, ErrorDetailsModel):
+            return self._transaction_error(locator, transaction_id)
+        return locator
+
+    def upload_directory(
+            self,
+            new_transaction: documents_models.BeginDocumentTransactionModel,
+            directory: str,
+            recursive: bool = True,
+            **kwargs,
+        ) -> str | ErrorDetailsModel:
+        """
+        Upload the files in a directory in a single document transaction and commit it.
+
+        The subdirectories are kept as the relative paths of the files inside the record. \
+            See :obj:`upload_files` for the upload options and how failed uploads are reported.
+
+        Args:
+            new_transaction (:obj:`pyil2.models.documents.BeginDocumentTransactionModel`): \
+                Begin transaction details.
+            directory (:obj:`str`): Path of the directory.
+            recursive (:obj:`bool`): If `True`, includes the files in the subdirectories.
+            **kwargs: Options passed to :obj:`upload_files`.
+
+        Returns:
+            :obj:`str`: Document locator.
+        """
+        files = []
+        for root, dirs, filenames in os.walk(directory):
+            dirs.sort()
+            relative_dir = os.path.relpath(root, directory)
+            relative_path = '/' if relative_dir == os.curdir else \
+                '/' + relative_dir.replace(os.sep, '/')
+            for filename in sorted(filenames):
+                files.append((os.path.join(root, filename), relative_path))
+            if not recursive:
+                break
+        return self.upload_files(new_transaction, files, **kwargs)
+
+    def _upload_file_with_retries(
+            self,
+            transaction_id: str,
+            filepath: str,
+            relative_path: str,
+            max_retries: int,
+            retry_delay: float,
+            stop: threading.Event,
+        ) -> documents_models.DocumentTransactionModel | ErrorDetailsModel | None:
+        for attempt in range(max_retries + 1):
+            if stop.is_set():
+                return None
+            try:
+                resp = self.upload_document_file(
+                    transaction_id,
+                    filepath,
+                    relative_path=relative_path,
+                    check_size_limit=False,
+                )
+            except requests.RequestException:
+                if attempt == max_retries:
+                    raise
+            else:
+                retryable = isinstance(resp, ErrorDetailsModel) and \
+                    (resp.status is None or resp.status >= 500 or resp.status in (408, 429))
+                if not retryable or attempt == max_retries:
+                    return resp
+            stop.wait(retry_delay * 2 ** attempt)
+        return None
+
+    @staticmethod
+    def _transaction_error(
+            error: ErrorDetailsModel,
+            transaction_id: str,
+        ) -> documents_models.DocumentTransactionErrorModel:
+        return documents_models.DocumentTransactionErrorModel(
+            **error.model_dump(), transaction_id=transaction_id)
+
+    @staticmethod
+    def _is_timed_out(timeout_limit: datetime.datetime) -> bool:
+        if timeout_limit.tzinfo is None:
+            timeout_limit = timeout_limit.replace(tzinfo=datetime.timezone.utc)
+        return datetime.datetime.now(datetime.timezone.utc) >= timeout_limit
+
     def get_document_metadata(
             self,
             locator: str
@@ -249,15 +569,29 @@ class DocumentsApi(BaseApi):
             locator: str,
             index: int,
             dst_path: str = './',
+            chunk_size: int = 1024 * 1024,
+            resume: bool = True,
+            progress: Callable[[int, int | None], None] = None,
+            filename: str = None,
         ) -> str | ErrorDetailsModel:
         """
         Download a single document by position from the set of documents 
         to a folder (default: current folder).
 
+        The document is written to a '.part' file until the download is complete. \
+            Interrupted downloads are resumed with HTTP Range requests.
+
         Args:
             locator (:obj:`str`): A Documents Storage Locator.
             index (:obj:`int`): Index of the file.
             dst_path (:obj:`str`): Download the file to this folder.
+            chunk_size (:obj:`int`): Size of the chunks written to the file.
+            resume (:obj:`bool`): If `True`, continues the download from a '.part' file \
+                left by a previous download.
+            progress (`Callable`): Function called after each chunk is received with the \
+                number of bytes received so far and the file size (or `None` if unknown).
+            filename (:obj:`str`): Name of the downloaded file. \
+                Default: The name of the document.
 
         Returns:
             :obj:`str`: Downloaded file full path.
@@ -265,6 +599,10 @@ class DocumentsApi(BaseApi):
         resp = self._client.download_file(
             f'{self.base_url}/{locator}/{index}',
             dst_path=dst_path,
+            chunk_size=chunk_size,
+            resume=resume,
+            progress=progress,
+            filename=filename,
         )
         if isinstance(resp, ErrorDetailsModel):
             return resp
@@ -276,10 +614,16 @@ class DocumentsApi(BaseApi):
             dst_path: str = './',
             omit_from_parent: bool=False,
             omit_to_children: bool=False,
+            chunk_size: int = 1024 * 1024,
+            resume: bool = True,
+            progress: Callable[[int, int | None], None] = None,
         ) -> str | ErrorDetailsModel:
         """
         Download documents in a compressed file to a folder (default: current folder).
 
+        The file is written to a '.part' file until the download is complete. \
+            Interrupted downloads are resumed with HTTP Range requests.
+
         Args:
             locator (:obj:`str`): A Documents Storage Locator.
             dst_path (:obj:`str`): Download the file to this folder.
@@ -287,6 +631,11 @@ class DocumentsApi(BaseApi):
                 .from-parent control file in the zip.
             omit_to_children (:obj:`bool`): If True, does not include the \
                 .to-children control file in the zip.
+            chunk_size (:obj:`int`): Size of the chunks written to the file.
+            resume (:obj:`bool`): If `True`, continues the download from a '.part' file \
+                left by a previous download.
+            progress (`Callable`): Function called after each chunk is received with the \
+                number of bytes received so far and the file size (or `None` if unknown).
 
         Returns:
             :obj:`str`: Downloaded file full path.
@@ -299,11 +648,259 @@ class DocumentsApi(BaseApi):
             f'{self.base_url}/{locator}/zip',
             dst_path=dst_path,
             params=params,
+            chunk_size=chunk_size,
+            resume=resume,
+            progress=progress,
         )
         if isinstance(resp, ErrorDetailsModel):
             return resp
         return resp
 
+    def download_all_documents(
+            self,
+            locator: str,
+            dst_path: str = './',
+            workers: int = 4,
+            resume: bool = True,
+            progress: Callable[[int, int], None] = None,
+        ) -> List[documents_models.DownloadedDocumentModel] | ErrorDetailsModel:
+        """
+        Download all the documents in the set of documents to a folder \
+            (default: current folder), keeping their relative paths.
+
+        The documents are downloaded concurrently by `workers` threads, one request \
+            for each document, and the size of each downloaded file is checked against \
+            the documents metadata. If a download fails, the queued downloads are \
+            cancelled and the error is returned without waiting for them.
+        Documents with the same name and path are saved as 'name (1).ext', \
+            'name (2).ext' and so on, so they are not written to the same file. \
+            The `filepath` in the manifest is the path where each document was saved.
+
+        Args:
+            locator (:obj:`str`): A Documents Storage Locator.
+            dst_path (:obj:`str`): Download the files to this folder.
+            workers (:obj:`int`): Maximum number of concurrent downloads.
+            resume (:obj:`bool`): If `True`, continues the downloads from the '.part' files \
+                left by a previous download.
+            progress (`Callable`): Function called after each file is downloaded with the \
+                number of downloaded files and the total number of files.
+
+        Returns:
+            [:obj:`pyil2.models.documents.DownloadedDocumentModel`]: Manifest of the \
+                downloaded files, in the order of the documents.
+
+        Raises:
+            ValueError: If a document path is outside of `dst_path`.
+            IOError: If the size of a downloaded file is different from the metadata.
+        """
+        if workers < 1:
+            raise ValueError('The number of workers must be at least 1.')
+        metadata = self.get_document_metadata(locator)
+        if isinstance(metadata, ErrorDetailsModel):
+            return metadata
+        entries = metadata.public_directory
+        folders = [self._document_folder(dst_path, entry) for entry in entries]
+        filenames = self._unique_filenames(entries, folders)
+
+        manifest = [None] * len(entries)
+        executor = ThreadPoolExecutor(max_workers=workers)
+        try:
+            futures = {
+                executor.submit(
+                    self.download_single_document_at,
+                    locator,
+                    index,
+                    dst_path=folder,
+                    resume=resume,
+                    filename=filename,
+                ): index
+                for index, (folder, filename) in enumerate(zip(folders, filenames))
+            }
+            for downloaded, future in enumerate(as_completed(futures), start=1):
+                index = futures[future]
+                filepath = future.result()
+                if isinstance(filepath, ErrorDetailsModel):
+                    return filepath
+                entry = entries[index]
+                size = os.path.getsize(filepath)
+                if entry.size is not None and size != entry.size:
+                    raise IOError(
+                        f"Downloaded file '{filepath}' has {size} bytes, "
+                        f'but the document {index} has {entry.size} bytes.'
+                    )
+                manifest[index] = documents_models.DownloadedDocumentModel(
+                    index=index,
+                    filepath=filepath,
+                    **entry.model_dump(),
+                )
+                if progress:
+                    progress(downloaded, len(entries))
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        return manifest
+
+    @staticmethod
+    def _document_folder(
+            dst_path: str,
+            entry: documents_models.DirectoryEntryModel
+        ) -> str:
+        relative_path = os.path.normpath((entry.path or '').strip('/') or os.curdir)
+        if os.path.isabs(relative_path) or relative_path.split(os.sep)[0] == os.pardir:
+            raise ValueError(f"Document path '{entry.path}' is outside of the destination folder.")
+        folder = os.path.join(os.path.expanduser(dst_path), relative_path)
+        os.makedirs(folder, exist_ok=True)
+        return folder
+
+    @staticmethod
+    def _unique_filenames(
+            entries: List[documents_models.DirectoryEntryModel],
+            folders: List[str],
+        ) -> List[str | None]:
+        def key(folder: str, name: str) -> str:
+            return os.path.normcase(os.path.join(folder, name))
+
+        taken = {key(folder, entry.name) for entry, folder in zip(entries, folders) if entry.name}
+        seen = set()
+        filenames = []
+        for entry, folder in zip(entries, folders):
+            filename = None
+            if entry.name and key(folder, entry.name) in seen:
+                stem, ext = os.path.splitext(entry.name)
+                number = 1
+                while key(folder, f'{stem} ({number}){ext}') in taken:
+                    number += 1
+                filename = f'{stem} ({number}){ext}'
+                taken.add(key(folder, filename))
+            elif entry.name:
+                seen.add(key(folder, entry.name))
+            filenames.append(filename)
+        return filenames
+
+    def download_single_document_at_as_stream(
+            self,
+            locator: str,
+            index: int,
+            offset: int = 0,
+            chunk_size: int = 1024 * 1024,
+            max_retries: int = 3,
+            progress: Callable[[int, int | None], None] = None,
+        ) -> DownloadStream | ErrorDetailsModel:
+        """
+        Download a single document by position as an iterator of chunks.
+
+        If the connection drops, the download is resumed with an HTTP Range request.
+
+        Args:
+            locator (:obj:`str`): A Documents Storage Locator.
+            index (:obj:`int`): Index of the file.
+            offset (:obj:`int`): Position of the first byte to download.
+            chunk_size (:obj:`int`): Size of the chunks.
+            max_retries (:obj:`int`): Maximum number of consecutive resume attempts.
+            progress (`Callable`): Function called after each chunk is received with the \
+                number of bytes received so far and the file size (or `None` if unknown).
+
+        Returns:
+            :obj:`pyil2.utils.stream.DownloadStream`: Iterator over the chunks of the document.
+        """
+        return self._client.download_stream(
+            f'{self.base_url}/{locator}/{index}',
+            offset=offset,
+            chunk_size=chunk_size,
+            max_retries=max_retries,
+            progress=progress,
+        )
+
+    def download_documents_as_zip_as_stream(
+            self,
+            locator: str,
+            omit_from_parent: bool=False,
+            omit_to_children: bool=False,
+            offset: int = 0,
+            chunk_size: int = 1024 * 1024,
+            max_retries: int = 3,
+            progress: Callable[[int, int | None], None] = None,
+        ) -> DownloadStream | ErrorDetailsModel:
+        """
+        Download documents in a compressed file as an iterator of chunks.
+
+        If the connection drops, the download is resumed with an HTTP Range request.
+
+        Args:
+            locator (:obj:`str`): A Documents Storage Locator.
+            omit_from_parent (:obj:`bool`): If True, does not include the \
+                .from-parent control file in the zip.
+            omit_to_children (:obj:`bool`): If True, does not include the \
+                .to-children control file in the zip.
+            offset (:obj:`int`): Position of the first byte to download.
+            chunk_size (:obj:`int`): Size of the chunks.
+            max_retries (:obj:`int`): Maximum number of consecutive resume attempts.
+            progress (`Callable`): Function called after each chunk is received with the \
+                number of bytes received so far and the file size (or `None` if unknown).
+
+        Returns:
+            :obj:`pyil2.utils.stream.DownloadStream`: Iterator over the chunks of the zip file.
+        """
+        params = {
+            "omitFromParentControlFile": omit_from_parent,
+            "omitToChildrenControlFile": omit_to_children
+        }
+        return self._client.download_stream(
+            f'{self.base_url}/{locator}/zip',
+            params=params,
+            offset=offset,
+            chunk_size=chunk_size,
+            max_retries=max_retries,
+            progress=progress,
+        )
+
+    def download_documents_as_zip_entries(
+            self,
+            locator: str,
+            omit_from_parent: bool=False,
+            omit_to_children: bool=False,
+            chunk_size: int = 64 * 1024,
+            max_retries: int = 3,
+            progress: Callable[[int, int | None], None] = None,
+        ) -> Iterator[Tuple[str, ZipEntryStream]] | ErrorDetailsModel:
+        """
+        Download documents in a compressed file and iterate over the files in it \
+            while the zip file is received, without saving it.
+
+        Each file is returned as a read-only file-like object that is valid until \
+            the next file is requested. Files that are not read are skipped.
+
+        Args:
+            locator (:obj:`str`): A Documents Storage Locator.
+            omit_from_parent (:obj:`bool`): If True, does not include the \
+                .from-parent control file in the zip.
+            omit_to_children (:obj:`bool`): If True, does not include the \
+                .to-children control file in the zip.
+            chunk_size (:obj:`int`): Size of the chunks received from the node.
+            max_retries (:obj:`int`): Maximum number of consecutive resume attempts.
+            progress (`Callable`): Function called after each chunk is received with the \
+                number of bytes received so far and the zip file size (or `None` if unknown).
+
+        Returns:
+            [(:obj:`str`, :obj:`pyil2.utils.zipstream.ZipEntryStream`)]: Iterator of the \
+                path and the content of each file.
+        """
+        stream = self.download_documents_as_zip_as_stream(
+            locator,
+            omit_from_parent=omit_from_parent,
+            omit_to_children=omit_to_children,
+            chunk_size=chunk_size,
+            max_retries=max_retries,
+            progress=progress,
+        )
+        if isinstance(stream, ErrorDetailsModel):
+            return stream
+        return self._iter_zip_entries(stream)
+
+    @staticmethod
+    def _iter_zip_entries(stream: DownloadStream) -> Iterator[Tuple[str, ZipEntryStream]]:
+        with stream:
+            yield from iter_zip_entries(stream)
+
     def download_single_document_at_as_response(
             self,
             locator: str,
@@ -28,12 +28,15 @@
 from typing import (
     Dict,
     Any,
+    Iterable,
     List,
+    Tuple,
 )
 from .base import BaseApi
 from ..models.errors import ErrorDetailsModel
 from ..models import json as json_models
 from ..models.base import ListModel
+from ..models.record import OpaqueRecordModel
 
 
 class JsonApi(BaseApi):
@@ -63,13 +66,17 @@ class JsonApi(BaseApi):
         Returns:
             :obj:`pyil2.models.json.JsonDocumentModel`: JSON document details.
         """
-        resp = self._client.request(
-            f'{self.base_url}{chain_id}/{serial}',
-            method='get',
+        return self._get_cached_record(
+            'json_document',
+            chain_id,
+            serial,
+            fetch=lambda: self._client.request(
+                f'{self.base_url}{chain_id}/{serial}',
+                method='get',
+            ),
+            build=lambda content, headers: \
+                json_models.JsonDocumentModel.model_validate_json(content),
         )
-        if isinstance(resp, ErrorDetailsModel):
-            return resp
-        return json_models.JsonDocumentModel(**resp.json())
 
     def add_json_document(
             self,
@@ -95,6 +102,34 @@ class JsonApi(BaseApi):
             return resp
         return json_models.JsonDocumentModel(**resp.json())
 
+    def add_json_documents_batch(
+            self,
+            chain_id: str,
+            payloads: Iterable[Dict[str, Any]],
+            max_in_flight: int = 8,
+        ) -> List[json_models.JsonDocumentModel | ErrorDetailsModel | Exception]:
+        """
+        Add many JSON document records encrypted with the client certificate used \
+            in the request, keeping up to `max_in_flight` requests in flight.
+
+        The records may be added to the chain in a different order from `payloads`.
+
+        Args:
+            chain_id (:obj:`str`): Chain ID.
+            payloads ([:obj:`dict`]): Valid JSONs in dictionary format.
+            max_in_flight (`int`): Maximum number of concurrent requests.
+
+        Returns:
+            [:obj:`pyil2.models.json.JsonDocumentModel`]: Added JSON document details \
+                (or :obj:`pyil2.models.errors.ErrorDetailsModel`, or the exception raised \
+                by the request) in the order of `payloads`.
+        """
+        return self._run_batch(
+            lambda payload, _: self.add_json_document(chain_id, payload),
+            payloads,
+            max_in_flight,
+        )
+
     def add_json_document_with_key(
             self,
             chain_id: str,
@@ -129,6 +164,64 @@ class JsonApi(BaseApi):
             return resp
         return json_models.JsonDocumentModel(**resp.json())
 
+    def add_client_encrypted_json_document(
+            self,
+            chain_id: str,
+            payload: Dict[str, Any],
+            readers: Iterable[Tuple[str, str]],
+            application_id: int,
+            payload_type_id: int,
+            workers: int = 4,
+        ) -> OpaqueRecordModel | ErrorDetailsModel:
+        """
+        Add a JSON document encrypted on the client side for a list of readers.
+
+        The JSON is encrypted once with AES256 and only the AES key is encrypted for \
+            each reader (see :obj:`pyil2.models.json.EncryptedTextModel.encrypt`), so the \
+            node does no encryption work. As the node only encrypts JSON documents itself, \
+            the encrypted JSON is stored as an opaque record. \
+            Use :obj:`get_client_encrypted_json_document` to read it.
+
+        Args:
+            chain_id (:obj:`str`): Chain ID.
+            payload (:obj:`dict`): A valid JSON in dictionary format.
+            readers ([(:obj:`str`, :obj:`str`)]): IL2 text representations of the public key \
+                and of the key ID of each reader.
+            application_id (`int`): Application ID of the opaque record.
+            payload_type_id (`int`): Payload type ID of the opaque record.
+            workers (:obj:`int`): Maximum number of threads that encrypt the reading keys.
+
+        Returns:
+            :obj:`pyil2.models.record.OpaqueRecordModel`: Added opaque record details.
+        """
+        encrypted_json = json_models.EncryptedTextModel.encrypt(payload, readers, workers)
+        return self._client.api('opaque').add_opaque(
+            chain_id,
+            application_id,
+            payload_type_id,
+            encrypted_json.model_dump_json(by_alias=True).encode('utf-8'),
+        )
+
+    def get_client_encrypted_json_document(
+            self,
+            chain_id: str,
+            serial: int
+        ) -> json_models.EncryptedTextModel | ErrorDetailsModel:
+        """
+        Get a JSON document added with :obj:`add_client_encrypted_json_document`.
+
+        Args:
+            chain_id (:obj:`str`): Chain ID.
+            serial (`int`): Record serial number.
+
+        Returns:
+            :obj:`pyil2.models.json.EncryptedTextModel`: Encrypted JSON.
+        """
+        resp = self._client.api('opaque').get_opaque(chain_id, serial)
+        if isinstance(resp, ErrorDetailsModel):
+            return resp
+        return json_models.EncryptedTextModel.model_validate_json(resp.payload)
+
     def add_json_document_with_indirect_keys(
             self,
             chain_id: str,
@@ -25,12 +25,26 @@
 # CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
-from typing import List
+from concurrent.futures import Future
+import queue
+import threading
+import time
+from typing import Iterable, List, Mapping
 from .base import BaseApi
 from ..models.errors import ErrorDetailsModel
 from ..models.base import ListModel
 from ..models.record import OpaqueRecordModel
 
+_FLUSH = object()
+
+
+def _deadline(timeout: float | None) -> float | None:
+    return None if timeout is None else time.monotonic() + timeout
+
+
+def _remaining(deadline: float | None) -> float | None:
+    return None if deadline is None else max(deadline - time.monotonic(), 0)
+
 
 class OpaqueApi(BaseApi):
     '''
@@ -88,6 +102,135 @@ class OpaqueApi(BaseApi):
             return resp
         return OpaqueRecordModel(**resp.json())
 
+    def add_opaque_batch(
+            self,
+            chain_id: str,
+            application_id: int,
+            payload_type_id: int,
+            payloads: Iterable[bytes],
+            last_changed_serial: int = None,
+            max_in_flight: int = 8,
+        ) -> List[OpaqueRecordModel | ErrorDetailsModel | Exception]:
+        """
+        Add many opaque records in a chain keeping up to `max_in_flight` requests in flight.
+
+        If the `last_changed_serial` is passed, the payloads are appended as a contiguous \
+            sequence after this serial: the n-th payload (starting at 0) is added only if the \
+            last record serial in the chain is equal to `last_changed_serial + n`. \
+            A payload that reaches the node before the previous one is sent again \
+            once the previous one is added. The first payload is sent alone, and once a \
+            payload fails (or raises an exception), the next payloads are not sent and \
+            an error is returned for them. Payloads already in flight when a payload fails may still be added if \
+            other clients append records to the chain at the same time.
+        If `None` is passed, no verification is made and the records may be added \
+            in any order.
+
+        Args:
+            chain_id (`str`): Chain ID.
+            application_id (`int`): Application ID for the blocks.
+            payload_type_id (`int`): The payload's Type ID.
+            payloads ([`bytes`]): Payloads of the records.
+            last_changed_serial (:obj:`int`): The serial number that the last record \
+                in the chain must be equal before the first payload is added.
+            max_in_flight (`int`): Maximum number of concurrent requests.
+
+        Returns:
+            [:obj:`pyil2.models.record.OpaqueRecordModel`]: Opaque record details \
+                (or :obj:`pyil2.models.errors.ErrorDetailsModel`, or the exception raised \
+                by the request) in the order of the payloads.
+        """
+        sent_events = {}
+        last_conflict = None
+        first_failure = None
+
+        def send(index: int, payload: bytes, previous: Future | None, sent: threading.Event):
+            nonlocal last_conflict
+            expected_serial = last_changed_serial + index
+            if previous is not None:
+                # Send the requests in the order of the payloads, so they usually reach
+                # the node in the expected order. The first payload checks the serial alone
+                # and, after a conflict, wait for the previous payloads to be added until
+                # the requests in flight are resolved.
+                sent_events.setdefault(index - 1, threading.Event()).wait()
+                del sent_events[index - 1]
+                if index == 1 or \
+                        (last_conflict is not None and index - last_conflict <= max_in_flight):
+                    previous.result()
+            if first_failure is not None:
+                return ErrorDetailsModel(
+                    title='Opaque record not added',
+                    detail=f'The payload {first_failure} was not added to the chain.',
+                )
+            raced = previous is not None and not previous.done()
+            sent.set()
+            resp = self.add_opaque(
+                chain_id, application_id, payload_type_id, payload, expected_serial)
+            if raced and isinstance(resp, ErrorDetailsModel):
+                last_conflict = index
+                previous_resp = previous.result()
+                if isinstance(previous_resp, OpaqueRecordModel) \
+                        and previous_resp.serial == expected_serial:
+                    resp = self.add_opaque(
+                        chain_id, application_id, payload_type_id, payload, expected_serial)
+            return resp
+
+        def add(item: tuple[int, bytes], previous: Future | None):
+            nonlocal first_failure
+            index, payload = item
+            if last_changed_serial is None:
+                return self.add_opaque(chain_id, application_id, payload_type_id, payload)
+            sent = sent_events.setdefault(index, threading.Event())
+            try:
+                resp = send(index, payload, previous, sent)
+            except Exception as e:
+                resp = e
+            finally:
+                # Never leave the next payload waiting, even if this one raised.
+                sent.set()
+            if isinstance(resp, (ErrorDetailsModel, Exception)):
+                first_failure = index if first_failure is None else min(first_failure, index)
+            return resp
+
+        return self._run_batch(add, enumerate(payloads), max_in_flight)
+
+    def appender(
+            self,
+            chain_id: str,
+            application_id: int,
+            payload_type_id: int,
+            max_batch_size: int = 100,
+            flush_interval: float = 1.0,
+            max_pending: int = 10000,
+            max_in_flight: int = 8,
+        ) -> 'OpaqueAppender':
+        """
+        Get a buffered appender that adds opaque records in a chain in background.
+
+        Args:
+            chain_id (`str`): Chain ID.
+            application_id (`int`): Application ID for the blocks.
+            payload_type_id (`int`): The payload's Type ID.
+            max_batch_size (`int`): Number of buffered payloads that triggers a flush.
+            flush_interval (`float`): Maximum time (in seconds) a payload waits in the \
+                buffer before being sent.
+            max_pending (`int`): Maximum number of buffered payloads. When the buffer is full, \
+                :obj:`OpaqueAppender.append` blocks until there is space.
+            max_in_flight (`int`): Maximum number of concurrent requests in each flush.
+
+        Returns:
+            :obj:`OpaqueAppender`: Buffered appender.
+        """
+        return OpaqueAppender(
+            self,
+            chain_id=chain_id,
+            application_id=application_id,
+            payload_type_id=payload_type_id,
+            max_batch_size=max_batch_size,
+            flush_interval=flush_interval,
+            max_pending=max_pending,
+            max_in_flight=max_in_flight,
+        )
+
     def get_opaque(
             self,
             chain_id: str,
@@ -103,23 +246,29 @@ class OpaqueApi(BaseApi):
         Returns:
             :obj:`pyil2.models.record.OpaqueRecordModel`: Opaque record details.
         """
-        resp = self._client.request(
-            f'{self.base_url}{chain_id}@{serial}',
-            method='get',
-            accept='application/octet-stream',
-        )
-        if isinstance(resp, ErrorDetailsModel):
-            return resp
-        model = OpaqueRecordModel(
-            chain_id=chain_id,
-            serial=serial,
-            application_id=resp.headers.get('x-app-id'),
-            payload_type_id=resp.headers.get('x-payload-type-id'),
-            payload_length=len(resp.content),
-            created_at=resp.headers.get('x-created-at'),
-            payload=resp.content,
+        def build(content: bytes, headers: Mapping[str, str]) -> OpaqueRecordModel:
+            return OpaqueRecordModel(
+                chain_id=chain_id,
+                serial=serial,
+                application_id=headers.get('x-app-id'),
+                payload_type_id=headers.get('x-payload-type-id'),
+                payload_length=len(content),
+                created_at=headers.get('x-created-at'),
+                payload=content,
+            )
+
+        return self._get_cached_record(
+            'opaque',
+            chain_id,
+            serial,
+            fetch=lambda: self._client.request(
+                f'{self.base_url}{chain_id}@{serial}',
+                method='get',
+                accept='application/octet-stream',
+            ),
+            build=build,
+            validate=False,
         )
-        return model
 
     def query_opaque(
             self,
@@ -167,3 +316,231 @@ class OpaqueApi(BaseApi):
         if isinstance(resp, ErrorDetailsModel):
             return resp
         return ListModel[OpaqueRecordModel](**resp.json())
+
+
+class OpaqueAppender:
+    """
+    Write-behind appender of opaque records.
+
+    The payloads are buffered and sent by a background thread when `max_batch_size` \
+        payloads are buffered or when the oldest buffered payload has waited \
+        `flush_interval` seconds. Each appended payload has a future with the result \
+        of its request.
+
+    Args:
+        api (:obj:`OpaqueApi`): Opaque API used to send the requests.
+        chain_id (`str`): Chain ID.
+        application_id (`int`): Application ID for the blocks.
+        payload_type_id (`int`): The payload's Type ID.
+        max_batch_size (`int`): Number of buffered payloads that triggers a flush.
+        flush_interval (`float`): Maximum time (in seconds) a payload waits in the \
+            buffer before being sent.
+        max_pending (`int`): Maximum number of buffered payloads.
+        max_in_flight (`int`): Maximum number of concurrent requests in each flush.
+    """
+
+    def __init__(
+            self,
+            api: OpaqueApi,
+            chain_id: str,
+            application_id: int,
+            payload_type_id: int,
+            max_batch_size: int = 100,
+            flush_interval: float = 1.0,
+            max_pending: int = 10000,
+            max_in_flight: int = 8,
+        ) -> None:
+        if max_batch_size < 1:
+            raise ValueError('The batch size must be at least 1.')
+        self._api = api
+        self.chain_id = chain_id
+        self.application_id = application_id
+        self.payload_type_id = payload_type_id
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval
+        self.max_in_flight = max_in_flight
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._lock = threading.Lock()
+        self._closed = False
+        self._error = None
+        self._worker = threading.Thread(
+            target=self._run,
+            name='OpaqueAppender',
+            daemon=True,
+        )
+        self._worker.start()
+
+    @property
+    def closed(self) -> bool:
+        """:obj:`bool`: `True` if the appender is closed."""
+        return self._closed
+
+    def append(
+            self,
+            payload: bytes,
+            timeout: float = None,
+        ) -> Future[OpaqueRecordModel | ErrorDetailsModel]:
+        """
+        Buffer a payload to be added as an opaque record.
+
+        If the buffer is full, waits until there is space for the payload.
+
+        Args:
+            payload (`bytes`): Payload bytes.
+            timeout (`float`): Maximum time (in seconds) to wait for space in the buffer. \
+                If `None`, waits indefinitely.
+
+        Returns:
+            :obj:`concurrent.futures.Future`: Future with the \
+                :obj:`pyil2.models.record.OpaqueRecordModel` \
+                (or :obj:`pyil2.models.errors.ErrorDetailsModel`) of the record. \
+                If the request of the payload raises, the future holds the exception.
+
+        Raises:
+            RuntimeError: If the appender is closed.
+            queue.Full: If there is no space in the buffer after `timeout` seconds.
+        """
+        future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError('The appender is closed.')
+            self._queue.put((payload, future), timeout=timeout)
+        return future
+
+    def flush(self, timeout: float = None) -> bool:
+        """
+        Send the buffered payloads and wait until their requests are finished.
+
+        Args:
+            timeout (`float`): Maximum time (in seconds) to wait. If `None`, waits indefinitely.
+
+        Returns:
+            :obj:`bool`: `True` if all the payloads appended before the call were sent.
+        """
+        if self._closed:
+            return self._error is None
+        return self._flush(_deadline(timeout))
+
+    def close(self, timeout: float = None) -> bool:
+        """
+        Send the buffered payloads and stop the background thread. \
+            No payloads can be appended after the appender is closed.
+
+        If the background thread stops with an error, the appender is closed and the \
+            futures of the buffered payloads are failed with the error.
+
+        Args:
+            timeout (`float`): Maximum time (in seconds) to wait. If `None`, waits indefinitely.
+
+        Returns:
+            :obj:`bool`: `True` if all the buffered payloads were sent.
+        """
+        with self._lock:
+            if self._closed:
+                return self._error is None
+            self._closed = True
+        deadline = _deadline(timeout)
+        flushed = self._flush(deadline)
+        try:
+            self._queue.put((None, None), timeout=_remaining(deadline))
+        except queue.Full:
+            return False
+        self._worker.join(timeout=_remaining(deadline))
+        return flushed
+
+    def _flush(self, deadline: float | None) -> bool:
+        marker = Future()
+        try:
+            with self._lock:
+                if self._error is not None:
+                    return False
+                self._queue.put((_FLUSH, marker), timeout=_remaining(deadline))
+            return marker.result(timeout=_remaining(deadline))
+        except (queue.Full, TimeoutError):
+            return False
+
+    def __enter__(self) -> 'OpaqueAppender':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def _run(self) -> None:
+        payloads = []
+        futures = []
+        deadline = None
+        try:
+            while True:
+                timeout = None if deadline is None else max(deadline - time.monotonic(), 0)
+                try:
+                    payload, future = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    payload, future = _FLUSH, None
+                if payload is None:
+                    return
+                if payload is not _FLUSH:
+                    payloads.append(payload)
+                    futures.append(future)
+                    if deadline is None:
+                        deadline = time.monotonic() + self.flush_interval
+                    if len(payloads) < self.max_batch_size:
+                        continue
+                self._send(payloads, futures)
+                payloads.clear()
+                futures.clear()
+                deadline = None
+                if payload is _FLUSH and future is not None:
+                    future.set_result(True)
+        except BaseException as e:
+            self._fail_pending(futures, e)
+            raise
+
+    def _fail_pending(self, futures: List[Future], error: BaseException) -> None:
+        self._error = error
+        self._closed = True
+        self._fail(futures, error)
+        # Drain the queue again after taking the lock, so a payload appended while
+        # the queue was full is not left behind.
+        self._fail_queued(error)
+        with self._lock:
+            self._fail_queued(error)
+
+    def _fail_queued(self, error: BaseException) -> None:
+        while True:
+            try:
+                payload, future = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if payload is _FLUSH:
+                future.set_result(False)
+            elif future is not None:
+                future.set_exception(error)
+
+    @staticmethod
+    def _fail(futures: List[Future], error: BaseException) -> None:
+        for future in futures:
+            if not future.done():
+                future.set_exception(error)
+
+    def _send(self, payloads: List[bytes], futures: List[Future]) -> None:
+        if not payloads:
+            return
+        try:
+            results = self._api.add_opaque_batch(
+                self.chain_id,
+                self.application_id,
+                self.payload_type_id,
+                payloads,
+                max_in_flight=self.max_in_flight,
+            )
+        except Exception as e:
+            for future in futures:
+                future.set_exception(e)
+            return
+        # Each future gets the outcome of its own payload, so the payloads that were
+        # added are never reported as failed when another payload of the batch raises.
+        for future, result in zip(futures, results):
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
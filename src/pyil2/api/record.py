@@ -25,12 +25,64 @@
 # CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+from collections import deque
+from concurrent.futures import (
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from functools import partial
+import json
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+)
+
 from ..models.base import ListModel
 from ..models.errors import ErrorDetailsModel
 from ..models import record as record_models
+from ..utils.range import LimitedRange
 
 from .base import BaseApi
 
+_process_api = None
+
+
+def _init_export_process(client_class: type, client_kwargs: Dict[str, Any]) -> None:
+    global _process_api
+    _process_api = client_class(**client_kwargs).api('record')
+
+
+def _export_range(
+        api: 'RecordApi',
+        chain_id: str,
+        serials: LimitedRange,
+        ommit_payload: bool,
+        page_size: int,
+    ) -> List[Dict[str, Any]] | ErrorDetailsModel:
+    records = []
+    for item in api.iter_records(
+            chain_id,
+            first_serial=serials.start,
+            last_serial=serials.end,
+            ommit_payload=ommit_payload,
+            size=page_size):
+        if isinstance(item, ErrorDetailsModel):
+            return item
+        records.append(item.model_dump(mode='json', by_alias=True))
+    return records
+
+
+def _export_range_in_process(
+        chain_id: str,
+        serials: LimitedRange,
+        ommit_payload: bool,
+        page_size: int,
+    ) -> List[Dict[str, Any]] | ErrorDetailsModel:
+    return _export_range(_process_api, chain_id, serials, ommit_payload, page_size)
+
 
 class RecordApi(BaseApi):
     '''
@@ -44,6 +96,7 @@ class RecordApi(BaseApi):
     '''
 
     base_url = 'records@'
+    _export_formats = ['jsonl', 'columnar']
 
     def list_records(
             self,
@@ -93,6 +146,165 @@ class RecordApi(BaseApi):
             return resp
         return ListModel[record_models.RecordModel](**resp.json())
 
+    def iter_records(
+            self,
+            chain_id: str,
+            first_serial: int = None,
+            last_serial: int = None,
+            last_to_first: bool = False,
+            ommit_payload: bool = False,
+            size: int = 100,
+            read_ahead: bool = False,
+            workers: int = 1,
+            max_buffered_pages: int = None,
+        ) -> Iterator[record_models.RecordModel | ErrorDetailsModel]:
+        """
+        Iterate over the records in a chain, requesting the pages as they are needed.
+
+        The records are always yielded in order. With `workers` greater than 1, the pages \
+            are requested in parallel and at most `max_buffered_pages` pages are kept in \
+            memory ahead of the page being consumed.
+        If a request fails, the :obj:`pyil2.models.errors.ErrorDetailsModel` is yielded \
+            and the iteration stops.
+
+        Args:
+            chain_id (`str`): Chain ID.
+            first_serial (`int`): Serial number of first record to read. \
+                Default: First in whole chain.
+            last_serial (`int`): Serial number of last record to read. \
+                Default: Last in whole chain.
+            last_to_first (`bool`): If `True`, return the items in reverse order.
+            ommit_payload (`bool`): If `True`, ommits the payload in the response.
+            size (:obj:`int`): Number of items per page.
+            read_ahead (`bool`): If `True`, requests the next page while the current \
+                page is consumed.
+            workers (`int`): Number of pages requested concurrently.
+            max_buffered_pages (`int`): Maximum number of pages requested ahead of the \
+                page being consumed. Default: twice the number of workers.
+
+        Yields:
+            :obj:`pyil2.models.record.RecordModel`: Records in a chain.
+        """
+        return self._iter_pages(
+            lambda page: self.list_records(
+                chain_id=chain_id,
+                first_serial=first_serial,
+                last_serial=last_serial,
+                last_to_first=last_to_first,
+                ommit_payload=ommit_payload,
+                page=page,
+                size=size,
+            ),
+            read_ahead=read_ahead,
+            workers=workers,
+            max_buffered_pages=max_buffered_pages,
+        )
+
+    def export_chain(
+            self,
+            chain_id: str,
+            filepath: str,
+            output_format: str = 'jsonl',
+            first_serial: int = 0,
+            last_serial: int = None,
+            ommit_payload: bool = False,
+            range_size: int = 10000,
+            page_size: int = 100,
+            workers: int = 4,
+            use_processes: bool = False,
+        ) -> int | ErrorDetailsModel:
+        """
+        Export the records of a chain to a file.
+
+        The serial numbers are split in ranges of `range_size` records that are requested \
+            in parallel. The ranges are written in order as soon as they are received, and \
+            at most twice the number of `workers` ranges are kept in memory.
+
+        The output formats are:
+
+        * `jsonl`: JSON Lines with one record per line;
+        * `columnar`: JSON Lines with one object per range, mapping each field name to \
+            the list of values of the records in the range.
+
+        Args:
+            chain_id (`str`): Chain ID.
+            filepath (`str`): Path of the output file.
+            output_format (`str`): Output format (`jsonl` or `columnar`).
+            first_serial (`int`): Serial number of first record to export.
+            last_serial (`int`): Serial number of last record to export. \
+                Default: Last record in the chain summary.
+            ommit_payload (`bool`): If `True`, ommits the payload of the records.
+            range_size (`int`): Number of records in each range.
+            page_size (`int`): Number of records per request.
+            workers (`int`): Number of ranges requested in parallel.
+            use_processes (`bool`): If `True`, the ranges are requested by worker processes, \
+                each one with its own client. Otherwise, threads sharing this client are used.
+
+        Returns:
+            :obj:`int`: Number of exported records.
+        """
+        if output_format not in self._export_formats:
+            raise ValueError(
+                f'Invalid output format {output_format}. Must be in {self._export_formats}'
+            )
+        if workers < 1:
+            raise ValueError('The number of workers must be at least 1.')
+        if last_serial is None:
+            summary = self._client.api('chain').summary(chain_id)
+            if isinstance(summary, ErrorDetailsModel):
+                return summary
+            last_serial = summary.last_record
+        ranges = (
+            LimitedRange(start, end=min(start + range_size - 1, last_serial))
+            for start in range(first_serial, last_serial + 1, range_size)
+        )
+
+        if use_processes:
+            client_kwargs = {
+                'host': self._client.host,
+                'cert_filepath': self._client._cert_filepath,
+                'cert_password': self._client._cert_password,
+                'verify_ca': self._client.verify_ca,
+                'timeout': self._client.timeout,
+            }
+            executor = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_export_process,
+                initargs=(type(self._client), client_kwargs),
+            )
+            task = _export_range_in_process
+        else:
+            executor = ThreadPoolExecutor(max_workers=workers)
+            task = partial(_export_range, self)
+
+        count = 0
+        pending = deque()
+        try:
+            with open(filepath, 'w', encoding='utf-8') as f:
+                for serials in ranges:
+                    pending.append(
+                        executor.submit(task, chain_id, serials, ommit_payload, page_size)
+                    )
+                    is_last_range = serials.end >= last_serial
+                    while pending and (is_last_range or len(pending) >= 2 * workers):
+                        records = pending.popleft().result()
+                        if isinstance(records, ErrorDetailsModel):
+                            return records
+                        count += self._write_export(f, records, output_format)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        return count
+
+    @staticmethod
+    def _write_export(f, records: List[Dict[str, Any]], output_format: str) -> int:
+        if output_format == 'jsonl':
+            for record in records:
+                f.write(json.dumps(record) + '\n')
+        elif records:
+            columns = {key: [record.get(key) for record in records] for key in records[0]}
+            f.write(json.dumps(columns) + '\n')
+        return len(records)
+
     def add_record(
             self,
             chain_id: str,
@@ -124,6 +336,34 @@ class RecordApi(BaseApi):
             return resp
         return record_models.RecordModel(**resp.json())
 
+    def add_records_batch(
+            self,
+            chain_id: str,
+            new_records: Iterable[record_models.NewRecordModel],
+            max_in_flight: int = 8,
+        ) -> List[record_models.RecordModel | ErrorDetailsModel | Exception]:
+        """
+        Add many records using raw bytes keeping up to `max_in_flight` requests in flight.
+
+        The records may be added to the chain in a different order from `new_records`.
+
+        Args:
+            chain_id (`str`): Chain ID.
+            new_records ([:obj:`pyil2.models.record.NewRecordModel`]): \
+                Models with the description of the new records.
+            max_in_flight (`int`): Maximum number of concurrent requests.
+
+        Returns:
+            [:obj:`pyil2.models.record.RecordModel`]: Added record models \
+                (or :obj:`pyil2.models.errors.ErrorDetailsModel`, or the exception raised \
+                by the request) in the order of `new_records`.
+        """
+        return self._run_batch(
+            lambda new_record, _: self.add_record(chain_id, new_record),
+            new_records,
+            max_in_flight,
+        )
+
     def get_record_at(
             self,
             chain_id: str,
@@ -139,13 +379,16 @@ class RecordApi(BaseApi):
         Returns:
             :obj:`pyil2.models.record.RecordModel`: Record in a chain.
         """
-        resp = self._client.request(
-            url=f'{self.base_url}{chain_id}/{serial}',
-            method='get',
+        return self._get_cached_record(
+            'record',
+            chain_id,
+            serial,
+            fetch=lambda: self._client.request(
+                url=f'{self.base_url}{chain_id}/{serial}',
+                method='get',
+            ),
+            build=lambda content, headers: record_models.RecordModel.model_validate_json(content),
         )
-        if isinstance(resp, ErrorDetailsModel):
-            return resp
-        return record_models.RecordModel(**resp.json())
 
     def query_records(
             self,
@@ -192,6 +435,59 @@ class RecordApi(BaseApi):
             return resp
         return ListModel[record_models.RecordModel](**resp.json())
 
+    def iter_query(
+            self,
+            chain_id: str,
+            query: str,
+            how_many: int = None,
+            last_to_first: bool = False,
+            ommit_payload: bool = False,
+            size: int = 100,
+            read_ahead: bool = False,
+            workers: int = 1,
+            max_buffered_pages: int = None,
+        ) -> Iterator[record_models.RecordModel | ErrorDetailsModel]:
+        """
+        Iterate over the records of an InterlockQL query, requesting the pages \
+            as they are needed.
+
+        The records are always yielded in order. With `workers` greater than 1, the pages \
+            are requested in parallel and at most `max_buffered_pages` pages are kept in \
+            memory ahead of the page being consumed.
+        If a request fails, the :obj:`pyil2.models.errors.ErrorDetailsModel` is yielded \
+            and the iteration stops.
+
+        Args:
+            chain_id (`str`): Chain ID.
+            query (`str`): Query in the InterlockQL language.
+            how_many (`int`): How many records to return. If ommited or 0 returns all.
+            last_to_first (`bool`): If `True`, return the items in reverse order.
+            ommit_payload (`bool`): If `True`, ommits the payload in the response.
+            size (:obj:`int`): Number of items per page.
+            read_ahead (`bool`): If `True`, requests the next page while the current \
+                page is consumed.
+            workers (`int`): Number of pages requested concurrently.
+            max_buffered_pages (`int`): Maximum number of pages requested ahead of the \
+                page being consumed. Default: twice the number of workers.
+
+        Yields:
+            :obj:`pyil2.models.record.RecordModel`: Records in a chain.
+        """
+        return self._iter_pages(
+            lambda page: self.query_records(
+                chain_id=chain_id,
+                query=query,
+                how_many=how_many,
+                last_to_first=last_to_first,
+                ommit_payload=ommit_payload,
+                page=page,
+                size=size,
+            ),
+            read_ahead=read_ahead,
+            workers=workers,
+            max_buffered_pages=max_buffered_pages,
+        )
+
     def list_records_as_json(
             self,
             chain_id: str,
@@ -237,6 +533,58 @@ class RecordApi(BaseApi):
             return resp
         return ListModel[record_models.RecordAsJsonModel](**resp.json())
 
+    def iter_records_as_json(
+            self,
+            chain_id: str,
+            first_serial: int = None,
+            last_serial: int = None,
+            last_to_first: bool = False,
+            size: int = 100,
+            read_ahead: bool = False,
+            workers: int = 1,
+            max_buffered_pages: int = None,
+        ) -> Iterator[record_models.RecordAsJsonModel | ErrorDetailsModel]:
+        """
+        Iterate over the records in a chain with the payload mapped to a JSON format, \
+            requesting the pages as they are needed.
+
+        The records are always yielded in order. With `workers` greater than 1, the pages \
+            are requested in parallel and at most `max_buffered_pages` pages are kept in \
+            memory ahead of the page being consumed.
+        If a request fails, the :obj:`pyil2.models.errors.ErrorDetailsModel` is yielded \
+            and the iteration stops.
+
+        Args:
+            chain_id (`str`): Chain ID.
+            first_serial (`int`): Serial number of first record to read. \
+                Default: First in whole chain.
+            last_serial (`int`): Serial number of last record to read. Default: Last in whole chain.
+            last_to_first (`bool`): If `True`, return the items in reverse order.
+            size (:obj:`int`): Number of items per page.
+            read_ahead (`bool`): If `True`, requests the next page while the current \
+                page is consumed.
+            workers (`int`): Number of pages requested concurrently.
+            max_buffered_pages (`int`): Maximum number of pages requested ahead of the \
+                page being consumed. Default: twice the number of workers.
+
+        Yields:
+            :obj:`pyil2.models.record.RecordAsJsonModel`: Records in a chain with \
+                the payload as JSON.
+        """
+        return self._iter_pages(
+            lambda page: self.list_records_as_json(
+                chain_id=chain_id,
+                first_serial=first_serial,
+                last_serial=last_serial,
+                last_to_first=last_to_first,
+                page=page,
+                size=size,
+            ),
+            read_ahead=read_ahead,
+            workers=workers,
+            max_buffered_pages=max_buffered_pages,
+        )
+
     def get_record_at_as_json(
             self,
             chain_id: str,
@@ -253,13 +601,17 @@ class RecordApi(BaseApi):
             :obj:`pyil2.models.record.RecordAsJsonModel`: \
                 Record in a chain with the payload as JSON.
         """
-        resp = self._client.request(
-            url=f'{self.base_url}{chain_id}/asJson/{serial}',
-            method='get',
+        return self._get_cached_record(
+            'record_json',
+            chain_id,
+            serial,
+            fetch=lambda: self._client.request(
+                url=f'{self.base_url}{chain_id}/asJson/{serial}',
+                method='get',
+            ),
+            build=lambda content, headers: \
+                record_models.RecordAsJsonModel.model_validate_json(content),
         )
-        if isinstance(resp, ErrorDetailsModel):
-            return resp
-        return record_models.RecordAsJsonModel(**resp.json())
 
     def query_records_as_json(
             self,
@@ -303,3 +655,54 @@ class RecordApi(BaseApi):
         if isinstance(resp, ErrorDetailsModel):
             return resp
         return ListModel[record_models.RecordAsJsonModel](**resp.json())
+
+    def iter_query_as_json(
+            self,
+            chain_id: str,
+            query: str,
+            how_many: int = None,
+            last_to_first: bool = False,
+            size: int = 100,
+            read_ahead: bool = False,
+            workers: int = 1,
+            max_buffered_pages: int = None,
+        ) -> Iterator[record_models.RecordAsJsonModel | ErrorDetailsModel]:
+        """
+        Iterate over the records with the payload as JSON of an InterlockQL query, \
+            requesting the pages as they are needed.
+
+        The records are always yielded in order. With `workers` greater than 1, the pages \
+            are requested in parallel and at most `max_buffered_pages` pages are kept in \
+            memory ahead of the page being consumed.
+        If a request fails, the :obj:`pyil2.models.errors.ErrorDetailsModel` is yielded \
+            and the iteration stops.
+
+        Args:
+            chain_id (`str`): Chain ID.
+            query (`str`): Query in the InterlockQL language.
+            how_many (`int`): How many records to return. If ommited or 0 returns all.
+            last_to_first (`bool`): If `True`, return the items in reverse order.
+            size (:obj:`int`): Number of items per page.
+            read_ahead (`bool`): If `True`, requests the next page while the current \
+                page is consumed.
+            workers (`int`): Number of pages requested concurrently.
+            max_buffered_pages (`int`): Maximum number of pages requested ahead of the \
+                page being consumed. Default: twice the number of workers.
+
+        Yields:
+            :obj:`pyil2.models.record.RecordAsJsonModel`: Records in a chain with \
+                the payload as JSON.
+        """
+        return self._iter_pages(
+            lambda page: self.query_records_as_json(
+                chain_id=chain_id,
+                query=query,
+                how_many=how_many,
+                last_to_first=last_to_first,
+                page=page,
+                size=size,
+            ),
+            read_ahead=read_ahead,
+            workers=workers,
+            max_buffered_pages=max_buffered_pages,
+        )
@@ -25,38 +25,39 @@
 # CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
-import contextlib
+import json
 import urllib.parse
 import os
-import re
-import shutil
-import tempfile
-from typing import Any, Dict, List
+import ssl
+import threading
+from typing import Any, Callable, Dict, Iterable, List
 import requests
-from .utils.certificates import PKCS12Certificate
+from .utils.cache import RecordCache, certificate_cache
 from . import api
+from .transports import (
+    BaseTransport,
+    HttpxTransport,
+    RequestsTransport,
+    TransportResponse,
+)
+from .utils.stream import DownloadStream
 from .models.errors import ErrorDetailsModel
 
 
-class IL2Client:
+class BaseIL2Client:
     """
-    REST API client to the InterlockLedger node.
+    Base class of the REST API clients to the InterlockLedger node.
 
-    You'll try to establish a bi-authenticated https connection with the
-    configured node API address and port. The client-side certificate used
-    to connect needs to be configured with the proper layered authorization
-    role in the node configuration file and imported into a key permitted to
-    update the chain that will be used.
+    It holds the node address and the client certificate used in the
+    mutual TLS authentication, which are shared by the blocking and the
+    asynchronous clients.
 
     Args:
         host (`str`): Host address in the format: scheme://hostmane[:port][/].
-        cert_filepath (:obj:`str`): Path to the .pfx certificate. \
-            Please refer to the InterlockLedger manual to see how to create \
-            and import the certificate into the node.
+        cert_filepath (:obj:`str`): Path to the .pfx certificate.
         cert_password (:obj:`str`): Password of the .pfx certificate.
         verify_ca (`bool`): If `True`, verifies the SSL certificate in a CA (default: True).
-        connect_timeout (:obj:`int`): Connect timeout in seconds (default: 5s).
-        read_timeout (:obj:`int`): Read timeout in seconds (default 30s).
+        timeout (:obj:`int`): Request timeout in seconds (default 30s).
     """
 
     _available_apis = [
@@ -82,8 +83,10 @@ class IL2Client:
         self.verify_ca = verify_ca
         self.timeout = timeout
         self._session = None
-        self._pem_file = None
-        self.certificate = PKCS12Certificate(cert_filepath, cert_password)
+        self._lock = threading.RLock()
+        self._cert_filepath = cert_filepath
+        self._cert_password = cert_password
+        self.certificate = certificate_cache.get_certificate(cert_filepath, cert_password)
 
     @property
     def public_certificate_in_x509(self):
@@ -103,6 +106,169 @@ class IL2Client:
         """
         return self._available_apis
 
+    def _get_ssl_context(
+            self,
+            cafile: str = None,
+            alpn_protocols: Iterable[str] = ('http/1.1',),
+        ) -> ssl.SSLContext:
+        return certificate_cache.get_ssl_context(
+            self._cert_filepath,
+            self._cert_password,
+            verify_ca=self.verify_ca,
+            cafile=cafile,
+            alpn_protocols=alpn_protocols,
+        )
+
+    def _join_uri(self, url: str):
+        return urllib.parse.urljoin(self.host, url)
+
+    def _prepare_headers(self, accept: str, content_type: str=None, headers: Dict[str, str]=None):
+        if not headers:
+            headers = {}
+        headers['Accept'] = accept
+        if content_type:
+            headers['Content-type'] = content_type
+        return headers
+
+    def _handle_error_response(self, response: Any) -> Any:
+        try:
+            if 400 <= response.status_code and response.status_code <= 599:
+                return ErrorDetailsModel(**response.json())
+        except Exception as exc:
+            raise exc
+        return response
+
+
+class IL2Client(BaseIL2Client):
+    """
+    REST API client to the InterlockLedger node.
+
+    You'll try to establish a bi-authenticated https connection with the
+    configured node API address and port. The client-side certificate used
+    to connect needs to be configured with the proper layered authorization
+    role in the node configuration file and imported into a key permitted to
+    update the chain that will be used.
+
+    Args:
+        host (`str`): Host address in the format: scheme://hostmane[:port][/].
+        cert_filepath (:obj:`str`): Path to the .pfx certificate. \
+            Please refer to the InterlockLedger manual to see how to create \
+            and import the certificate into the node.
+        cert_password (:obj:`str`): Password of the .pfx certificate.
+        verify_ca (`bool`): If `True`, verifies the SSL certificate in a CA (default: True).
+        connect_timeout (:obj:`int`): Connect timeout in seconds (default: 5s).
+        read_timeout (:obj:`int`): Read timeout in seconds (default 30s).
+        pool_connections (:obj:`int`): Number of connection pools to cache (default: 10).
+        pool_maxsize (:obj:`int`): Maximum number of connections kept open to \
+            the node (default: 10). Increase it when the client is shared by many threads.
+        pool_block (`bool`): If `True`, a request waits for a free connection when \
+            `pool_maxsize` connections are in use, instead of opening a connection \
+            that will not be reused (default: False).
+        keep_alive (`bool`): If `True`, keeps the connections open to be reused by the \
+            next requests, avoiding new TLS handshakes (default: True).
+        session_mode (:obj:`str`): How the HTTP sessions are shared between threads \
+            (default: 'shared'):
+
+            - 'shared': a single session, and its connection pool, is used by every thread.
+            - 'per_thread': each thread uses its own session, created on its first request.
+
+            In both modes the client can be safely shared by many threads, and the \
+            certificate is loaded only once.
+        transport (:obj:`str`/:obj:`pyil2.transports.BaseTransport`): Transport used \
+            to send the requests (default: 'requests'):
+
+            - 'requests': a :obj:`pyil2.transports.RequestsTransport` configured with the \
+              pool, keep-alive and session mode parameters.
+            - 'httpx': a :obj:`pyil2.transports.HttpxTransport` using HTTP/2 and up to \
+              `pool_maxsize` connections.
+            - an instance of :obj:`pyil2.transports.BaseTransport`, such as a \
+              :obj:`pyil2.transports.FakeTransport`. In this case the pool, keep-alive \
+              and session mode parameters are ignored.
+        record_cache (:obj:`pyil2.utils.cache.RecordCache`): If defined, the records \
+            read by serial number are stored in this cache and the next reads of the same \
+            records are served from it (default: None).
+    """
+
+    _transports = [
+        'requests',
+        'httpx',
+    ]
+
+    def __init__(
+            self,
+            host: str,
+            cert_filepath: str,
+            cert_password: str,
+            verify_ca: bool = True,
+            timeout: int = 30,
+            pool_connections: int = 10,
+            pool_maxsize: int = 10,
+            pool_block: bool = False,
+            keep_alive: bool = True,
+            session_mode: str = 'shared',
+            transport: str | BaseTransport = 'requests',
+            record_cache: RecordCache = None,
+        ):
+        if isinstance(transport, BaseTransport):
+            self.transport = transport
+        elif transport == 'requests':
+            self.transport = RequestsTransport(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                pool_block=pool_block,
+                keep_alive=keep_alive,
+                session_mode=session_mode,
+            )
+        elif transport == 'httpx':
+            self.transport = HttpxTransport(
+                http2=True,
+                max_connections=pool_maxsize,
+                keep_alive=keep_alive,
+            )
+        else:
+            raise ValueError(
+                f'Invalid transport {transport}. Must be in {self._transports}'
+            )
+        super().__init__(
+            host=host,
+            cert_filepath=cert_filepath,
+            cert_password=cert_password,
+            verify_ca=verify_ca,
+            timeout=timeout,
+        )
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.session_mode = session_mode
+        self.transport.bind(self)
+        self.record_cache = record_cache
+        self._network = None
+
+    @property
+    def network(self) -> str | None:
+        """
+        :obj:`str`: Name of the network of the node (`None` if the node details \
+            could not be read). The name is requested only once.
+        """
+        if self._network is None:
+            details = self.api('node').details
+            if isinstance(details, ErrorDetailsModel):
+                return None
+            with self._lock:
+                self._network = details.network
+        return self._network
+
+    @property
+    def connection_stats(self) -> Dict[str, int]:
+        """
+        {:obj:`str`: :obj:`int`}: Number of opened connections (`new_connections`), \
+            opened connections that resumed a TLS session (`resumed_connections`), \
+            sent requests (`requests`) and requests that reused an already opened \
+            connection (`reused_connections`).
+        """
+        return self.transport.connection_stats
+
     def api(self, name: str) -> api.NodeApi | api.ChainApi | \
                                 api.RecordApi | api.OpaqueApi | \
                                 api.JsonApi | api.DocumentsApi:
@@ -134,46 +300,15 @@ class IL2Client:
                     f'No API with name {name} found. Must be in {self._available_apis}'
                 )
 
-    def _get_session(self) -> requests.Session:
-        if not self._session:
-            self._pfx_to_pem()
-            self._session = requests.Session()
-            self._session.cert = self._pem_file.name
-            self._session.verify = self.verify_ca
-        return self._session
-
-    @contextlib.contextmanager
-    def _pfx_to_pem(self) -> None:
-        self._pem_file = tempfile.NamedTemporaryFile(suffix='.pem')
-        f_pem = open(self._pem_file.name, 'wb')
-        f_pem.write(self.certificate.private_key)
-        f_pem.write(self.certificate.public_certificate)
-        f_pem.close()
+    def close(self) -> None:
+        """
+        Close the connections of every session used by the client.
+        """
+        self.transport.close()
 
     def __del__(self):
-        if self._pem_file:
-            self._pem_file.close()
-        if self._session:
-            self._session.close()
-
-    def _join_uri(self, url: str):
-        return urllib.parse.urljoin(self.host, url)
-
-    def _prepare_headers(self, accept: str, content_type: str=None, headers: Dict[str, str]=None):
-        if not headers:
-            headers = {}
-        headers['Accept'] = accept
-        if content_type:
-            headers['Content-type'] = content_type
-        return headers
-
-    def _handle_error_response(self, response: requests.Response) -> requests.Response:
-        try:
-            if 400 <= response.status_code and response.status_code <= 599:
-                return ErrorDetailsModel(**response.json())
-        except Exception as exc:
-            raise exc
-        return response
+        if getattr(self, 'transport', None):
+            self.close()
 
     def request(
             self,
@@ -185,7 +320,7 @@ class IL2Client:
             params: Dict[str, str]=None,
             data: bytes=None,
             headers: Dict[str, str]=None,
-        ) -> requests.Response:
+        ) -> requests.Response | TransportResponse:
         '''
         This method is used to wrap IL2 requests.
         We do not recommend using this method directly.
@@ -250,10 +385,11 @@ class IL2Client:
             accept: str,
             params: Dict[str, str],
             headers: Dict[str, str]=None
-        ) -> requests.Response:
+        ) -> requests.Response | TransportResponse:
         cur_uri = self._join_uri(url)
         headers = self._prepare_headers(accept, headers=headers)
-        response = self._get_session().get(
+        response = self.transport.request(
+            'GET',
             cur_uri,
             headers=headers,
             params=params,
@@ -267,10 +403,11 @@ class IL2Client:
             accept: str,
             params: Dict[str, str],
             headers: Dict[str, str]=None
-        ) -> requests.Response:
+        ) -> requests.Response | TransportResponse:
         cur_uri = self._join_uri(url)
         headers = self._prepare_headers(accept, headers=headers)
-        response = self._get_session().delete(
+        response = self.transport.request(
+            'DELETE',
             cur_uri,
             headers=headers,
             params=params,
@@ -285,12 +422,13 @@ class IL2Client:
             content_type: str,
             body: Dict[str, Any],
             headers: Dict[str, str]=None
-        ) -> requests.Response:
+        ) -> requests.Response | TransportResponse:
         cur_uri = self._join_uri(url)
         headers = self._prepare_headers(
             accept, content_type, headers=headers)
-        response = self._get_session().patch(
-            url=cur_uri,
+        response = self.transport.request(
+            'PATCH',
+            cur_uri,
             headers=headers,
             json=body,
             timeout=self.timeout,
@@ -304,12 +442,13 @@ class IL2Client:
             content_type: str,
             body: Dict[str, Any],
             headers: Dict[str, str]=None
-        ) -> requests.Response:
+        ) -> requests.Response | TransportResponse:
         cur_uri = self._join_uri(url)
         headers = self._prepare_headers(
             accept, content_type, headers=headers)
-        response = self._get_session().put(
-            url=cur_uri,
+        response = self.transport.request(
+            'PUT',
+            cur_uri,
             headers=headers,
             json=body,
             timeout=self.timeout,
@@ -324,12 +463,13 @@ class IL2Client:
             body: Dict[str, Any],
             params: Dict[str, str]=None,
             headers: Dict[str, str]=None
-        ) -> requests.Response:
+        ) -> requests.Response | TransportResponse:
         cur_uri = self._join_uri(url)
         headers = self._prepare_headers(
             accept, content_type, headers=headers)
-        response = self._get_session().post(
-            url=cur_uri,
+        response = self.transport.request(
+            'POST',
+            cur_uri,
             headers=headers,
             json=body,
             params=params,
@@ -345,12 +485,13 @@ class IL2Client:
             data: bytes,
             params: Dict[str, str]=None,
             headers: Dict[str, str]=None
-        ) -> requests.Response:
+        ) -> requests.Response | TransportResponse:
         cur_uri = self._join_uri(url)
         headers = self._prepare_headers(
             accept, content_type, headers=headers)
-        response = self._get_session().post(
-            url=cur_uri,
+        response = self.transport.request(
+            'POST',
+            cur_uri,
             headers=headers,
             data=data,
             params=params,
@@ -358,41 +499,153 @@ class IL2Client:
         )
         return response
 
+    def download_stream(
+            self,
+            url: str,
+            params: Dict[str, str]=None,
+            offset: int = 0,
+            chunk_size: int = 1024 * 1024,
+            max_retries: int = 3,
+            progress: Callable[[int, int | None], None] = None,
+        ) -> DownloadStream | ErrorDetailsModel:
+        """
+        Method to download a file as an iterator of chunks that resumes interrupted downloads.
+
+        We do not recommend using this method directly.
+        """
+        cur_uri = self._join_uri(url)
+
+        def open_response(headers: Dict[str, str] = None) -> requests.Response | TransportResponse:
+            return self.transport.request(
+                'GET',
+                cur_uri,
+                headers=headers,
+                params=params,
+                stream=True,
+                timeout=self.timeout,
+            )
+
+        resp = open_response({'Range': f'bytes={offset}-'} if offset else None)
+        err = self._handle_error_response(resp)
+        if isinstance(err, ErrorDetailsModel):
+            resp.close()
+            return err
+        return DownloadStream(
+            open_response,
+            resp,
+            offset=offset,
+            chunk_size=chunk_size,
+            max_retries=max_retries,
+            progress=progress,
+        )
+
     def download_file(
             self,
             url: str,
             dst_path: str = './',
             params: Dict[str, str]=None,
+            chunk_size: int = 1024 * 1024,
+            max_retries: int = 3,
+            resume: bool = True,
+            progress: Callable[[int, int | None], None] = None,
+            filename: str = None,
         ) -> str:
         """
         Method to download a file to a destination path.
 
+        The file is saved with `filename` or, if it is `None`, with the name sent by the node.
+
+        The file is written to a '.part' file that is renamed when the download is complete. \
+            The size and the ETag of the file are saved in a '.part.json' file. \
+            If `resume` is `True` and a '.part' file of the same remote file (same size \
+            and ETag) already exists, the download continues from its end. Otherwise \
+            the download starts from the beginning.
+
         We do not recommend using this method directly.
         """
-        cur_uri = self._join_uri(url)
-        s = self._get_session()
-        with s.get(cur_uri, stream=True, timeout=self.timeout, params=params) as r:
-            err = self._handle_error_response(r)
-            if isinstance(err, ErrorDetailsModel):
-                return err
-            d = r.headers['content-disposition']
-            filename = re.findall("filename=(.+);", d)[0]
-            filepath = os.path.expanduser(os.path.join(dst_path, filename))
-            with open(filepath, 'wb') as f:
-                shutil.copyfileobj(r.raw, f)
+        stream = self.download_stream(
+            url,
+            params=params,
+            chunk_size=chunk_size,
+            max_retries=max_retries,
+            progress=progress,
+        )
+        if isinstance(stream, ErrorDetailsModel):
+            return stream
+        filename = filename or stream.filename or \
+            os.path.basename(urllib.parse.urlparse(url).path)
+        filepath = os.path.expanduser(os.path.join(dst_path, filename))
+        part_filepath = filepath + '.part'
+        info_filepath = part_filepath + '.json'
+        info = {'size': stream.size, 'etag': stream.etag}
+        offset = 0
+        if resume and stream.size is not None and self._part_info(info_filepath) == info \
+                and os.path.isfile(part_filepath):
+            offset = os.path.getsize(part_filepath)
+        if 0 < offset <= stream.size:
+            stream.close()
+            if offset == stream.size:
+                os.replace(part_filepath, filepath)
+                os.remove(info_filepath)
+                return filepath
+            stream = self.download_stream(
+                url,
+                params=params,
+                offset=offset,
+                chunk_size=chunk_size,
+                max_retries=max_retries,
+                progress=progress,
+            )
+            if isinstance(stream, ErrorDetailsModel):
+                return stream
+            if stream.etag != info['etag']:
+                # The file changed after the first request.
+                stream.close()
+                return self.download_file(
+                    url,
+                    dst_path=dst_path,
+                    params=params,
+                    chunk_size=chunk_size,
+                    max_retries=max_retries,
+                    resume=False,
+                    progress=progress,
+                    filename=filename,
+                )
+        else:
+            offset = 0
+            with open(info_filepath, 'w', encoding='utf-8') as f:
+                json.dump(info, f)
+        with stream, open(part_filepath, 'ab' if offset else 'wb') as f:
+            for chunk in stream:
+                f.write(chunk)
+        os.replace(part_filepath, filepath)
+        os.remove(info_filepath)
         return filepath
 
+    @staticmethod
+    def _part_info(info_filepath: str) -> Dict[str, Any] | None:
+        try:
+            with open(info_filepath, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
     def download_response(
             self,
             url: str,
             params: Dict[str, str]=None,
-        ) -> requests.Response:
+        ) -> requests.Response | TransportResponse:
         """
         Method to retrieve an stream GET response directly.
 
         We do not recommend using this method directly.
         """
         cur_uri = self._join_uri(url)
-        s = self._get_session()
-        resp = s.get(cur_uri, stream=True, timeout=self.timeout, params=params)
+        resp = self.transport.request(
+            'GET',
+            cur_uri,
+            params=params,
+            stream=True,
+            timeout=self.timeout,
+        )
         return self._handle_error_response(resp)
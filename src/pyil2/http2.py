@@ -0,0 +1,202 @@
+# Copyright (c) 2024, InterlockLedger Network
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+import ssl
+try:
+    import h2.connection
+    import h2.settings
+    import httpcore
+    import httpx
+except ImportError as e:
+    raise ImportError(
+        'The HTTP/2 support requires the httpx[http2] package: pip install pyil2[http2]'
+    ) from e
+
+_DEFAULT_WINDOW_SIZE = 65535
+_MAX_WINDOW_SIZE = 2 ** 31 - 1
+
+
+class HTTP2Settings:
+    """
+    Settings of the HTTP/2 connections opened by the :obj:`IL2HTTP2Transport`.
+
+    Args:
+        max_concurrent_streams (:obj:`int`): Maximum number of requests in flight \
+            in each connection. The node may allow fewer streams (default: 100).
+        stream_window_size (:obj:`int`): Flow-control window of each stream, in bytes. \
+            It is how much of a response the node can send before the client reads it \
+            (default: 16 MiB).
+        connection_window_size (:obj:`int`): Flow-control window of the whole connection, \
+            in bytes, shared by all the streams (default: 16 MiB).
+
+    Raises:
+        ValueError: If a setting is out of the range allowed by HTTP/2.
+    """
+
+    def __init__(
+            self,
+            max_concurrent_streams: int = 100,
+            stream_window_size: int = 16 * 1024 * 1024,
+            connection_window_size: int = 16 * 1024 * 1024,
+        ) -> None:
+        if max_concurrent_streams < 1:
+            raise ValueError('The maximum number of concurrent streams must be at least 1.')
+        for name, value in (
+                ('stream', stream_window_size),
+                ('connection', connection_window_size)):
+            if not _DEFAULT_WINDOW_SIZE <= value <= _MAX_WINDOW_SIZE:
+                raise ValueError(
+                    f'The {name} window size must be between '
+                    f'{_DEFAULT_WINDOW_SIZE} and {_MAX_WINDOW_SIZE} bytes.'
+                )
+        self.max_concurrent_streams = max_concurrent_streams
+        self.stream_window_size = stream_window_size
+        self.connection_window_size = connection_window_size
+
+
+class _H2State(h2.connection.H2Connection):
+    def __init__(self, settings: HTTP2Settings, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._il2_settings = settings
+
+    def initiate_connection(self):
+        # Set directly, as httpcore does, so no extra SETTINGS frame is sent.
+        self.local_settings = h2.settings.Settings(
+            client=True,
+            initial_values={
+                h2.settings.SettingCodes.ENABLE_PUSH: 0,
+                h2.settings.SettingCodes.MAX_CONCURRENT_STREAMS:
+                    self._il2_settings.max_concurrent_streams,
+                h2.settings.SettingCodes.MAX_HEADER_LIST_SIZE: 65536,
+                h2.settings.SettingCodes.INITIAL_WINDOW_SIZE:
+                    self._il2_settings.stream_window_size,
+            },
+        )
+        del self.local_settings[h2.settings.SettingCodes.ENABLE_CONNECT_PROTOCOL]
+        super().initiate_connection()
+
+    def increment_flow_control_window(self, increment, stream_id=None):
+        # httpcore opens every window by 16 MiB. The stream windows already start
+        # with the configured size and the connection window is opened only once.
+        if stream_id is not None:
+            return
+        increment = self._il2_settings.connection_window_size - \
+            self.inbound_flow_control_window
+        if increment > 0:
+            super().increment_flow_control_window(increment)
+
+
+class _HTTP2Connection(httpcore.HTTP2Connection):
+    def __init__(self, settings: HTTP2Settings, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._h2_state = _H2State(settings, config=self.CONFIG)
+
+
+class _HTTPConnection(httpcore.HTTPConnection):
+    def __init__(self, settings: HTTP2Settings, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._il2_settings = settings
+
+    def handle_request(self, request: httpcore.Request) -> httpcore.Response:
+        # Open the connection here to create it with the configured HTTP/2 settings,
+        # then let httpcore send the request.
+        try:
+            with self._request_lock:
+                if self._connection is None:
+                    stream = self._connect(request)
+                    ssl_object = stream.get_extra_info('ssl_object')
+                    if ssl_object is not None and ssl_object.selected_alpn_protocol() == 'h2':
+                        self._connection = _HTTP2Connection(
+                            self._il2_settings,
+                            origin=self._origin,
+                            stream=stream,
+                            keepalive_expiry=self._keepalive_expiry,
+                        )
+                    else:
+                        self._connection = httpcore.HTTP11Connection(
+                            origin=self._origin,
+                            stream=stream,
+                            keepalive_expiry=self._keepalive_expiry,
+                        )
+        except BaseException as exc:
+            self._connect_failed = True
+            raise exc
+        return super().handle_request(request)
+
+
+class _HTTP2ConnectionPool(httpcore.ConnectionPool):
+    def __init__(self, settings: HTTP2Settings, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._il2_settings = settings
+
+    def create_connection(self, origin: httpcore.Origin) -> httpcore.ConnectionInterface:
+        return _HTTPConnection(
+            self._il2_settings,
+            origin=origin,
+            ssl_context=self._ssl_context,
+            keepalive_expiry=self._keepalive_expiry,
+            http1=self._http1,
+            http2=self._http2,
+            retries=self._retries,
+            local_address=self._local_address,
+            uds=self._uds,
+            network_backend=self._network_backend,
+            socket_options=self._socket_options,
+        )
+
+
+class IL2HTTP2Transport(httpx.HTTPTransport):
+    """
+    httpx transport used by the :obj:`pyil2.transports.HttpxTransport` in HTTP/2 mode.
+
+    It works like the :obj:`httpx.HTTPTransport` with `http2=True`, but the HTTP/2 \
+        connections are opened with the given flow-control windows and maximum number \
+        of concurrent streams.
+
+    Args:
+        ssl_context (:obj:`ssl.SSLContext`): SSL context with the client certificate.
+        limits (:obj:`httpx.Limits`): Limits of the connection pool.
+        settings (:obj:`HTTP2Settings`): HTTP/2 settings (default: :obj:`HTTP2Settings()`).
+    """
+
+    def __init__(
+            self,
+            ssl_context: ssl.SSLContext,
+            limits: httpx.Limits,
+            settings: HTTP2Settings = None,
+        ) -> None:
+        super().__init__(verify=ssl_context, http2=True, limits=limits)
+        self.settings = settings if settings is not None else HTTP2Settings()
+        self._pool = _HTTP2ConnectionPool(
+            self.settings,
+            ssl_context=ssl_context,
+            max_connections=limits.max_connections,
+            max_keepalive_connections=limits.max_keepalive_connections,
+            keepalive_expiry=limits.keepalive_expiry,
+            http1=True,
+            http2=True,
+        )
@@ -35,6 +35,7 @@ from pydantic import (
     model_validator,
 )
 from .base import BaseCamelModel
+from .errors import ErrorDetailsModel
 from ..enum import DocumentsCompression
 
 
@@ -167,6 +168,17 @@ class DocumentTransactionModel(BaseDocumentTransactionModel):
     """
 
 
+class DocumentTransactionErrorModel(ErrorDetailsModel):
+    """
+    Error details of a document transaction that was left open.
+    """
+
+    transaction_id: str
+    """
+    ID of the open transaction. It is aborted by the node after its timeout.
+    """
+
+
 class EncryptionParameterModel(BaseCamelModel):
     """
     The parameters used to make the encryption of the set of documents.
@@ -245,3 +257,17 @@ class DocumentMetadataModel(BaseCamelModel):
     """
     List of stored documents.
     """
+
+
+class DownloadedDocumentModel(DirectoryEntryModel):
+    """
+    Manifest entry of a document downloaded to the local file system.
+    """
+    index: int
+    """
+    Position of the document in the set of documents.
+    """
+    filepath: str
+    """
+    Full path of the downloaded file.
+    """
@@ -29,19 +29,56 @@ from typing import (
     List,
     Dict,
     Any,
+    Callable,
+    Iterable,
+    Iterator,
     Optional,
+    Self,
+    Tuple,
 )
 
 import base64
-from json import loads as json_loads
-from pydantic import Field
-from pyilint import ilint_decode
+import os
+from collections import deque
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from functools import partial
+from json import (
+    dumps as json_dumps,
+    loads as json_loads,
+)
+from pydantic import (
+    Field,
+    PrivateAttr,
+)
+from pyilint import (
+    ilint_decode,
+    ilint_encode,
+)
+from cryptography.hazmat.primitives import (
+    ciphers,
+    hashes,
+    padding as sym_padding,
+)
+from cryptography.hazmat.primitives.asymmetric import padding
 
 from ..enum import CipherAlgorithms
 from .base import BaseCamelModel
 from .record import BaseRecordModel
-from ..utils.certificates import PKCS12Certificate
-from ..utils import aes_decrypt
+from ..utils.certificates import (
+    CertificateKeyring,
+    PKCS12Certificate,
+    il2_public_key_hash,
+    rsa_public_key_from_il2,
+)
+from ..utils.cache import ReadingKeyCache
+from ..utils import (
+    aes_decrypt_into,
+    urlsafe_b64decode_chunks,
+)
 
 
 class ReaderKeyModel(BaseCamelModel):
@@ -120,17 +157,7 @@ class ReadingKeyModel(BaseCamelModel):
         Raises:
             `ValueError`: If the certificate has no private key or are a Non-RSA certificate. 
         """
-        if not certificate.has_pk():
-            raise ValueError(
-                'Certificate has no private key to be able to decode EncryptedText.')
-        cert_key_id = certificate.key_id
-        cert_pub_key_hash = certificate.pub_key_hash
-        if not cert_pub_key_hash:
-            raise ValueError('Non-RSA certificate is not currently supported.')
-
-        if cert_key_id != self.reader_id or cert_pub_key_hash != self.public_key_hash:
-            return False
-        return True
+        return certificate.reader_index_key == (self.reader_id, self.public_key_hash)
 
 
 class EncryptedTextModel(BaseCamelModel):
@@ -150,13 +177,107 @@ class EncryptedTextModel(BaseCamelModel):
     """
     List of keys able to read this encrypted text.
     """
+    _reading_key_index: Optional[Dict[Tuple[str, str], ReadingKeyModel]] = PrivateAttr(
+        default=None)
+
+    @property
+    def reading_key_index(self) -> Dict[Tuple[str, str], ReadingKeyModel]:
+        """
+        {(:obj:`str`, :obj:`str`): :obj:`ReadingKeyModel`}: Reading keys indexed by \
+            reader id and public key hash. The index is built on the first use.
+        """
+        if self._reading_key_index is None:
+            index = {}
+            for rk in self.reading_keys:
+                index.setdefault((rk.reader_id, rk.public_key_hash), rk)
+            self._reading_key_index = index
+        return self._reading_key_index
+
+    @classmethod
+    def encrypt(
+            cls,
+            payload: Dict[str, Any],
+            readers: Iterable[Tuple[str, str]],
+            workers: int = 4,
+        ) -> Self:
+        """
+        Encrypts a JSON on the client side for a list of readers.
 
-    def decode(self, certificate: PKCS12Certificate) -> Dict[str, Any]:
+        The JSON is encrypted once with a random AES256 key, and the key and IV are \
+            encrypted with the RSA public key of each reader using `workers` threads.
+
+        Args:
+            payload (:obj:`dict`): A valid JSON in dictionary format.
+            readers ([(:obj:`str`, :obj:`str`)]): IL2 text representations of the public key \
+                and of the key ID of each reader.
+            workers (:obj:`int`): Maximum number of threads that encrypt the reading keys.
+
+        Returns:
+            :obj:`EncryptedTextModel`: Encrypted JSON.
+
+        Raises:
+            `ValueError`: If there are no readers or a public key is not an RSA public key \
+                in the IL2 text representation.
+        """
+        readers = list(readers)
+        if not readers:
+            raise ValueError('At least one reader is required to encrypt the JSON.')
+        if workers < 1:
+            raise ValueError('The number of workers must be at least 1.')
+        aes_key = os.urandom(32)
+        aes_iv = os.urandom(16)
+
+        json_bytes = json_dumps(payload).encode('utf-8')
+        plain = bytearray([17])
+        ilint_encode(len(json_bytes), plain)
+        plain += json_bytes
+        padder = sym_padding.PKCS7(128).padder()
+        cipher = ciphers.Cipher(ciphers.algorithms.AES(aes_key), ciphers.modes.CBC(aes_iv))
+        encryptor = cipher.encryptor()
+        cipher_text = encryptor.update(padder.update(plain) + padder.finalize()) + \
+            encryptor.finalize()
+
+        oaep = padding.OAEP(
+            mgf=padding.MGF1(algorithm=hashes.SHA1()),
+            algorithm=hashes.SHA1(),
+            label=None
+        )
+
+        def reading_key(reader: Tuple[str, str]) -> ReadingKeyModel:
+            public_key, public_key_id = reader
+            rsa_key = rsa_public_key_from_il2(public_key)
+            return ReadingKeyModel(
+                encrypted_key=base64.urlsafe_b64encode(rsa_key.encrypt(aes_key, oaep)).decode(),
+                encrypted_iv=base64.urlsafe_b64encode(rsa_key.encrypt(aes_iv, oaep)).decode(),
+                public_key_hash=il2_public_key_hash(public_key),
+                reader_id=public_key_id,
+            )
+
+        if workers == 1 or len(readers) == 1:
+            reading_keys = [reading_key(reader) for reader in readers]
+        else:
+            with ThreadPoolExecutor(max_workers=min(workers, len(readers))) as executor:
+                reading_keys = list(executor.map(reading_key, readers))
+        return cls(
+            cipher=CipherAlgorithms.AES256,
+            cipher_text=base64.urlsafe_b64encode(cipher_text).decode(),
+            reading_keys=reading_keys,
+        )
+
+    def decode(
+            self,
+            certificate: PKCS12Certificate | CertificateKeyring,
+            key_cache: ReadingKeyCache = None,
+        ) -> Dict[str, Any]:
         """
         Decodes the encrypted JSON text to a dictionary using a given certificate.
 
         Args:
-            certificate (:obj:`utils.certificate.PKCS12Certificate`): PKCS12 certificate.
+            certificate (:obj:`utils.certificate.PKCS12Certificate` | \
+                :obj:`utils.certificate.CertificateKeyring`): PKCS12 certificate, or a \
+                keyring with the certificates that may be able to read the text.
+            key_cache (:obj:`utils.cache.ReadingKeyCache`): If defined, the decrypted \
+                AES key and IV are stored in and reused from this cache.
 
         Returns:
             {:obj:`str`: Any}: Decoded JSON.
@@ -172,28 +293,37 @@ class EncryptedTextModel(BaseCamelModel):
             raise ValueError(
                 f'Cipher {self.cipher} is not currently supported.')
 
-        authorized_key = None
-        for rk in self.reading_keys:
-            if rk.check_certificate(certificate):
-                authorized_key = rk
-                break
+        if isinstance(certificate, CertificateKeyring):
+            match = certificate.find(self.reading_key_index)
+            certificate, authorized_key = match if match else (None, None)
+        else:
+            authorized_key = self.reading_key_index.get(certificate.reader_index_key)
         if not authorized_key:
             raise ValueError(
                 'Your key does not match one of the authorized reading keys.')
 
-        aes_key = certificate.decrypt(
-            base64.urlsafe_b64decode(authorized_key.encrypted_key))
-        aes_iv = certificate.decrypt(
-            base64.urlsafe_b64decode(authorized_key.encrypted_iv))
-
-        json_bytes = aes_decrypt(base64.urlsafe_b64decode(
-            self.cipher_text), aes_key, aes_iv)
-        if json_bytes[0] != 17:
-            raise ValueError(
-                'Something went wrong while decrypting the content. Unexpected initial bytes.')
-
-        dec, dec_size = ilint_decode(json_bytes[1:])
-        return json_loads(json_bytes[1+dec_size:1+dec_size+dec].decode('utf-8'))
+        if key_cache is not None:
+            aes_key, aes_iv = key_cache.get_keys(
+                certificate, authorized_key.encrypted_key, authorized_key.encrypted_iv)
+        else:
+            aes_key = certificate.decrypt(
+                base64.urlsafe_b64decode(authorized_key.encrypted_key))
+            aes_iv = certificate.decrypt(
+                base64.urlsafe_b64decode(authorized_key.encrypted_iv))
+
+        # The text is decrypted into a single buffer, and the JSON is decoded from a view
+        # of the buffer without the ILInt header, so no other copy of the content is made.
+        json_bytes = bytearray(len(self.cipher_text) * 3 // 4 + 16)
+        size = aes_decrypt_into(
+            urlsafe_b64decode_chunks(self.cipher_text), aes_key, aes_iv, json_bytes)
+        with memoryview(json_bytes) as view:
+            if size == 0 or view[0] != 17:
+                raise ValueError(
+                    'Something went wrong while decrypting the content. Unexpected initial bytes.')
+            dec, dec_size = ilint_decode(view[1:10])
+            json_text = str(view[1+dec_size:min(1+dec_size+dec, size)], 'utf-8')
+        del json_bytes
+        return json_loads(json_text)
 
 
 class JsonDocumentModel(BaseRecordModel):
@@ -209,3 +339,146 @@ class JsonDocumentModel(BaseRecordModel):
     """
     JSON document as string.
     """
+
+
+_process_certificate = None
+_process_key_cache = None
+
+
+def _init_decode_process(
+        exports: List[bytes],
+        is_keyring: bool,
+        key_cache_limits: Tuple[int, int] | None,
+    ) -> None:
+    global _process_certificate, _process_key_cache
+    certificates = [PKCS12Certificate._from_export(data) for data in exports]
+    _process_certificate = CertificateKeyring(certificates) if is_keyring else certificates[0]
+    _process_key_cache = ReadingKeyCache(*key_cache_limits) if key_cache_limits else None
+
+
+def _decode_in_process(encrypted_text: EncryptedTextModel) -> Dict[str, Any]:
+    return encrypted_text.decode(_process_certificate, key_cache=_process_key_cache)
+
+
+def _encrypted_text(document: JsonDocumentModel | EncryptedTextModel) -> EncryptedTextModel:
+    if isinstance(document, EncryptedTextModel):
+        return document
+    if document.encrypted_json is None:
+        raise ValueError(f'JSON document {document.reference} has no encrypted JSON.')
+    return document.encrypted_json
+
+
+def iter_decoded(
+        documents: Iterable[JsonDocumentModel | EncryptedTextModel],
+        certificate: PKCS12Certificate | CertificateKeyring,
+        workers: int = 4,
+        use_processes: bool = False,
+        max_buffered: int = None,
+        key_cache: ReadingKeyCache = None,
+    ) -> Iterator[Dict[str, Any]]:
+    """
+    Decode many encrypted JSON documents in parallel, returning the decoded JSONs \
+        in the same order of the documents.
+
+    The documents are read from `documents` as the decoded JSONs are consumed, so at most \
+        `max_buffered` documents are being decoded or waiting to be consumed at a time.
+
+    Args:
+        documents ([:obj:`JsonDocumentModel` | :obj:`EncryptedTextModel`]): JSON documents \
+            or encrypted texts to decode.
+        certificate (:obj:`utils.certificate.PKCS12Certificate` | \
+            :obj:`utils.certificate.CertificateKeyring`): PKCS12 certificate, or a \
+            keyring with the certificates that may be able to read the documents.
+        workers (:obj:`int`): Number of threads (or processes) that decode the documents.
+        use_processes (:obj:`bool`): If `True`, decodes the documents in a pool of \
+            processes instead of threads. The certificate, including its private key, \
+            is sent unencrypted to each process as a PKCS12 export. Use threads if the \
+            private keys must not leave this process.
+        max_buffered (:obj:`int`): Maximum number of documents in progress \
+            (default: 2 * `workers`).
+        key_cache (:obj:`utils.cache.ReadingKeyCache`): If defined, the decrypted reading \
+            keys are cached. When `use_processes` is `True`, each process uses its own \
+            cache with the same limits.
+
+    Returns:
+        [{:obj:`str`: Any}]: Iterator over the decoded JSONs.
+
+    Raises:
+        `ValueError`: If `workers` is less than 1, a document has no encrypted JSON \
+            or the certificate is not in its reading keys.
+    """
+    if workers < 1:
+        raise ValueError('The number of workers must be at least 1.')
+    window = max(max_buffered or 2 * workers, workers)
+    return _iter_decoded(certificate, workers, use_processes, key_cache, documents, window)
+
+
+def _new_executor(
+        certificate: PKCS12Certificate | CertificateKeyring,
+        workers: int,
+        use_processes: bool,
+        key_cache: ReadingKeyCache,
+    ) -> Tuple[Executor, Callable[[EncryptedTextModel], Dict[str, Any]]]:
+    if not use_processes:
+        decode = partial(
+            EncryptedTextModel.decode, certificate=certificate, key_cache=key_cache)
+        return ThreadPoolExecutor(max_workers=workers), decode
+    # The certificates are not picklable, so they are sent to the workers as PKCS12
+    # exports. The exports hold the private keys without encryption.
+    is_keyring = isinstance(certificate, CertificateKeyring)
+    certificates = list(certificate) if is_keyring else [certificate]
+    key_cache_limits = (key_cache.max_entries, key_cache.max_bytes) if key_cache else None
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_decode_process,
+        initargs=(
+            [item._export() for item in certificates],
+            is_keyring,
+            key_cache_limits,
+        ),
+    )
+    return executor, _decode_in_process
+
+
+def _iter_decoded(
+        certificate: PKCS12Certificate | CertificateKeyring,
+        workers: int,
+        use_processes: bool,
+        key_cache: ReadingKeyCache,
+        documents: Iterable[JsonDocumentModel | EncryptedTextModel],
+        window: int,
+    ) -> Iterator[Dict[str, Any]]:
+    executor, decode = _new_executor(certificate, workers, use_processes, key_cache)
+    pending = deque()
+    try:
+        for document in documents:
+            if len(pending) >= window:
+                yield pending.popleft().result()
+            pending.append(executor.submit(decode, _encrypted_text(document)))
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def decode_many(
+        documents: Iterable[JsonDocumentModel | EncryptedTextModel],
+        certificate: PKCS12Certificate | CertificateKeyring,
+        **kwargs,
+    ) -> List[Dict[str, Any]]:
+    """
+    Decode many encrypted JSON documents in parallel.
+
+    See :obj:`iter_decoded` for the options.
+
+    Args:
+        documents ([:obj:`JsonDocumentModel` | :obj:`EncryptedTextModel`]): JSON documents \
+            or encrypted texts to decode.
+        certificate (:obj:`utils.certificate.PKCS12Certificate` | \
+            :obj:`utils.certificate.CertificateKeyring`): PKCS12 certificate or keyring.
+        **kwargs: Options passed to :obj:`iter_decoded`.
+
+    Returns:
+        [{:obj:`str`: Any}]: Decoded JSONs in the order of the documents.
+    """
+    return list(iter_decoded(documents, certificate, **kwargs))
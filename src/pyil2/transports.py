@@ -0,0 +1,565 @@
+# Copyright (c) 2024, InterlockLedger Network
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+from __future__ import annotations
+from abc import ABC, abstractmethod
+import json as json_lib
+import threading
+import weakref
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    Mapping,
+)
+import requests
+from requests.structures import CaseInsensitiveDict
+from .adapters import ConnectionStats, IL2HTTPAdapter
+
+if TYPE_CHECKING:
+    from .client import BaseIL2Client
+    from .http2 import HTTP2Settings
+
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+
+class TransportResponse:
+    """
+    HTTP response returned by the transports that are not based on `requests`.
+
+    It has the same attributes of :obj:`requests.Response` that are used by the client, \
+        so the APIs work the same way with any transport.
+
+    Args:
+        status_code (:obj:`int`): HTTP status code.
+        headers ({:obj:`str`: :obj:`str`}): Response headers.
+        content (:obj:`bytes`): Response body. If `None`, the body is read from `stream`.
+        stream (`Callable`): Function that returns an iterator over the chunks of the body \
+            given the size of the chunks.
+        close (`Callable`): Function that releases the connection of the response.
+        url (:obj:`str`): URL of the request.
+    """
+
+    def __init__(
+            self,
+            status_code: int,
+            headers: Mapping[str, str] = None,
+            content: bytes = None,
+            stream: Callable[[int], Iterator[bytes]] = None,
+            close: Callable[[], None] = None,
+            url: str = None,
+        ) -> None:
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers or {})
+        self.url = url
+        self.raw = _RawStream(self)
+        self._content = content if content is not None or stream else b''
+        self._stream = stream
+        self._close = close
+
+    @property
+    def ok(self) -> bool:
+        """`bool`: `True` if the status code is less than 400."""
+        return self.status_code < 400
+
+    @property
+    def content(self) -> bytes:
+        """:obj:`bytes`: Response body."""
+        if self._content is None:
+            try:
+                self._content = b''.join(self._stream(_STREAM_CHUNK_SIZE))
+            finally:
+                self.close()
+        return self._content
+
+    @property
+    def text(self) -> str:
+        """:obj:`str`: Response body decoded as UTF-8."""
+        return self.content.decode('utf-8', errors='replace')
+
+    def json(self, **kwargs) -> Any:
+        """
+        Decode the response body as JSON.
+        """
+        return json_lib.loads(self.content, **kwargs)
+
+    def iter_content(self, chunk_size: int = _STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+        """
+        Iterate over the chunks of the response body.
+
+        Args:
+            chunk_size (:obj:`int`): Size of the chunks.
+        """
+        return self.raw.stream(chunk_size)
+
+    def close(self) -> None:
+        """
+        Release the connection of the response.
+        """
+        if self._close:
+            close, self._close = self._close, None
+            close()
+
+    def __enter__(self) -> 'TransportResponse':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+class _RawStream:
+    def __init__(self, response: TransportResponse) -> None:
+        self._response = response
+
+    def stream(self, amt: int = _STREAM_CHUNK_SIZE, decode_content: bool = None) -> Iterator[bytes]:
+        response = self._response
+        if response._content is not None:
+            for start in range(0, len(response._content), amt):
+                yield response._content[start:start + amt]
+            return
+        yield from response._stream(amt)
+
+
+class BaseTransport(ABC):
+    """
+    Base class of the transports that send the HTTP requests of an :obj:`pyil2.IL2Client`.
+
+    A transport is used by a single client. The client binds itself to the transport, \
+        so the transport can read the client certificate and the CA verification option \
+        when it opens its connections.
+
+    Attributes:
+        stats (:obj:`pyil2.adapters.ConnectionStats`): Counters of the connections \
+            opened and the requests sent by the transport.
+    """
+
+    def __init__(self) -> None:
+        self.stats = ConnectionStats()
+        self._client = None
+        self._lock = threading.RLock()
+
+    def bind(self, client: BaseIL2Client) -> None:
+        """
+        Bind the transport to the client that will use it.
+
+        Args:
+            client (:obj:`pyil2.client.BaseIL2Client`): Client that will use the transport.
+
+        Raises:
+            ValueError: If the transport is already used by another client.
+        """
+        if self._client is not None and self._client is not client:
+            raise ValueError('The transport is already used by another client.')
+        self._client = client
+
+    @abstractmethod
+    def request(
+            self,
+            method: str,
+            url: str,
+            headers: Dict[str, str] = None,
+            params: Dict[str, str] = None,
+            json: Any = None,
+            data: Any = None,
+            stream: bool = False,
+            timeout: float = None,
+        ) -> requests.Response | TransportResponse:
+        """
+        Send an HTTP request.
+
+        Args:
+            method (:obj:`str`): HTTP method in uppercase.
+            url (:obj:`str`): Absolute URL of the request.
+            headers ({:obj:`str`: :obj:`str`}): Request headers.
+            params ({:obj:`str`: :obj:`str`}): Query parameters.
+            json (`Any`): Body to be sent as JSON.
+            data (`bytes`/`Iterable`): Raw body (e.g. a :obj:`pyil2.utils.stream.UploadStream`).
+            stream (`bool`): If `True`, the body of the response is read only when it is consumed.
+            timeout (:obj:`float`): Timeout in seconds.
+
+        Returns:
+            :obj:`requests.Response`/:obj:`TransportResponse`: Response of the request.
+
+        Raises:
+            requests.ConnectionError: If the connection to the node fails.
+            requests.Timeout: If the request times out.
+        """
+
+    def close(self) -> None:
+        """
+        Close the connections opened by the transport.
+        """
+
+    @property
+    def connection_stats(self) -> Dict[str, int]:
+        """
+        {:obj:`str`: :obj:`int`}: Number of opened connections (`new_connections`), \
+            opened connections that resumed a TLS session (`resumed_connections`), \
+            sent requests (`requests`) and requests that reused an already opened \
+            connection (`reused_connections`).
+        """
+        return self.stats.as_dict()
+
+
+class RequestsTransport(BaseTransport):
+    """
+    Transport based on :obj:`requests.Session` with pooled HTTP/1.1 connections.
+
+    This is the default transport of the :obj:`pyil2.IL2Client`.
+
+    Args:
+        pool_connections (:obj:`int`): Number of connection pools to cache (default: 10).
+        pool_maxsize (:obj:`int`): Maximum number of connections kept open to \
+            the node (default: 10).
+        pool_block (`bool`): If `True`, a request waits for a free connection when \
+            `pool_maxsize` connections are in use (default: False).
+        keep_alive (`bool`): If `True`, keeps the connections open to be reused by the \
+            next requests (default: True).
+        session_mode (:obj:`str`): How the HTTP sessions are shared between threads: \
+            'shared' or 'per_thread' (default: 'shared').
+
+    Raises:
+        ValueError: If the session mode is invalid.
+    """
+
+    _session_modes = [
+        'shared',
+        'per_thread',
+    ]
+
+    def __init__(
+            self,
+            pool_connections: int = 10,
+            pool_maxsize: int = 10,
+            pool_block: bool = False,
+            keep_alive: bool = True,
+            session_mode: str = 'shared',
+        ) -> None:
+        if session_mode not in self._session_modes:
+            raise ValueError(
+                f'Invalid session mode {session_mode}. Must be in {self._session_modes}'
+            )
+        super().__init__()
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.session_mode = session_mode
+        self._session = None
+        self._sessions = weakref.WeakSet()
+        self._local = threading.local()
+
+    def request(
+            self,
+            method: str,
+            url: str,
+            headers: Dict[str, str] = None,
+            params: Dict[str, str] = None,
+            json: Any = None,
+            data: Any = None,
+            stream: bool = False,
+            timeout: float = None,
+        ) -> requests.Response:
+        return self._get_session().request(
+            method,
+            url,
+            headers=headers,
+            params=params,
+            json=json,
+            data=data,
+            stream=stream,
+            timeout=timeout,
+        )
+
+    def _new_session(self) -> requests.Session:
+        session = requests.Session()
+        session.verify = self._client.verify_ca
+        adapter = IL2HTTPAdapter(
+            keep_alive=self.keep_alive,
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+            stats=self.stats,
+            ssl_context=self._client._get_ssl_context(
+                cafile=requests.utils.DEFAULT_CA_BUNDLE_PATH),
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        if not self.keep_alive:
+            session.headers['Connection'] = 'close'
+        with self._lock:
+            self._sessions.add(session)
+        return session
+
+    def _get_session(self) -> requests.Session:
+        if self.session_mode == 'per_thread':
+            session = getattr(self._local, 'session', None)
+            if session is None:
+                session = self._new_session()
+                self._local.session = session
+            return session
+        if not self._session:
+            with self._lock:
+                if not self._session:
+                    self._session = self._new_session()
+        return self._session
+
+    def close(self) -> None:
+        with self._lock:
+            sessions = list(self._sessions)
+            self._sessions.clear()
+            self._session = None
+            self._local = threading.local()
+        for session in sessions:
+            session.close()
+
+
+class HttpxTransport(BaseTransport):
+    """
+    Transport based on :obj:`httpx.Client`, with optional HTTP/2 support.
+
+    With HTTP/2, the concurrent requests of many threads are multiplexed in the same \
+        connection to the node. It requires the `httpx` package and, for HTTP/2, \
+        the `h2` package (`pip install pyil2[http2]`).
+
+    The protocol is negotiated by the first request, which is sent alone. If the node \
+        does not answer it using HTTP/2, the next requests use pooled HTTP/1.1 connections.
+
+    Args:
+        http2 (`bool`): If `True`, uses HTTP/2 when the node supports it (default: True).
+        max_connections (:obj:`int`): Maximum number of connections to the node (default: 10). \
+            With HTTP/2, a single connection is used while it accepts more streams.
+        keep_alive (`bool`): If `True`, keeps the connections open to be reused by the \
+            next requests (default: True).
+        http2_settings (:obj:`pyil2.http2.HTTP2Settings`): Maximum number of concurrent \
+            streams and flow-control windows of the HTTP/2 connections \
+            (default: :obj:`pyil2.http2.HTTP2Settings()`).
+
+    Attributes:
+        http_version (:obj:`str`): HTTP version used with the node, e.g. 'HTTP/2' \
+            (`None` before the first request).
+
+    Raises:
+        ImportError: If `httpx` is not installed.
+    """
+
+    def __init__(
+            self,
+            http2: bool = True,
+            max_connections: int = 10,
+            keep_alive: bool = True,
+            http2_settings: HTTP2Settings = None,
+        ) -> None:
+        try:
+            import httpx
+        except ImportError as e:
+            raise ImportError(
+                'The httpx transport requires the httpx package: pip install pyil2[http2]'
+            ) from e
+        super().__init__()
+        self._httpx = httpx
+        self.http2 = http2
+        self.max_connections = max_connections
+        self.keep_alive = keep_alive
+        self.http2_settings = http2_settings
+        self.http_version = None
+        self._session = None
+        self._retired_sessions = []
+
+    def _new_session(self, http2: bool):
+        limits = self._httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_connections if self.keep_alive else 0,
+        )
+        if http2:
+            from .http2 import IL2HTTP2Transport
+            context = self._client._get_ssl_context(alpn_protocols=['http/1.1', 'h2'])
+            return self._httpx.Client(transport=IL2HTTP2Transport(
+                context,
+                limits,
+                self.http2_settings,
+            ))
+        return self._httpx.Client(
+            verify=self._client._get_ssl_context(),
+            limits=limits,
+        )
+
+    def _trace(self, event: str, info: Dict[str, Any]) -> None:
+        if event == 'connection.connect_tcp.complete':
+            self.stats.count_connection()
+        elif event == 'connection.start_tls.complete':
+            ssl_object = info['return_value'].get_extra_info('ssl_object')
+            if ssl_object is not None and ssl_object.session_reused:
+                self.stats.count_resumed_connection()
+
+    def request(
+            self,
+            method: str,
+            url: str,
+            headers: Dict[str, str] = None,
+            params: Dict[str, str] = None,
+            json: Any = None,
+            data: Any = None,
+            stream: bool = False,
+            timeout: float = None,
+        ) -> TransportResponse:
+        httpx = self._httpx
+        headers = dict(headers or {})
+        content = None
+        if data is not None and not isinstance(data, (bytes, bytearray, str)):
+            try:
+                headers.setdefault('Content-Length', str(len(data)))
+            except TypeError:
+                pass
+            content = (bytes(chunk) for chunk in data)
+        elif data is not None:
+            content = data
+        if isinstance(timeout, tuple):
+            timeout = httpx.Timeout(timeout[1], connect=timeout[0])
+
+        def send(session):
+            request = session.build_request(
+                method,
+                url,
+                headers=headers,
+                params=params,
+                json=json,
+                content=content,
+                timeout=timeout,
+                extensions={'trace': self._trace},
+            )
+            self.stats.count_request()
+            try:
+                return session.send(request, stream=stream)
+            except httpx.TimeoutException as e:
+                raise requests.Timeout(str(e)) from e
+            except httpx.TransportError as e:
+                raise requests.ConnectionError(str(e)) from e
+
+        if self.http_version is not None:
+            response = send(self._session)
+        else:
+            with self._lock:
+                if self._session is None:
+                    self._session = self._new_session(self.http2)
+                if self.http_version is not None:
+                    response = None
+                else:
+                    # httpcore shares a connection that is still being opened between
+                    # threads expecting HTTP/2, which breaks if the node chooses HTTP/1.1.
+                    response = send(self._session)
+                    if self.http2 and response.http_version != 'HTTP/2':
+                        self._retired_sessions.append(self._session)
+                        self._session = self._new_session(http2=False)
+                    self.http_version = response.http_version
+            if response is None:
+                response = send(self._session)
+        return self._response(response, stream)
+
+    def _response(self, response, stream: bool) -> TransportResponse:
+        httpx = self._httpx
+        if not stream:
+            return TransportResponse(
+                response.status_code,
+                response.headers,
+                content=response.content,
+                url=str(response.url),
+            )
+
+        def iter_raw(chunk_size: int) -> Iterator[bytes]:
+            try:
+                yield from response.iter_raw(chunk_size)
+            except httpx.TimeoutException as e:
+                raise requests.Timeout(str(e)) from e
+            except httpx.TransportError as e:
+                raise requests.ConnectionError(str(e)) from e
+
+        return TransportResponse(
+            response.status_code,
+            response.headers,
+            stream=iter_raw,
+            close=response.close,
+            url=str(response.url),
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            sessions = self._retired_sessions + [self._session]
+            self._retired_sessions = []
+            self._session = None
+            self.http_version = None
+        for session in sessions:
+            if session:
+                session.close()
+
+
+class FakeTransport(BaseTransport):
+    """
+    In-process transport that answers the requests with a function, without any connection.
+
+    It can be used to test the code that uses the client and to measure the overhead \
+        of the client without the network.
+
+    Args:
+        handler (`Callable`): Function that receives the method, the URL, the headers, \
+            the query parameters and the body (:obj:`bytes`) of a request and returns \
+            a :obj:`TransportResponse`.
+    """
+
+    def __init__(
+            self,
+            handler: Callable[
+                [str, str, Dict[str, str], Dict[str, str], bytes],
+                TransportResponse
+            ],
+        ) -> None:
+        super().__init__()
+        self.handler = handler
+
+    def request(
+            self,
+            method: str,
+            url: str,
+            headers: Dict[str, str] = None,
+            params: Dict[str, str] = None,
+            json: Any = None,
+            data: Any = None,
+            stream: bool = False,
+            timeout: float = None,
+        ) -> TransportResponse:
+        if json is not None:
+            body = json_lib.dumps(json).encode('utf-8')
+        elif data is None:
+            body = b''
+        elif isinstance(data, (bytes, bytearray, str)):
+            body = data.encode('utf-8') if isinstance(data, str) else bytes(data)
+        else:
+            body = b''.join(bytes(chunk) for chunk in data)
+        self.stats.count_request()
+        return self.handler(method, url, dict(headers or {}), dict(params or {}), body)
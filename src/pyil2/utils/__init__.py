@@ -25,7 +25,13 @@
 # CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
-from typing import List, Self
+import base64
+from typing import (
+    Iterable,
+    Iterator,
+    List,
+    Self,
+)
 from cryptography.hazmat.primitives import ciphers
 
 
@@ -46,6 +52,93 @@ def aes_decrypt(msg: bytes, key: bytes, iv: bytes) -> bytes:
     return decryptor.update(msg) + decryptor.finalize()
 
 
+def aes_decrypt_chunks(
+        chunks: Iterable[bytes | memoryview],
+        key: bytes,
+        iv: bytes
+    ) -> Iterator[bytes]:
+    """
+    Streaming AES decryptor.
+
+    Args:
+        chunks ([:obj:`bytes` | :obj:`memoryview`]): Chunks of the encrypted message. \
+            The chunks may have any size.
+        key (:obj:`bytes`): AES key.
+        iv (:obj:`bytes`): AES IV.
+
+    Returns:
+        [:obj:`bytes`]: Iterator over the decrypted chunks.
+    """
+    cipher = ciphers.Cipher(ciphers.algorithms.AES(key), ciphers.modes.CBC(iv))
+    decryptor = cipher.decryptor()
+    for chunk in chunks:
+        data = decryptor.update(chunk)
+        if data:
+            yield data
+    data = decryptor.finalize()
+    if data:
+        yield data
+
+
+def aes_decrypt_into(
+        chunks: Iterable[bytes | memoryview],
+        key: bytes,
+        iv: bytes,
+        buffer: bytearray
+    ) -> int:
+    """
+    AES decryptor that writes the decrypted message into a preallocated buffer.
+
+    Args:
+        chunks ([:obj:`bytes` | :obj:`memoryview`]): Chunks of the encrypted message. \
+            The chunks may have any size.
+        key (:obj:`bytes`): AES key.
+        iv (:obj:`bytes`): AES IV.
+        buffer (:obj:`bytearray`): Buffer for the decrypted message. It must be at \
+            least 15 bytes larger than the encrypted message.
+
+    Returns:
+        :obj:`int`: Size of the decrypted message.
+    """
+    cipher = ciphers.Cipher(ciphers.algorithms.AES(key), ciphers.modes.CBC(iv))
+    decryptor = cipher.decryptor()
+    position = 0
+    with memoryview(buffer) as view:
+        for chunk in chunks:
+            position += decryptor.update_into(chunk, view[position:])
+        data = decryptor.finalize()
+        view[position:position + len(data)] = data
+    return position + len(data)
+
+
+def urlsafe_b64decode_chunks(text: str, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+    """
+    Decode a URL-safe base64 text in chunks, without decoding the whole text at once.
+
+    Whitespace and line breaks in the text are ignored.
+
+    Args:
+        text (:obj:`str`): URL-safe base64 text.
+        chunk_size (:obj:`int`): Approximate size of the decoded chunks.
+
+    Returns:
+        [:obj:`bytes`]: Iterator over the decoded chunks.
+    """
+    step = max(chunk_size // 3, 1) * 4
+    # `range` is not used here because the name refers to the `pyil2.utils.range` module.
+    start = 0
+    pending = ''
+    while start < len(text):
+        # Only groups of 4 base64 characters are decoded, so the characters left
+        # after removing the whitespace are decoded with the next slice.
+        pending += ''.join(text[start:start + step].split())
+        start += step
+        size = len(pending) if start >= len(text) else len(pending) - len(pending) % 4
+        if size:
+            yield base64.urlsafe_b64decode(pending[:size])
+        pending = pending[size:]
+
+
 class AppPermissions:
     def __init__(self, app_id: int, action_ids: List[int] = list):
         """
@@ -0,0 +1,626 @@
+# Copyright (c) 2024, InterlockLedger Network
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+from collections import OrderedDict
+import base64
+import hashlib
+import os
+import sqlite3
+import ssl
+import threading
+from typing import (
+    Any,
+    Callable,
+    Hashable,
+    Iterable,
+    Tuple,
+)
+
+from .certificates import PKCS12Certificate, create_ssl_context
+
+
+class LRUCache:
+    """
+    Thread-safe cache that discards the least recently used items when it is full.
+
+    Args:
+        max_entries (:obj:`int`): Maximum number of items in the cache.
+        max_bytes (:obj:`int`): Maximum total size (in bytes) of the items in the cache \
+            (`None` for no limit).
+        sizeof (`Callable`): Function that returns the size (in bytes) of an item \
+            given its key and value. Required to limit the size of the cache in bytes.
+
+    Attributes:
+        hits (:obj:`int`): Number of lookups that found the item in the cache.
+        misses (:obj:`int`): Number of lookups that did not find the item in the cache.
+
+    Raises:
+        ValueError: If the limits are not positive or `max_bytes` is used without `sizeof`.
+    """
+
+    def __init__(
+            self,
+            max_entries: int = 1024,
+            max_bytes: int = None,
+            sizeof: Callable[[Hashable, Any], int] = None,
+        ) -> None:
+        if max_entries < 1:
+            raise ValueError('The maximum number of entries must be at least 1.')
+        if max_bytes is not None:
+            if max_bytes < 1:
+                raise ValueError('The maximum size in bytes must be at least 1.')
+            if sizeof is None:
+                raise ValueError('A sizeof function is required to limit the size in bytes.')
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._items = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def size(self) -> int:
+        """:obj:`int`: Total size (in bytes) of the items in the cache (0 if `sizeof` is not defined)."""
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._items
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get an item from the cache and mark it as the most recently used.
+
+        Args:
+            key (`Hashable`): Key of the item.
+            default (`Any`): Value returned if the item is not in the cache.
+
+        Returns:
+            `Any`: Value of the item.
+        """
+        with self._lock:
+            try:
+                value, _ = self._items[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._items.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Add or replace an item in the cache, discarding the least recently used items \
+            if the cache is full.
+
+        Items larger than `max_bytes` are not stored.
+
+        Args:
+            key (`Hashable`): Key of the item.
+            value (`Any`): Value of the item.
+        """
+        size = self._sizeof(key, value) if self._sizeof else 0
+        with self._lock:
+            self._pop(key)
+            if self.max_bytes is not None and size > self.max_bytes:
+                return
+            self._items[key] = (value, size)
+            self._size += size
+            while len(self._items) > self.max_entries or \
+                    (self.max_bytes is not None and self._size > self.max_bytes):
+                self._pop(next(iter(self._items)))
+
+    def invalidate(self, key: Hashable) -> bool:
+        """
+        Remove an item from the cache.
+
+        Args:
+            key (`Hashable`): Key of the item.
+
+        Returns:
+            :obj:`bool`: `True` if the item was in the cache.
+        """
+        with self._lock:
+            return self._pop(key)
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]) -> int:
+        """
+        Remove the items whose keys match a condition.
+
+        Args:
+            predicate (`Callable`): Function that returns `True` for the keys to remove.
+
+        Returns:
+            :obj:`int`: Number of removed items.
+        """
+        with self._lock:
+            keys = [key for key in self._items if predicate(key)]
+            for key in keys:
+                self._pop(key)
+            return len(keys)
+
+    def clear(self) -> None:
+        """
+        Remove all the items from the cache.
+        """
+        with self._lock:
+            self._items.clear()
+            self._size = 0
+
+    def _pop(self, key: Hashable) -> bool:
+        item = self._items.pop(key, None)
+        if item is None:
+            return False
+        self._size -= item[1]
+        return True
+
+
+class ReadingKeyCache(LRUCache):
+    """
+    Cache of the AES keys and IVs of encrypted JSON documents, decrypted with the \
+        private key of a certificate.
+
+    Decrypting the key and the IV of an encrypted text takes two RSA operations, so \
+        reusing the cache when decoding texts that share a reading key avoids most of \
+        the decoding cost. The decrypted keys are kept in memory, so use :obj:`clear` \
+        or :obj:`invalidate_certificate` when they are no longer needed.
+
+    Args:
+        max_entries (:obj:`int`): Maximum number of reading keys in the cache.
+        max_bytes (:obj:`int`): Maximum total size (in bytes) of the cached keys \
+            (`None` for no limit).
+    """
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = None) -> None:
+        super().__init__(max_entries, max_bytes, sizeof=self._entry_size)
+
+    @staticmethod
+    def _entry_size(key: Tuple[str, bytes], value: Tuple[bytes, bytes]) -> int:
+        return len(key[0]) + len(key[1]) + len(value[0]) + len(value[1])
+
+    def get_keys(
+            self,
+            certificate: PKCS12Certificate,
+            encrypted_key: str,
+            encrypted_iv: str,
+        ) -> Tuple[bytes, bytes]:
+        """
+        Get the decrypted AES key and IV of a reading key, decrypting them with the \
+            certificate if they are not in the cache.
+
+        Args:
+            certificate (:obj:`pyil2.utils.certificates.PKCS12Certificate`): PKCS12 certificate.
+            encrypted_key (:obj:`str`): Encrypted AES key.
+            encrypted_iv (:obj:`str`): Encrypted AES IV.
+
+        Returns:
+            (:obj:`bytes`, :obj:`bytes`): AES key and IV.
+        """
+        digest = hashlib.sha256(f'{encrypted_key}:{encrypted_iv}'.encode()).digest()
+        key = (certificate.key_id, digest)
+        keys = self.get(key)
+        if keys is None:
+            keys = (
+                certificate.decrypt(base64.urlsafe_b64decode(encrypted_key)),
+                certificate.decrypt(base64.urlsafe_b64decode(encrypted_iv)),
+            )
+            self.put(key, keys)
+        return keys
+
+    def invalidate_certificate(self, certificate: PKCS12Certificate) -> int:
+        """
+        Remove the keys decrypted with a certificate from the cache.
+
+        Args:
+            certificate (:obj:`pyil2.utils.certificates.PKCS12Certificate`): PKCS12 certificate.
+
+        Returns:
+            :obj:`int`: Number of removed keys.
+        """
+        key_id = certificate.key_id
+        return self.invalidate_where(lambda key: key[0] == key_id)
+
+
+class CertificateCache(LRUCache):
+    """
+    Cache of the PKCS12 certificates and SSL contexts loaded by the clients.
+
+    Opening a PKCS12 file derives its key from the password, which is slow, so the \
+        clients of a process share the certificates and SSL contexts of this cache \
+        (see :obj:`certificate_cache`). The items are indexed by the path and the \
+        modification time of the file and by a hash of the password, so a changed \
+        file is loaded again. The private keys are kept in memory, so use \
+        :obj:`invalidate_file` or :obj:`clear` when they are no longer needed.
+
+    Args:
+        max_entries (:obj:`int`): Maximum number of certificates and SSL contexts \
+            in the cache.
+    """
+
+    def __init__(self, max_entries: int = 256) -> None:
+        super().__init__(max_entries)
+        self._salt = os.urandom(16)
+        self._load_lock = threading.RLock()
+
+    def get_certificate(self, path: str, password: str) -> PKCS12Certificate:
+        """
+        Get a certificate, loading it from the file if it is not in the cache.
+
+        Args:
+            path (:obj:`str`): Path to the .pfx certificate.
+            password (:obj:`str`): Password of the .pfx certificate.
+
+        Returns:
+            :obj:`pyil2.utils.certificates.PKCS12Certificate`: PKCS12 certificate.
+        """
+        file_key = self._file_key(path, password)
+        return self._get_or_load(
+            ('certificate',) + file_key,
+            lambda: PKCS12Certificate(path, password),
+        )
+
+    def get_ssl_context(
+            self,
+            path: str,
+            password: str,
+            verify_ca: bool = True,
+            cafile: str = None,
+            alpn_protocols: Iterable[str] = ('http/1.1',),
+        ) -> ssl.SSLContext:
+        """
+        Get an SSL context with a certificate, creating it if it is not in the cache.
+
+        Args:
+            path (:obj:`str`): Path to the .pfx certificate.
+            password (:obj:`str`): Password of the .pfx certificate.
+            verify_ca (`bool`): If `True`, verifies the SSL certificate of the node in a CA.
+            cafile (:obj:`str`): Path to the CA bundle (default: the CAs of the system).
+            alpn_protocols ([:obj:`str`]): Protocols offered in the TLS handshake.
+
+        Returns:
+            :obj:`ssl.SSLContext`: SSL context with the certificate.
+        """
+        file_key = self._file_key(path, password)
+        return self._get_or_load(
+            ('ssl_context',) + file_key + (verify_ca, cafile, tuple(alpn_protocols)),
+            lambda: create_ssl_context(
+                self.get_certificate(path, password),
+                verify_ca=verify_ca,
+                cafile=cafile,
+                alpn_protocols=alpn_protocols,
+            ),
+        )
+
+    def invalidate_file(self, path: str) -> int:
+        """
+        Remove the certificate of a file and its SSL contexts from the cache.
+
+        Args:
+            path (:obj:`str`): Path to the .pfx certificate.
+
+        Returns:
+            :obj:`int`: Number of removed items.
+        """
+        path = os.path.abspath(os.path.expanduser(path))
+        return self.invalidate_where(lambda key: key[1] == path)
+
+    def _file_key(self, path: str, password: str) -> Tuple[str, int, bytes]:
+        path = os.path.abspath(os.path.expanduser(path))
+        return (
+            path,
+            os.stat(path).st_mtime_ns,
+            hashlib.sha256(self._salt + password.encode()).digest(),
+        )
+
+    def _get_or_load(self, key: Tuple, load: Callable[[], Any]) -> Any:
+        value = self.get(key)
+        if value is None:
+            with self._load_lock:
+                value = self.get(key)
+                if value is None:
+                    # Older versions of the file are not needed anymore.
+                    self.invalidate_where(
+                        lambda item: item[1] == key[1] and item[2] != key[2])
+                    value = load()
+                    self.put(key, value)
+        return value
+
+
+certificate_cache = CertificateCache()
+"""
+:obj:`CertificateCache`: Certificates and SSL contexts shared by all the clients of the process.
+"""
+
+
+class RecordCache:
+    """
+    Persistent cache of records stored in a SQLite database.
+
+    Committed records never change, so a record read from the node can be stored \
+        and returned again without a request. The records are identified by the \
+        network, the chain and the serial, and by the kind of response (e.g. record, \
+        record as JSON, opaque record). When the total size of the cached records \
+        is greater than `max_bytes`, the least recently used records are removed.
+
+    The cache hits only read the database. Their access times are kept in memory and \
+        written in batches when a record is added, after `max_pending_accesses` hits or \
+        when the cache is closed, so the order of the least recently used records is \
+        approximate when the database is shared by many caches.
+
+    Args:
+        path (:obj:`str`): Path of the SQLite database file (default: ':memory:', \
+            a cache that is not persisted).
+        max_bytes (:obj:`int`): Maximum total size (in bytes) of the cached records.
+        max_pending_accesses (:obj:`int`): Number of cache hits kept in memory before \
+            their access times are written to the database.
+
+    Attributes:
+        hits (:obj:`int`): Number of lookups that found the record in the cache.
+        misses (:obj:`int`): Number of lookups that did not find the record in the cache.
+
+    Raises:
+        ValueError: If `max_bytes` or `max_pending_accesses` is less than 1.
+    """
+
+    _NEXT_ACCESS = 'SELECT COALESCE(MAX(last_access), 0) + 1 FROM records'
+
+    def __init__(
+            self,
+            path: str = ':memory:',
+            max_bytes: int = 256 * 1024 * 1024,
+            max_pending_accesses: int = 1024,
+        ) -> None:
+        if max_bytes < 1:
+            raise ValueError('The maximum size in bytes must be at least 1.')
+        if max_pending_accesses < 1:
+            raise ValueError('The maximum number of pending accesses must be at least 1.')
+        self.path = path if path == ':memory:' else os.path.expanduser(path)
+        self.max_bytes = max_bytes
+        self.max_pending_accesses = max_pending_accesses
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # Keys of the records read since the last write, from the oldest to the newest access.
+        self._accesses = {}
+        self._connection = sqlite3.connect(
+            self.path, check_same_thread=False, isolation_level=None)
+        self._busy_timeout = self._connection.execute('PRAGMA busy_timeout').fetchone()[0]
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('PRAGMA synchronous=NORMAL')
+        # The database may be shared by many processes, so the total size is kept in
+        # the database by triggers and the accesses are ordered by the table itself.
+        self._connection.executescript(
+            'BEGIN IMMEDIATE;'
+            'CREATE TABLE IF NOT EXISTS records ('
+            'network TEXT NOT NULL, chain_id TEXT NOT NULL, serial INTEGER NOT NULL, '
+            'kind TEXT NOT NULL, headers TEXT, content BLOB NOT NULL, '
+            'size INTEGER NOT NULL, last_access INTEGER NOT NULL, '
+            'PRIMARY KEY (network, chain_id, serial, kind));'
+            'CREATE INDEX IF NOT EXISTS records_last_access ON records (last_access);'
+            'CREATE TABLE IF NOT EXISTS records_size ('
+            'id INTEGER PRIMARY KEY CHECK (id = 0), size INTEGER NOT NULL);'
+            'INSERT OR IGNORE INTO records_size '
+            'SELECT 0, COALESCE(SUM(size), 0) FROM records;'
+            'CREATE TRIGGER IF NOT EXISTS records_insert AFTER INSERT ON records '
+            'BEGIN UPDATE records_size SET size = size + NEW.size; END;'
+            'CREATE TRIGGER IF NOT EXISTS records_delete AFTER DELETE ON records '
+            'BEGIN UPDATE records_size SET size = size - OLD.size; END;'
+            'COMMIT;'
+        )
+
+    @property
+    def size(self) -> int:
+        """:obj:`int`: Total size (in bytes) of the cached records."""
+        with self._lock:
+            return self._total_size()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute('SELECT COUNT(*) FROM records').fetchone()[0]
+
+    def get(
+            self,
+            network: str,
+            chain_id: str,
+            serial: int,
+            kind: str,
+        ) -> Tuple[bytes, str | None] | None:
+        """
+        Get a record from the cache.
+
+        Args:
+            network (:obj:`str`): Network name.
+            chain_id (:obj:`str`): Chain ID.
+            serial (:obj:`int`): Record serial number.
+            kind (:obj:`str`): Kind of the response.
+
+        Returns:
+            (:obj:`bytes`, :obj:`str`): Content and headers (in JSON) of the response \
+                (`None` if the record is not in the cache).
+        """
+        key = (network, chain_id, serial, kind)
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT content, headers FROM records '
+                'WHERE network = ? AND chain_id = ? AND serial = ? AND kind = ?',
+                key,
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._accesses.pop(key, None)
+            self._accesses[key] = None
+            if len(self._accesses) >= self.max_pending_accesses:
+                self._try_write_accesses()
+        return bytes(row[0]), row[1]
+
+    def put(
+            self,
+            network: str,
+            chain_id: str,
+            serial: int,
+            kind: str,
+            content: bytes,
+            headers: str = None,
+        ) -> None:
+        """
+        Add or replace a record in the cache, removing the least recently used records \
+            if the cache is full.
+
+        Records larger than `max_bytes` are not stored.
+
+        Args:
+            network (:obj:`str`): Network name.
+            chain_id (:obj:`str`): Chain ID.
+            serial (:obj:`int`): Record serial number.
+            kind (:obj:`str`): Kind of the response.
+            content (:obj:`bytes`): Content of the response.
+            headers (:obj:`str`): Headers of the response in JSON.
+        """
+        size = len(content) + len(headers or '')
+        if size > self.max_bytes:
+            return
+        key = (network, chain_id, serial, kind)
+        with self._lock:
+            self._connection.execute('BEGIN IMMEDIATE')
+            try:
+                self._write_accesses()
+                self._connection.execute(
+                    'DELETE FROM records '
+                    'WHERE network = ? AND chain_id = ? AND serial = ? AND kind = ?',
+                    key,
+                )
+                self._connection.execute(
+                    f'INSERT INTO records VALUES (?, ?, ?, ?, ?, ?, ?, ({self._NEXT_ACCESS}))',
+                    (*key, headers, content, size),
+                )
+                total_size = self._total_size()
+                if total_size > self.max_bytes:
+                    self._evict(total_size - self.max_bytes)
+                self._connection.execute('COMMIT')
+            except BaseException:
+                self._connection.execute('ROLLBACK')
+                raise
+
+    def invalidate(
+            self,
+            network: str = None,
+            chain_id: str = None,
+            serial: int = None,
+        ) -> int:
+        """
+        Remove records from the cache.
+
+        Args:
+            network (:obj:`str`): If defined, removes only the records of this network.
+            chain_id (:obj:`str`): If defined, removes only the records of this chain.
+            serial (:obj:`int`): If defined, removes only the records with this serial.
+
+        Returns:
+            :obj:`int`: Number of removed records.
+        """
+        conditions = []
+        params = []
+        for column, value in (('network', network), ('chain_id', chain_id), ('serial', serial)):
+            if value is not None:
+                conditions.append(f'{column} = ?')
+                params.append(value)
+        where = ' AND '.join(conditions) or '1'
+        with self._lock:
+            return self._connection.execute(
+                f'DELETE FROM records WHERE {where}', params).rowcount
+
+    def clear(self) -> None:
+        """
+        Remove all the records from the cache.
+        """
+        self.invalidate()
+
+    def close(self) -> None:
+        """
+        Close the database, writing the access times of the last cache hits.
+        """
+        with self._lock:
+            try:
+                self._try_write_accesses()
+            finally:
+                self._connection.close()
+
+    def __enter__(self) -> 'RecordCache':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def _write_accesses(self) -> None:
+        self._connection.executemany(
+            f'UPDATE records SET last_access = ({self._NEXT_ACCESS}) '
+            'WHERE network = ? AND chain_id = ? AND serial = ? AND kind = ?',
+            self._accesses,
+        )
+        self._accesses.clear()
+
+    def _try_write_accesses(self) -> None:
+        # The access times are only a hint for the eviction, so they are kept in memory
+        # until the next write if another connection holds the write lock.
+        if not self._accesses:
+            return
+        self._connection.execute('PRAGMA busy_timeout = 0')
+        try:
+            self._connection.execute('BEGIN IMMEDIATE')
+        except sqlite3.OperationalError:
+            return
+        finally:
+            self._connection.execute(f'PRAGMA busy_timeout = {self._busy_timeout}')
+        try:
+            self._write_accesses()
+            self._connection.execute('COMMIT')
+        except BaseException:
+            self._connection.execute('ROLLBACK')
+            raise
+
+    def _total_size(self) -> int:
+        return self._connection.execute('SELECT size FROM records_size').fetchone()[0]
+
+    def _evict(self, size: int) -> None:
+        rows = self._connection.execute(
+            'SELECT last_access, size FROM records ORDER BY last_access')
+        last_access = None
+        evicted = 0
+        for last_access, row_size in rows:
+            evicted += row_size
+            if evicted >= size:
+                break
+        rows.close()
+        if last_access is not None:
+            self._connection.execute(
+                'DELETE FROM records WHERE last_access <= ?', (last_access,))
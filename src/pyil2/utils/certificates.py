@@ -28,12 +28,47 @@
 import io
 import os
 import base64
+import functools
+import ssl
+import sys
+import threading
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Tuple,
+    TypeVar,
+)
 from cryptography.x509 import NameOID, Certificate
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.serialization import pkcs12
-from cryptography.hazmat.primitives.asymmetric import padding
+from cryptography.hazmat.primitives.asymmetric import padding, rsa
 from cryptography.hazmat.primitives import hashes
 import pyiltags
+from pyilint import ilint_decode
+
+T = TypeVar('T')
+
+
+def _memoize(method: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """
+    Cache the result of a method without arguments in the instance, computing it only once \
+        even if the method is called from several threads.
+    """
+    @functools.wraps(method)
+    def wrapper(self):
+        try:
+            return self._memoized[method.__name__]
+        except KeyError:
+            pass
+        with self._memoize_lock:
+            if method.__name__ not in self._memoized:
+                self._memoized[method.__name__] = method(self)
+            return self._memoized[method.__name__]
+    return wrapper
 
 
 class PKCS12Certificate:
@@ -47,6 +82,8 @@ class PKCS12Certificate:
 
     def __init__(self, path: str, password: str):
         self._friendly_name = ''
+        self._memoized = {}
+        self._memoize_lock = threading.RLock()
         self._pkcs12_cert = self._get_cert_from_file(path, password)
 
     @property
@@ -65,6 +102,7 @@ class PKCS12Certificate:
         return self._friendly_name
 
     @property
+    @_memoize
     def private_key(self) -> bytes:
         """:obj:`bytes`: Certificate private key."""
         # return crypto.dump_privatekey(crypto.FILETYPE_PEM, self._pkcs12_cert.get_privatekey())
@@ -75,12 +113,14 @@ class PKCS12Certificate:
         )
 
     @property
+    @_memoize
     def public_certificate(self) -> bytes:
         """:obj:`bytes`: Certificate public certificate."""
         # return crypto.dump_certificate(crypto.FILETYPE_PEM, self._pkcs12_cert.get_certificate())
         return self._pkcs12_cert[1].public_bytes(encoding=serialization.Encoding.PEM)
 
     @property
+    @_memoize
     def key_id(self) -> str:
         """:obj:`str`: Id of the key."""
         digest = hashes.Hash(hashes.SHA1())
@@ -91,6 +131,7 @@ class PKCS12Certificate:
         return f'Key!{s}#SHA1'
 
     @property
+    @_memoize
     def pub_key_hash(self) -> str:
         """:obj:`str`: Public key hash in IL2 text representation."""
         pub_key_parameter_tag = self._format_pub_key()
@@ -105,6 +146,7 @@ class PKCS12Certificate:
         return f'{s}#SHA256'
 
     @property
+    @_memoize
     def pub_key(self) -> str:
         """:obj:`str`: Public key in IL2 text representation."""
         pub_key_parameter_tag = self._format_pub_key()
@@ -126,6 +168,23 @@ class PKCS12Certificate:
         """:obj:`int`: Public exponent."""
         return self._pkcs12_cert[1].public_key().public_numbers().e
 
+    @property
+    def reader_index_key(self) -> Tuple[str, str]:
+        """
+        (:obj:`str`, :obj:`str`): Key id and public key hash that identify the certificate \
+            in the reading keys of an encrypted text.
+
+        Raises:
+            `ValueError`: If the certificate has no private key or is a Non-RSA certificate.
+        """
+        if not self.has_pk():
+            raise ValueError(
+                'Certificate has no private key to be able to decode EncryptedText.')
+        pub_key_hash = self.pub_key_hash
+        if not pub_key_hash:
+            raise ValueError('Non-RSA certificate is not currently supported.')
+        return self.key_id, pub_key_hash
+
     def has_pk(self) -> bool:
         """
         Check if the certificate has a primary key.
@@ -152,12 +211,34 @@ class PKCS12Certificate:
         ))
         return msg
 
+    def _export(self) -> bytes:
+        # Unencrypted PKCS12 export (with the private key) used to send the certificate
+        # to worker processes.
+        private_key, certificate, additional_certificates = self._pkcs12_cert
+        return pkcs12.serialize_key_and_certificates(
+            None,
+            private_key,
+            certificate,
+            additional_certificates,
+            serialization.NoEncryption(),
+        )
+
+    @classmethod
+    def _from_export(cls, data: bytes) -> 'PKCS12Certificate':
+        certificate = cls.__new__(cls)
+        certificate._friendly_name = ''
+        certificate._memoized = {}
+        certificate._memoize_lock = threading.RLock()
+        certificate._pkcs12_cert = pkcs12.load_key_and_certificates(data, None)
+        return certificate
+
     def _get_cert_from_file(self, cert_path: str, cert_pass: str) -> Certificate:
         with open(os.path.expanduser(cert_path), 'rb') as f:
             pkcs_cert = pkcs12.load_key_and_certificates(
                 f.read(), cert_pass.encode())
         return pkcs_cert
 
+    @_memoize
     def _format_pub_key(self) -> bytes | None:
         if not self._pkcs12_cert[1]:
             return None
@@ -181,3 +262,297 @@ class PKCS12Certificate:
         t.serialize(writer)
         pub_key_parameter_tag = writer.getvalue()
         return pub_key_parameter_tag
+
+
+class _TLSSessions:
+    # Latest TLS session received from each server, used to resume the next
+    # connections without a full handshake.
+
+    def __init__(self) -> None:
+        self._sessions: Dict[Tuple[str, int], ssl.SSLSession] = {}
+
+    def get(self, server: Tuple[str, int]) -> ssl.SSLSession | None:
+        session = self._sessions.get(server)
+        if session is not None and session.time + session.timeout <= time.time():
+            self._sessions.pop(server, None)
+            return None
+        return session
+
+    def update(self, server: Tuple[str, int], ssl_socket: ssl.SSLSocket) -> bool:
+        # In TLS 1.3, the session tickets are sent after the handshake, so the session
+        # can only be resumed after the ticket is read with the first response.
+        session = ssl_socket.session
+        if session is None or not session.has_ticket and (
+                ssl_socket.version() != 'TLSv1.2' or not session.id):
+            return False
+        self._sessions[server] = session
+        return True
+
+
+class _SharedSSLSocket(ssl.SSLSocket):
+    _session_server = None
+
+    def read(self, len=1024, buffer=None):
+        data = super().read(len, buffer)
+        if self._session_server is not None and \
+                self.context._sessions.update(self._session_server, self):
+            self._session_server = None
+        return data
+
+
+class _SharedSSLContext(ssl.SSLContext):
+    # The sessions are resumed only by the sockets wrapped by the context. The TLS
+    # objects used by asyncio (wrap_bio) do not know the port of the server.
+    sslsocket_class = _SharedSSLSocket
+
+    def __init__(self, protocol: int, alpn_protocols: Iterable[str]) -> None:
+        self._sessions = _TLSSessions()
+        self._alpn_protocols = list(alpn_protocols)
+        super().set_alpn_protocols(self._alpn_protocols)
+
+    def set_alpn_protocols(self, alpn_protocols: Iterable[str]) -> None:
+        # The context is shared by many connections, but httpcore and urllib3 set its
+        # ALPN protocols before opening each connection, which crashes OpenSSL if
+        # another thread is in a TLS handshake.
+        if list(alpn_protocols) != self._alpn_protocols:
+            raise ValueError(
+                f'The ALPN protocols of the shared SSL context are {self._alpn_protocols}.')
+
+    def wrap_socket(self, sock, server_side=False, do_handshake_on_connect=True,
+                    suppress_ragged_eofs=True, server_hostname=None, session=None):
+        server = None
+        if server_hostname and not server_side:
+            server = (server_hostname, sock.getpeername()[1])
+            if session is None:
+                session = self._sessions.get(server)
+        ssl_socket = super().wrap_socket(
+            sock, server_side, do_handshake_on_connect, suppress_ragged_eofs,
+            server_hostname, session)
+        ssl_socket._session_server = server
+        return ssl_socket
+
+
+def _load_cert_chain(context: ssl.SSLContext, certificate_pem: bytes, key_pem: bytes) -> None:
+    # The ssl module only loads a certificate chain from a path, but the private key
+    # must never be stored on disk. The chain is written to an anonymous file that
+    # lives only in memory or, if the system does not support it, to pipes.
+    if hasattr(os, 'memfd_create'):
+        try:
+            fd = os.memfd_create('pyil2-cert', os.MFD_CLOEXEC)
+        except OSError:
+            fd = None
+        if fd is not None:
+            with os.fdopen(fd, 'wb') as pem_file:
+                pem_file.write(certificate_pem + key_pem)
+                pem_file.flush()
+                context.load_cert_chain(f'/proc/self/fd/{fd}')
+            return
+    if not os.path.isdir('/dev/fd'):
+        raise OSError(
+            'Unable to load the certificate in memory: the system supports neither '
+            'memfd_create nor /dev/fd.'
+        )
+    # Each pipe is read only once, so the certificates and the key use different pipes.
+    pipes = [os.pipe(), os.pipe()]
+    writers = [
+        threading.Thread(target=_write_pipe, args=(write_fd, data), daemon=True)
+        for (_, write_fd), data in zip(pipes, (certificate_pem, key_pem))
+    ]
+    try:
+        for writer in writers:
+            writer.start()
+        context.load_cert_chain(f'/dev/fd/{pipes[0][0]}', f'/dev/fd/{pipes[1][0]}')
+    finally:
+        for read_fd, _ in pipes:
+            os.close(read_fd)
+        for writer in writers:
+            writer.join()
+
+
+def _write_pipe(fd: int, data: bytes) -> None:
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    except BrokenPipeError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def create_ssl_context(
+        certificate: PKCS12Certificate,
+        verify_ca: bool = True,
+        cafile: str = None,
+        alpn_protocols: Iterable[str] = ('http/1.1',),
+    ) -> ssl.SSLContext:
+    """
+    Create an SSL context to authenticate in the node with a certificate.
+
+    The context can be shared by many connections and clients. Its ALPN protocols \
+        are fixed when it is created, and it keeps the latest TLS session received \
+        from each server (host and port), so the next connections are resumed without \
+        a full handshake. The connections opened by asyncio are not resumed.
+
+    Args:
+        certificate (:obj:`PKCS12Certificate`): PKCS12 certificate with the private key.
+        verify_ca (`bool`): If `True`, verifies the SSL certificate of the node in a CA.
+        cafile (:obj:`str`): Path to the CA bundle (default: the CAs of the system).
+        alpn_protocols ([:obj:`str`]): Protocols offered in the TLS handshake.
+
+    Returns:
+        :obj:`ssl.SSLContext`: SSL context with the certificate. Setting other ALPN \
+            protocols in the context raises a `ValueError`.
+    """
+    context = _SharedSSLContext(ssl.PROTOCOL_TLS_CLIENT, alpn_protocols)
+    if sys.version_info >= (3, 13):
+        # Same flags as ssl.create_default_context.
+        context.verify_flags |= ssl.VERIFY_X509_PARTIAL_CHAIN | ssl.VERIFY_X509_STRICT
+    if cafile:
+        context.load_verify_locations(cafile)
+    else:
+        context.load_default_certs()
+    if not verify_ca:
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+    _load_cert_chain(context, certificate.public_certificate, certificate.private_key)
+    return context
+
+
+def _il2_public_key_tag(public_key: str) -> bytes:
+    if not public_key.startswith('PubKey!') or not public_key.endswith('#RSA'):
+        raise ValueError(f"'{public_key}' is not an RSA public key in the IL2 text representation.")
+    encoded = public_key[len('PubKey!'):-len('#RSA')]
+    return base64.urlsafe_b64decode(encoded + '=' * (-len(encoded) % 4))
+
+
+def _read_raw_tag(data: bytes, offset: int, tag_id: int) -> Tuple[bytes, int]:
+    found_id, size = ilint_decode(data[offset:offset + 9])
+    offset += size
+    length, size = ilint_decode(data[offset:offset + 9])
+    offset += size
+    if found_id != tag_id or offset + length > len(data):
+        raise ValueError('Invalid IL2 public key parameters.')
+    return data[offset:offset + length], offset + length
+
+
+def rsa_public_key_from_il2(public_key: str) -> rsa.RSAPublicKey:
+    """
+    Get an RSA public key from its IL2 text representation.
+
+    Args:
+        public_key (:obj:`str`): IL2 text representation of the public key \
+            ('PubKey!<parameters>#RSA').
+
+    Returns:
+        :obj:`cryptography.hazmat.primitives.asymmetric.rsa.RSAPublicKey`: RSA public key.
+
+    Raises:
+        `ValueError`: If the text is not an RSA public key in the IL2 text representation.
+    """
+    parameters, _ = _read_raw_tag(_il2_public_key_tag(public_key), 0, 40)
+    modulus, offset = _read_raw_tag(parameters, 0, 16)
+    exponent, _ = _read_raw_tag(parameters, offset, 16)
+    return rsa.RSAPublicNumbers(
+        int.from_bytes(exponent, byteorder='big'),
+        int.from_bytes(modulus, byteorder='big'),
+    ).public_key()
+
+
+def il2_public_key_hash(public_key: str) -> str:
+    """
+    Get the hash of a public key in the IL2 text representation, as used in the \
+        reading keys of an encrypted text.
+
+    Args:
+        public_key (:obj:`str`): IL2 text representation of the public key \
+            ('PubKey!<parameters>#RSA').
+
+    Returns:
+        :obj:`str`: Public key hash in IL2 text representation.
+
+    Raises:
+        `ValueError`: If the text is not an RSA public key in the IL2 text representation.
+    """
+    digest = hashes.Hash(hashes.SHA256())
+    digest.update(_il2_public_key_tag(public_key))
+    s = base64.urlsafe_b64encode(digest.finalize()).decode().replace('=', '')
+    return f'{s}#SHA256'
+
+
+class CertificateKeyring:
+    """
+    Set of PKCS12 certificates indexed by key id and public key hash, to find the \
+        certificate able to read an encrypted text among many certificates.
+
+    Args:
+        certificates ([:obj:`PKCS12Certificate`]): Initial certificates of the keyring.
+
+    Raises:
+        `ValueError`: If a certificate has no private key or is a Non-RSA certificate.
+    """
+
+    def __init__(self, certificates: Iterable[PKCS12Certificate] = ()) -> None:
+        self._certificates: Dict[Tuple[str, str], PKCS12Certificate] = {}
+        for certificate in certificates:
+            self.add(certificate)
+
+    def add(self, certificate: PKCS12Certificate) -> None:
+        """
+        Add a certificate to the keyring.
+
+        Args:
+            certificate (:obj:`PKCS12Certificate`): PKCS12 certificate.
+
+        Raises:
+            `ValueError`: If the certificate has no private key or is a Non-RSA certificate.
+        """
+        self._certificates[certificate.reader_index_key] = certificate
+
+    def remove(self, certificate: PKCS12Certificate) -> bool:
+        """
+        Remove a certificate from the keyring.
+
+        Args:
+            certificate (:obj:`PKCS12Certificate`): PKCS12 certificate.
+
+        Returns:
+            :obj:`bool`: `True` if the certificate was in the keyring.
+        """
+        return self._certificates.pop(certificate.reader_index_key, None) is not None
+
+    def find(
+            self,
+            reading_keys: Dict[Tuple[str, str], T]
+        ) -> Tuple[PKCS12Certificate, T] | None:
+        """
+        Find a certificate of the keyring in a set of reading keys.
+
+        Args:
+            reading_keys ({(:obj:`str`, :obj:`str`): Any}): Reading keys indexed by \
+                key id and public key hash.
+
+        Returns:
+            (:obj:`PKCS12Certificate`, Any): The certificate and its reading key \
+                (`None` if no certificate matches the reading keys).
+        """
+        if len(reading_keys) <= len(self._certificates):
+            for index_key, reading_key in reading_keys.items():
+                certificate = self._certificates.get(index_key)
+                if certificate is not None:
+                    return certificate, reading_key
+        else:
+            for index_key, certificate in self._certificates.items():
+                reading_key = reading_keys.get(index_key)
+                if reading_key is not None:
+                    return certificate, reading_key
+        return None
+
+    def __len__(self) -> int:
+        return len(self._certificates)
+
+    def __iter__(self) -> Iterator[PKCS12Certificate]:
+        return iter(list(self._certificates.values()))
+
+    def __contains__(self, certificate: PKCS12Certificate) -> bool:
+        return certificate.reader_index_key in self._certificates
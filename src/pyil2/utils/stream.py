@@ -0,0 +1,311 @@
+# Copyright (c) 2024, InterlockLedger Network
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+from contextlib import contextmanager
+from email.message import Message
+import io
+import mmap
+import os
+import re
+import stat
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+)
+import requests
+import urllib3
+
+BytesLike = bytes | bytearray | memoryview | mmap.mmap
+
+
+class UploadStream:
+    """
+    Iterable body to upload a document in chunks without holding it in memory.
+
+    The source can be:
+
+    * a bytes-like object (:obj:`bytes`, :obj:`bytearray`, :obj:`memoryview` or \
+        :obj:`mmap.mmap`): the chunks are memoryview slices of the source, so no data is copied;
+    * a binary file object: the chunks are read from the current position of the file;
+    * an iterable of bytes-like chunks: the chunks are sent as they are.
+
+    If the size of the stream is known, it is sent as the `Content-Length` of the request. \
+        Otherwise, the request uses chunked transfer encoding.
+
+    Args:
+        source (`bytes`/`memoryview`/`mmap.mmap`/`file`/`Iterable`): Data to be uploaded.
+        size (:obj:`int`): Number of bytes of the source. If `None`, it is taken from the \
+            source when possible.
+        chunk_size (:obj:`int`): Size of the chunks read from bytes-like and file sources.
+        progress (`Callable`): Function called after each chunk is sent with the number \
+            of bytes sent so far and the total size (or `None` if unknown).
+
+    Attributes:
+        size (:obj:`int`): Number of bytes of the source (`None` if unknown).
+    """
+
+    def __init__(
+            self,
+            source: BytesLike | io.RawIOBase | io.BufferedIOBase | Iterable[BytesLike],
+            size: int = None,
+            chunk_size: int = 1024 * 1024,
+            progress: Callable[[int, int | None], None] = None,
+        ) -> None:
+        if chunk_size < 1:
+            raise ValueError('The chunk size must be at least 1.')
+        self._source = source
+        self.chunk_size = chunk_size
+        self.progress = progress
+        if size is None:
+            size = self._source_size(source)
+        self.size = size
+
+    @staticmethod
+    def _source_size(source) -> int | None:
+        if isinstance(source, (bytes, bytearray, memoryview, mmap.mmap)):
+            return memoryview(source).nbytes
+        if hasattr(source, 'read'):
+            try:
+                file_stat = os.fstat(source.fileno())
+                if stat.S_ISREG(file_stat.st_mode):
+                    return file_stat.st_size - source.tell()
+            except (AttributeError, OSError, io.UnsupportedOperation):
+                pass
+            if getattr(source, 'seekable', lambda: False)():
+                position = source.tell()
+                size = source.seek(0, os.SEEK_END) - position
+                source.seek(position)
+                return size
+        return None
+
+    def _chunks(self) -> Iterator[BytesLike]:
+        source = self._source
+        if isinstance(source, (bytes, bytearray, memoryview, mmap.mmap)):
+            with memoryview(source) as view:
+                view = view.cast('B')
+                for start in range(0, view.nbytes, self.chunk_size):
+                    yield view[start:start + self.chunk_size]
+        elif hasattr(source, 'read'):
+            while chunk := source.read(self.chunk_size):
+                yield chunk
+        else:
+            yield from source
+
+    def __iter__(self) -> Iterator[BytesLike]:
+        sent = 0
+        for chunk in self._chunks():
+            yield chunk
+            sent += memoryview(chunk).nbytes
+            if self.progress:
+                self.progress(sent, self.size)
+
+    def __len__(self) -> int:
+        if self.size is None:
+            raise TypeError('The size of the stream is unknown.')
+        return self.size
+
+    def __bool__(self) -> bool:
+        return True
+
+
+@contextmanager
+def map_file(f: io.BufferedIOBase) -> Iterator[BytesLike]:
+    """
+    Map a file opened in binary mode to memory for reading.
+
+    Args:
+        f (`file`): File opened in binary mode.
+
+    Yields:
+        :obj:`mmap.mmap`: The memory-mapped file (an empty :obj:`bytes` if the file is empty).
+    """
+    if os.fstat(f.fileno()).st_size == 0:
+        yield b''
+        return
+    mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        yield mapped
+    finally:
+        try:
+            mapped.close()
+        except BufferError:
+            # A chunk is still referenced (e.g. by an exception traceback).
+            # The map is closed when it is garbage collected.
+            pass
+
+
+def content_disposition_filename(content_disposition: str) -> str | None:
+    """
+    Get the file name from a `Content-Disposition` header.
+
+    The extended `filename*` parameter (RFC 6266) is preferred over the `filename` parameter. \
+        Quoted names may contain semicolons and spaces. Any directory in the name is removed.
+
+    Args:
+        content_disposition (:obj:`str`): Value of the `Content-Disposition` header.
+
+    Returns:
+        :obj:`str`: File name (`None` if the header has no file name).
+    """
+    if not content_disposition:
+        return None
+    message = Message()
+    message['content-disposition'] = content_disposition
+    filename = message.get_filename()
+    if not filename:
+        return None
+    return os.path.basename(filename.replace('\\', '/')) or None
+
+
+class DownloadStream:
+    """
+    Iterator over the chunks of a file download that resumes interrupted transfers.
+
+    If the connection drops, the download is requested again with an HTTP `Range` \
+        header starting at the first byte not yet received.
+
+    Args:
+        open_response (`Callable`): Function that sends the download request with the \
+            given extra headers and returns the streamed response.
+        response (:obj:`requests.Response`): Response of the first request.
+        offset (:obj:`int`): Position of the first byte requested in the first request.
+        chunk_size (:obj:`int`): Size of the chunks.
+        max_retries (:obj:`int`): Maximum number of consecutive resume attempts.
+        progress (`Callable`): Function called after each chunk is received with the \
+            number of bytes received so far (including the offset) and the total size \
+            (or `None` if unknown).
+
+    Attributes:
+        filename (:obj:`str`): File name in the `Content-Disposition` header.
+        etag (:obj:`str`): `ETag` header of the file (`None` if not sent by the node).
+        size (:obj:`int`): Total size of the file (`None` if unknown).
+        position (:obj:`int`): Number of bytes received so far (including the offset).
+    """
+
+    def __init__(
+            self,
+            open_response: Callable[[Dict[str, str]], requests.Response],
+            response: requests.Response,
+            offset: int = 0,
+            chunk_size: int = 1024 * 1024,
+            max_retries: int = 3,
+            progress: Callable[[int, int | None], None] = None,
+        ) -> None:
+        self._open_response = open_response
+        self._response = response
+        self.chunk_size = chunk_size
+        self.max_retries = max_retries
+        self.progress = progress
+        self.position = offset
+        self.filename = content_disposition_filename(
+            response.headers.get('content-disposition'))
+        self.etag = response.headers.get('etag')
+        self._skip = self._bytes_to_skip(response, offset)
+        self.size = self._total_size(response, offset - self._skip)
+
+    @staticmethod
+    def _bytes_to_skip(response: requests.Response, position: int) -> int:
+        if response.status_code != 206:
+            return position
+        match = re.match(r'bytes (\d+)-', response.headers.get('content-range', ''))
+        start = int(match.group(1)) if match else 0
+        return position - start
+
+    @staticmethod
+    def _total_size(response: requests.Response, start: int) -> int | None:
+        match = re.match(r'bytes \d+-\d+/(\d+)', response.headers.get('content-range', ''))
+        if match:
+            return int(match.group(1))
+        length = response.headers.get('content-length')
+        if length is None or response.headers.get('content-encoding'):
+            return None
+        return start + int(length)
+
+    def __iter__(self) -> Iterator[bytes]:
+        retries = 0
+        while True:
+            try:
+                for chunk in self._response.raw.stream(self.chunk_size, decode_content=False):
+                    if self._skip:
+                        skipped = min(self._skip, len(chunk))
+                        self._skip -= skipped
+                        chunk = chunk[skipped:]
+                        if not chunk:
+                            continue
+                    self.position += len(chunk)
+                    retries = 0
+                    if self.progress:
+                        self.progress(self.position, self.size)
+                    yield chunk
+                if self.size is None or self.position >= self.size:
+                    break
+            except (urllib3.exceptions.HTTPError, requests.RequestException, OSError):
+                if retries >= self.max_retries:
+                    raise
+            self._response.close()
+            if retries >= self.max_retries:
+                raise ConnectionError(
+                    f'Download interrupted after {self.position} of {self.size} bytes.')
+            retries += 1
+            self._resume()
+        self.close()
+
+    def _resume(self) -> None:
+        headers = {'Range': f'bytes={self.position}-'}
+        if self.etag:
+            headers['If-Range'] = self.etag
+        response = self._open_response(headers)
+        if not 200 <= response.status_code < 300:
+            response.close()
+            raise ConnectionError(
+                f'Failed to resume the download at byte {self.position} '
+                f'(status {response.status_code}).'
+            )
+        etag = response.headers.get('etag')
+        if response.status_code != 206 and self.etag and etag != self.etag:
+            response.close()
+            raise ConnectionError('The file changed while it was downloaded.')
+        self._response = response
+        self._skip = self._bytes_to_skip(response, self.position)
+        if self._skip < 0:
+            self.close()
+            raise ConnectionError(
+                f'The node resumed the download after byte {self.position}.')
+
+    def close(self) -> None:
+        """
+        Close the connection of the download.
+        """
+        self._response.close()
+
+    def __enter__(self) -> 'DownloadStream':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
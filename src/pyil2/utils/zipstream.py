@@ -0,0 +1,252 @@
+# Copyright (c) 2024, InterlockLedger Network
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+import io
+import struct
+from typing import (
+    Iterable,
+    Iterator,
+    Tuple,
+)
+import zipfile
+import zlib
+
+_LOCAL_FILE_HEADER = struct.Struct('<4s5H3L2H')
+_LOCAL_FILE_SIGNATURE = b'PK\x03\x04'
+_DATA_DESCRIPTOR_SIGNATURE = b'PK\x07\x08'
+_END_SIGNATURES = (b'PK\x01\x02', b'PK\x05\x06', b'PK\x06\x06')
+_ZIP64_EXTRA_ID = 0x0001
+_ZIP64_LIMIT = 0xFFFFFFFF
+_FLAG_ENCRYPTED = 0x0001
+_FLAG_DATA_DESCRIPTOR = 0x0008
+_FLAG_UTF8 = 0x0800
+_READ_SIZE = 64 * 1024
+
+
+class _ChunkReader:
+    """
+    Reads bytes from an iterable of chunks, with support to push back unused bytes.
+    """
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
+        self._pending = memoryview(b'')
+
+    def read_some(self, size: int) -> bytes:
+        while not self._pending:
+            try:
+                self._pending = memoryview(next(self._chunks)).cast('B')
+            except StopIteration:
+                return b''
+        data = self._pending[:size]
+        self._pending = self._pending[size:]
+        return bytes(data)
+
+    def read_exactly(self, size: int) -> bytes:
+        data = b''
+        while len(data) < size:
+            part = self.read_some(size - len(data))
+            if not part:
+                raise zipfile.BadZipFile('Truncated zip stream.')
+            data += part
+        return data
+
+    def at_end(self) -> bool:
+        if self._pending:
+            return False
+        data = self.read_some(1)
+        self.unread(data)
+        return not data
+
+    def unread(self, data: bytes) -> None:
+        if data:
+            self._pending = memoryview(data + bytes(self._pending))
+
+
+class ZipEntryStream(io.RawIOBase):
+    """
+    Read-only file-like object with the content of an entry of a zip stream.
+
+    The content is decompressed while it is read, and its CRC-32 is checked when the end \
+        of the entry is reached. The stream is only valid until the next entry is requested.
+
+    Attributes:
+        name (:obj:`str`): Path of the entry in the zip file.
+        file_size (:obj:`int`): Uncompressed size of the entry (`None` if not yet known).
+    """
+
+    def __init__(
+            self,
+            reader: _ChunkReader,
+            name: str,
+            flags: int,
+            method: int,
+            crc: int,
+            compressed_size: int,
+            file_size: int,
+            zip64: bool,
+        ) -> None:
+        super().__init__()
+        self.name = name
+        self._reader = reader
+        self._flags = flags
+        self._zip64 = zip64
+        has_sizes = not flags & _FLAG_DATA_DESCRIPTOR
+        self.file_size = file_size if has_sizes else None
+        self._expected_crc = crc if has_sizes else None
+        self._remaining = compressed_size if has_sizes else None
+        if name.endswith('/') and method == zipfile.ZIP_STORED:
+            self._remaining = self._remaining or 0
+        if method == zipfile.ZIP_DEFLATED:
+            self._decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+        elif self._remaining is None:
+            raise zipfile.BadZipFile(
+                f'Entry {name!r} is stored without its size and cannot be streamed.')
+        else:
+            self._decompressor = None
+        self._crc = 0
+        self._size = 0
+        self._output = b''
+        self._offset = 0
+        self._at_end = False
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self._read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+    def _read(self, size: int) -> bytes:
+        while self._offset >= len(self._output) and not self._at_end:
+            self._fill(size)
+        data = self._output[self._offset:self._offset + size]
+        self._offset += len(data)
+        return data
+
+    def _fill(self, size: int) -> None:
+        if self._decompressor is None:
+            if self._remaining:
+                data = self._reader.read_exactly(min(size, self._remaining, _READ_SIZE))
+                self._remaining -= len(data)
+                self._update(data)
+            if not self._remaining:
+                self._finish()
+            return
+        data = self._decompressor.unconsumed_tail
+        if not data:
+            read_size = _READ_SIZE if self._remaining is None else \
+                min(_READ_SIZE, self._remaining)
+            data = self._reader.read_some(read_size)
+            if not data:
+                raise zipfile.BadZipFile(f'Truncated data of entry {self.name!r}.')
+            if self._remaining is not None:
+                self._remaining -= len(data)
+        self._update(self._decompressor.decompress(data, max(size, _READ_SIZE)))
+        if self._decompressor.eof:
+            self._reader.unread(self._decompressor.unused_data)
+            self._finish()
+
+    def _update(self, data: bytes) -> None:
+        self._crc = zlib.crc32(data, self._crc)
+        self._size += len(data)
+        self._output = data
+        self._offset = 0
+
+    def _finish(self) -> None:
+        self._at_end = True
+        if self._flags & _FLAG_DATA_DESCRIPTOR:
+            signature = self._reader.read_exactly(4)
+            if signature == _DATA_DESCRIPTOR_SIGNATURE:
+                signature = self._reader.read_exactly(4)
+            self._expected_crc = struct.unpack('<L', signature)[0]
+            sizes = self._reader.read_exactly(16 if self._zip64 else 8)
+            self.file_size = struct.unpack('<QQ' if self._zip64 else '<LL', sizes)[1]
+        if self._crc != self._expected_crc or self._size != self.file_size:
+            raise zipfile.BadZipFile(f'Bad CRC-32 for file {self.name!r}')
+
+    def _skip(self) -> None:
+        while not self._at_end:
+            self._fill(_READ_SIZE)
+
+
+def iter_zip_entries(chunks: Iterable[bytes]) -> Iterator[Tuple[str, ZipEntryStream]]:
+    """
+    Iterate over the entries of a zip file while it is received, without saving it.
+
+    The entries are read from their local headers, in the order they are stored, \
+        so the central directory at the end of the file is never needed. \
+        If an entry is not fully read before the next one is requested, the rest of \
+        its content is skipped. Directory entries are not returned.
+
+    Args:
+        chunks ([:obj:`bytes`]): Iterable with the chunks of the zip file \
+            (e.g. a :obj:`pyil2.utils.stream.DownloadStream`).
+
+    Returns:
+        [(:obj:`str`, :obj:`ZipEntryStream`)]: Iterator of the path and the content of each entry.
+
+    Raises:
+        zipfile.BadZipFile: If the stream is not a valid zip file, an entry is corrupted \
+            or encrypted, uses a compression method other than deflate, or is stored \
+            without its size.
+    """
+    reader = _ChunkReader(chunks)
+    while not reader.at_end():
+        signature = reader.read_exactly(4)
+        if signature in _END_SIGNATURES:
+            return
+        if signature != _LOCAL_FILE_SIGNATURE:
+            raise zipfile.BadZipFile('Bad magic number for file header')
+        (
+            _, _, flags, method, _, _, crc, compressed_size, file_size,
+            name_length, extra_length
+        ) = _LOCAL_FILE_HEADER.unpack(signature + reader.read_exactly(26))
+        name = reader.read_exactly(name_length).decode(
+            'utf-8' if flags & _FLAG_UTF8 else 'cp437')
+        extra = reader.read_exactly(extra_length)
+        if flags & _FLAG_ENCRYPTED:
+            raise zipfile.BadZipFile(f'Entry {name!r} is encrypted.')
+        if method not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+            raise zipfile.BadZipFile(f'Entry {name!r} uses an unsupported compression method.')
+        zip64 = False
+        while len(extra) >= 4:
+            extra_id, size = struct.unpack('<HH', extra[:4])
+            if extra_id == _ZIP64_EXTRA_ID:
+                zip64 = True
+                values = list(struct.unpack(f'<{size // 8}Q', extra[4:4 + size // 8 * 8]))
+                if file_size == _ZIP64_LIMIT and values:
+                    file_size = values.pop(0)
+                if compressed_size == _ZIP64_LIMIT and values:
+                    compressed_size = values.pop(0)
+            extra = extra[4 + size:]
+        entry = ZipEntryStream(
+            reader, name, flags, method, crc, compressed_size, file_size, zip64)
+        if not name.endswith('/'):
+            yield name, entry
+        entry._skip()
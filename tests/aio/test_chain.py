@@ -0,0 +1,53 @@
+# Copyright (c) 2024, InterlockLedger Network
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+from .base import BaseAsyncApiTest
+from src.pyil2.models import (
+    chain as chain_models,
+    errors,
+)
+
+
+class AsyncChainApiTest(BaseAsyncApiTest):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.api = self.client.api('chain')
+
+    async def test_list_chains(self):
+        chains = await self.api.list_chains()
+        self.assertIsInstance(chains, list)
+        for item in chains:
+            self.assertIsInstance(item, chain_models.ChainIdModel)
+
+    async def test_chain_summary(self):
+        chain = await self.api.summary(self.default_chain)
+        self.assertIsInstance(chain, chain_models.ChainSummaryModel)
+        self.assertEqual(chain.id, self.default_chain)
+
+    async def test_chain_summary_invalid(self):
+        chain = await self.api.summary('invalid_chain')
+        self.assertIsInstance(chain, errors.ErrorDetailsModel)
@@ -0,0 +1,67 @@
+# Copyright (c) 2024, InterlockLedger Network
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+import os
+from .base import BaseAsyncApiTest
+from src.pyil2.models import documents as documents_models
+
+
+class AsyncDocumentsApiTest(BaseAsyncApiTest):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.api = self.client.api('documents')
+
+    async def test_documents_configuration(self):
+        config = await self.api.documents_configuration
+        self.assertIsInstance(
+            config, documents_models.DocumentUploadConfigurationModel)
+
+    async def test_document_upload(self):
+        new_transaction = documents_models.BeginDocumentTransactionModel(
+            chain=self.default_chain
+        )
+        transaction = await self.api.begin_document_transaction(new_transaction)
+        self.assertIsInstance(
+            transaction, documents_models.DocumentTransactionModel)
+
+        transaction = await self.api.upload_document_file(
+            transaction_id=transaction.transaction_id,
+            filepath=__file__,
+            content_type='text/plain',
+        )
+        self.assertIsInstance(
+            transaction, documents_models.DocumentTransactionModel)
+        self.assertGreaterEqual(len(transaction.document_names), 1)
+
+        locator = await self.api.commit_document_transaction(
+            transaction.transaction_id)
+        self.assertIsInstance(locator, str)
+
+        document_path = await self.api.download_single_document_at(locator, 0)
+        self.assertIsInstance(document_path, str)
+        self.assertTrue(os.path.exists(document_path))
+        os.remove(document_path)
@@ -0,0 +1,52 @@
+# Copyright (c) 2024, InterlockLedger Network
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+from .base import BaseAsyncApiTest
+from src.pyil2.utils.certificates import PKCS12Certificate
+from src.pyil2.models.json import JsonDocumentModel
+
+
+class AsyncJsonApiTest(BaseAsyncApiTest):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.api = self.client.api('json')
+        self.certificate = PKCS12Certificate(self.filepath, self.password)
+
+    async def test_add_json_document(self):
+        payload = {
+            'attr': 'value'
+        }
+        resp = await self.api.add_json_document(self.default_chain, payload)
+        self.assertIsInstance(resp, JsonDocumentModel)
+        decrypted = resp.encrypted_json.decode(self.certificate)
+        self.assertDictEqual(decrypted, payload)
+
+        resp_from_get = await self.api.get_json_document(
+            self.default_chain, resp.serial)
+        self.assertIsInstance(resp_from_get, JsonDocumentModel)
+        decrypted = resp_from_get.encrypted_json.decode(self.certificate)
+        self.assertDictEqual(decrypted, payload)
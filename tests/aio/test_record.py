@@ -0,0 +1,89 @@
+# Copyright (c) 2024, InterlockLedger Network
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+import asyncio
+from .base import BaseAsyncApiTest
+from src.pyil2.models.base import ListModel
+from src.pyil2.models import record as record_models
+
+
+class AsyncRecordApiTest(BaseAsyncApiTest):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.api = self.client.api('record')
+
+    async def test_list_records(self):
+        records = await self.api.list_records(self.default_chain)
+        self.assertIsInstance(records, ListModel)
+        for item in records.items:
+            self.assertIsInstance(item, record_models.RecordModel)
+        if records.items:
+            self.assertEqual(records.items[0].serial, 0)
+
+    async def test_get_record_at_concurrently(self):
+        records = await asyncio.gather(
+            *[self.api.get_record_at(self.default_chain, serial) for serial in range(3)]
+        )
+        for serial, item in enumerate(records):
+            self.assertIsInstance(item, record_models.RecordModel)
+            self.assertEqual(item.serial, serial)
+
+    async def test_list_records_as_json(self):
+        records = await self.api.list_records_as_json(self.default_chain)
+        self.assertIsInstance(records, ListModel)
+        for item in records.items:
+            self.assertIsInstance(item, record_models.RecordAsJsonModel)
+
+    async def test_iter_records(self):
+        serials = [
+            item.serial
+            async for item in self.api.iter_records(self.default_chain, size=10)
+        ]
+        self.assertEqual(serials, list(range(len(serials))))
+
+    async def test_iter_records_read_ahead(self):
+        serials = [
+            item.serial
+            async for item in self.api.iter_records(
+                self.default_chain, size=10, read_ahead=True)
+        ]
+        self.assertEqual(serials, list(range(len(serials))))
+
+    async def test_iter_records_parallel(self):
+        serials = [
+            item.serial
+            async for item in self.api.iter_records(
+                self.default_chain, size=10, workers=4, max_buffered_pages=6)
+        ]
+        self.assertEqual(serials, list(range(len(serials))))
+
+    async def test_iter_query(self):
+        records = self.api.iter_query(
+            self.default_chain, query="USE APP #3\nEVERYTHING", size=2)
+        async for item in records:
+            self.assertIsInstance(item, record_models.RecordModel)
+            self.assertEqual(item.application_id, 3)
@@ -27,7 +27,11 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 from unittest import TestCase
 from src.pyil2.client import IL2Client
+from src.pyil2.transports import FakeTransport, TransportResponse
+from ..helpers import create_test_certificate
+import json
 import os
+import tempfile
 
 
 class BaseApiTest(TestCase):
@@ -49,3 +53,48 @@ class BaseApiTest(TestCase):
             timeout=100,
             verify_ca=False,
         )
+
+
+class FakeApiTest(TestCase):
+    """
+    Base class of the offline API tests. The requests of `self.client` are \
+        answered by `self.handle` instead of a node.
+    """
+
+    def setUp(self):
+        folder = tempfile.TemporaryDirectory()
+        self.addCleanup(folder.cleanup)
+        self.client = IL2Client(
+            host='https://localhost:32020',
+            cert_filepath=create_test_certificate(folder.name),
+            cert_password='password',
+            transport=FakeTransport(self._handle),
+        )
+
+    def _handle(self, method, url, headers, params, body):
+        return self.handle(method, url[len(self.client.host):], params, body)
+
+    network = 'FakeNetwork'
+
+    def handle(self, method: str, path: str, params: dict, body: bytes) -> TransportResponse:
+        if path == '':
+            return self.json_response(200, {
+                'id': 'node',
+                'name': 'Fake node',
+                'network': self.network,
+                'ownerId': 'owner',
+                'ownerName': 'Owner',
+                'color': 'Blue',
+                'softwareVersions': {
+                    'coreLibs': '1.0', 'main': '1.0', 'peer2Peer': '1.0', 'tags': '1.0'},
+                'peerAddress': 'localhost:32021',
+            })
+        return self.json_response(404, {'title': 'Not found', 'status': 404})
+
+    @staticmethod
+    def json_response(status_code: int, data, headers: dict = None) -> TransportResponse:
+        return TransportResponse(
+            status_code,
+            headers={'Content-Type': 'application/json', **(headers or {})},
+            content=json.dumps(data).encode('utf-8'),
+        )
@@ -26,12 +26,17 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 from pydantic import ValidationError
-from .base import BaseApiTest
+from unittest import mock
+from .base import BaseApiTest, FakeApiTest
 import requests
 import os
+import tempfile
 import zipfile
+import datetime
+import time
 from src.pyil2.models.errors import ErrorDetailsModel
 from src.pyil2.models import documents as documents_models
+from src.pyil2.transports import TransportResponse
 
 
 class DocumentsApiTest(BaseApiTest):
@@ -173,6 +178,184 @@ class DocumentsApiTest(BaseApiTest):
 
         os.remove(filepath)
 
+    def test_document_upload_stream(self):
+        new_transaction = documents_models.BeginDocumentTransactionModel(
+            chain=self.default_chain
+        )
+        transaction = self.api.begin_document_transaction(new_transaction)
+        self.assertIsInstance(
+            transaction, documents_models.DocumentTransactionModel)
+
+        progress = []
+        transaction = self.api.upload_document_stream(
+            transaction_id=transaction.transaction_id,
+            filename='stream.txt',
+            content_type='text/plain',
+            source=(b'chunk %d\n' % i for i in range(10)),
+            size=80,
+            progress=lambda sent, total: progress.append((sent, total)),
+        )
+        self.assertIsInstance(
+            transaction, documents_models.DocumentTransactionModel)
+        self.assertIn('stream.txt', transaction.document_names)
+        self.assertEqual(progress[-1], (80, 80))
+
+        transaction = self.api.upload_document_stream(
+            transaction_id=transaction.transaction_id,
+            filename='view.txt',
+            content_type='text/plain',
+            source=memoryview(b'Test memoryview.'),
+            chunk_size=4,
+        )
+        self.assertIsInstance(
+            transaction, documents_models.DocumentTransactionModel)
+        self.assertIn('view.txt', transaction.document_names)
+
+        locator = self.api.commit_document_transaction(
+            transaction.transaction_id)
+        self.assertIsInstance(locator, str)
+
+    def test_document_download_stream(self):
+        new_transaction = documents_models.BeginDocumentTransactionModel(
+            chain=self.default_chain
+        )
+        transaction = self.api.begin_document_transaction(new_transaction)
+        self.assertIsInstance(
+            transaction, documents_models.DocumentTransactionModel)
+
+        content = b'0123456789' * 1000
+        transaction = self.api.upload_document(
+            transaction_id=transaction.transaction_id,
+            filename='download.txt',
+            content_type='text/plain',
+            file_bytes=content,
+        )
+        locator = self.api.commit_document_transaction(
+            transaction.transaction_id)
+        self.assertIsInstance(locator, str)
+
+        progress = []
+        with self.api.download_single_document_at_as_stream(
+                locator, 0, chunk_size=1024,
+                progress=lambda received, total: progress.append((received, total))) as stream:
+            self.assertEqual(stream.filename, 'download.txt')
+            self.assertEqual(b''.join(stream), content)
+        self.assertEqual(progress[-1], (len(content), len(content)))
+
+        with self.api.download_single_document_at_as_stream(locator, 0, offset=5000) as stream:
+            self.assertEqual(b''.join(stream), content[5000:])
+
+        with self.api.download_documents_as_zip_as_stream(locator) as stream:
+            self.assertGreater(len(b''.join(stream)), 0)
+
+        with tempfile.TemporaryDirectory() as dst_path:
+            document_path = self.api.download_single_document_at(
+                locator, 0, dst_path=dst_path, chunk_size=1024)
+            self.assertIsInstance(document_path, str)
+            with open(document_path, 'rb') as f:
+                self.assertEqual(f.read(), content)
+            self.assertFalse(os.path.exists(document_path + '.part'))
+
+    def test_document_upload_stream_size_limit(self):
+        config = self.api.documents_configuration
+        if not config.file_size_limit:
+            self.skipTest('The node has no file size limit.')
+        with self.assertRaises(ValueError):
+            self.api.upload_document_stream(
+                transaction_id='not_used',
+                filename='big.bin',
+                content_type='application/octet-stream',
+                source=iter([]),
+                size=config.file_size_limit + 1,
+            )
+
+    def test_upload_directory(self):
+        with tempfile.TemporaryDirectory() as directory:
+            os.makedirs(os.path.join(directory, 'sub'))
+            for name in ('file1.txt', 'file2.txt', os.path.join('sub', 'file3.txt')):
+                with open(os.path.join(directory, name), 'wb') as f:
+                    f.write(name.encode())
+            progress = []
+            locator = self.api.upload_directory(
+                documents_models.BeginDocumentTransactionModel(chain=self.default_chain),
+                directory,
+                workers=2,
+                progress=lambda uploaded, total: progress.append((uploaded, total)),
+            )
+        self.assertIsInstance(locator, str)
+        self.assertEqual(progress[-1], (3, 3))
+
+        metadata = self.api.get_document_metadata(locator)
+        self.assertIsInstance(metadata, documents_models.DocumentMetadataModel)
+        paths = {entry.name: entry.path for entry in metadata.public_directory}
+        self.assertEqual(paths.get('file3.txt'), '/sub')
+
+    def test_download_all_documents(self):
+        with tempfile.TemporaryDirectory() as directory:
+            os.makedirs(os.path.join(directory, 'sub'))
+            for name in ('file1.txt', os.path.join('sub', 'file2.txt')):
+                with open(os.path.join(directory, name), 'wb') as f:
+                    f.write(name.encode())
+            locator = self.api.upload_directory(
+                documents_models.BeginDocumentTransactionModel(chain=self.default_chain),
+                directory,
+                workers=1,
+            )
+        self.assertIsInstance(locator, str)
+
+        with tempfile.TemporaryDirectory() as dst_path:
+            progress = []
+            manifest = self.api.download_all_documents(
+                locator,
+                dst_path,
+                workers=2,
+                progress=lambda downloaded, total: progress.append((downloaded, total)),
+            )
+            self.assertIsInstance(manifest, list)
+            self.assertEqual(progress[-1], (2, 2))
+            self.assertEqual([entry.index for entry in manifest], [0, 1])
+            for entry in manifest:
+                self.assertIsInstance(entry, documents_models.DownloadedDocumentModel)
+                self.assertEqual(os.path.getsize(entry.filepath), entry.size)
+            self.assertTrue(
+                os.path.isfile(os.path.join(dst_path, 'sub', 'file2.txt')))
+
+    def test_download_documents_as_zip_entries(self):
+        new_transaction = documents_models.BeginDocumentTransactionModel(
+            chain=self.default_chain
+        )
+        transaction = self.api.begin_document_transaction(new_transaction)
+        self.assertIsInstance(
+            transaction, documents_models.DocumentTransactionModel)
+        content = b'zip entry content' * 100
+        transaction = self.api.upload_document(
+            transaction_id=transaction.transaction_id,
+            filename='entry.txt',
+            content_type='text/plain',
+            file_bytes=content,
+        )
+        locator = self.api.commit_document_transaction(
+            transaction.transaction_id)
+        self.assertIsInstance(locator, str)
+
+        entries = self.api.download_documents_as_zip_entries(locator)
+        self.assertNotIsInstance(entries, ErrorDetailsModel)
+        contents = {name: entry.read() for name, entry in entries}
+        self.assertEqual(contents.get('entry.txt'), content)
+
+    def test_download_all_documents_not_found(self):
+        locator = '5UbuoGcVVsWuYLmphZn2C4Lj6Cj7jtdxFzasnWaJuYzt'
+        resp = self.api.download_all_documents(locator)
+        self.assertIsInstance(resp, ErrorDetailsModel)
+
+    def test_upload_files_invalid_transaction(self):
+        with tempfile.NamedTemporaryFile() as f:
+            resp = self.api.upload_files(
+                documents_models.BeginDocumentTransactionModel(chain='invalid_chain'),
+                [f.name],
+            )
+        self.assertIsInstance(resp, ErrorDetailsModel)
+
     def test_document_upload_encrypted_comment(self):
         doc_comment = 'This is a comment'
         file_comment = 'File comment'
@@ -414,8 +597,164 @@ class DocumentsApiTest(BaseApiTest):
         resp = self.api.download_single_document_at_as_response(locator, 10)
         self.assertIsInstance(resp, ErrorDetailsModel)
 
+    def test_download_zip_entries_not_found(self):
+        locator = '5UbuoGcVVsWuYLmphZn2C4Lj6Cj7jtdxFzasnWaJuYzt'
+        resp = self.api.download_documents_as_zip_entries(locator)
+        self.assertIsInstance(resp, ErrorDetailsModel)
+
     def test_download_zip_response_not_found(self):
         locator = self.default_chain + 'A'
 
         resp = self.api.download_documents_as_zip_as_response(locator)
         self.assertIsInstance(resp, ErrorDetailsModel)
+
+
+class UploadFilesFakeTest(FakeApiTest):
+    def setUp(self):
+        super().setUp()
+        self.api = self.client.api('documents')
+        folder = tempfile.TemporaryDirectory()
+        self.addCleanup(folder.cleanup)
+        self.files = []
+        for i in range(3):
+            filepath = os.path.join(folder.name, f'file{i}.txt')
+            with open(filepath, 'w', encoding='utf-8') as f:
+                f.write(f'content {i}')
+            self.files.append(filepath)
+        self.uploads = []
+        self.failures = {}
+        self.commits = 0
+        self.commit_status = 200
+
+    def handle(self, method, path, params, body):
+        path = path.lstrip('/')
+        if path == 'documents/configuration':
+            return self.json_response(200, {'fileSizeLimit': 1024})
+        if path == 'documents/transaction':
+            return self.json_response(201, self._transaction())
+        if path == 'documents/transaction/tx1/commit':
+            self.commits += 1
+            if self.commit_status != 200:
+                return self.json_response(
+                    self.commit_status, {'title': 'Commit failed', 'status': self.commit_status})
+            return self.json_response(200, 'locator')
+        if path == 'documents/transaction/tx1':
+            name = params['name']
+            self.uploads.append(name)
+            status = self.failures.get(name, [200]).pop(0)
+            if status != 200:
+                return self.json_response(status, {'title': 'Upload failed', 'status': status})
+            return self.json_response(200, self._transaction())
+        return super().handle(method, path, params, body)
+
+    @staticmethod
+    def _transaction():
+        timeout_limit = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(hours=1)
+        return {
+            'chain': 'chain1',
+            'transactionId': 'tx1',
+            'timeOutLimit': timeout_limit.isoformat(),
+        }
+
+    def _upload_files(self, **kwargs):
+        return self.api.upload_files(
+            documents_models.BeginDocumentTransactionModel(chain='chain1'),
+            self.files,
+            retry_delay=0,
+            **kwargs,
+        )
+
+    def test_upload_files(self):
+        self.assertEqual(self._upload_files(), 'locator')
+        self.assertEqual(sorted(self.uploads), ['file0.txt', 'file1.txt', 'file2.txt'])
+        self.assertEqual(self.commits, 1)
+
+    def test_upload_retry(self):
+        self.failures['file1.txt'] = [503, 503, 200]
+        self.assertEqual(self._upload_files(max_retries=2), 'locator')
+        self.assertEqual(self.uploads.count('file1.txt'), 3)
+        self.assertEqual(self.commits, 1)
+
+    def test_upload_retry_exhausted(self):
+        self.failures['file1.txt'] = [503, 503, 503]
+        resp = self._upload_files(max_retries=1)
+        self.assertIsInstance(resp, documents_models.DocumentTransactionErrorModel)
+        self.assertEqual(resp.status, 503)
+        self.assertEqual(self.uploads.count('file1.txt'), 2)
+        self.assertEqual(self.commits, 0)
+
+    def test_upload_not_retried(self):
+        self.failures['file1.txt'] = [400, 200]
+        resp = self._upload_files()
+        self.assertEqual(resp.status, 400)
+        self.assertEqual(self.uploads.count('file1.txt'), 1)
+
+    def test_upload_failed(self):
+        self.failures['file1.txt'] = [400]
+        resp = self._upload_files(workers=1)
+        self.assertIsInstance(resp, documents_models.DocumentTransactionErrorModel)
+        self.assertEqual(resp.status, 400)
+        self.assertEqual(resp.title, 'Upload failed')
+        self.assertEqual(resp.transaction_id, 'tx1')
+        self.assertEqual(self.uploads[:2], ['file0.txt', 'file1.txt'])
+        self.assertEqual(self.commits, 0)
+
+    def test_commit_failed(self):
+        self.commit_status = 500
+        resp = self._upload_files()
+        self.assertIsInstance(resp, documents_models.DocumentTransactionErrorModel)
+        self.assertEqual(resp.status, 500)
+        self.assertEqual(resp.transaction_id, 'tx1')
+
+    def test_upload_exception(self):
+        with mock.patch.object(
+                self.api, 'upload_document_file',
+                side_effect=requests.ConnectionError('connection refused')):
+            with self.assertRaises(requests.ConnectionError) as cm:
+                self._upload_files(max_retries=1)
+        self.assertIn(
+            'The document transaction tx1 was not committed.', cm.exception.__notes__)
+        self.assertEqual(self.commits, 0)
+
+
+class DownloadAllDocumentsFakeTest(FakeApiTest):
+    def setUp(self):
+        super().setUp()
+        self.api = self.client.api('documents')
+        self.entries = [
+            ('a.txt', '/'),
+            ('a.txt', '/'),
+            ('a (1).txt', '/'),
+            ('a.txt', '/sub'),
+        ]
+        self.contents = [f'document {i}'.encode() * 1000 for i in range(len(self.entries))]
+
+    def handle(self, method, path, params, body):
+        if path == 'documents/locator/metadata':
+            return self.json_response(200, {
+                'creationTime': '2024-01-01T00:00:00+00:00',
+                'publicDirectory': [
+                    {'name': name, 'path': entry_path, 'size': len(content)}
+                    for (name, entry_path), content in zip(self.entries, self.contents)
+                ],
+            })
+        if path.startswith('documents/locator/'):
+            index = int(path.split('/')[-1])
+            # Keep the downloads in flight at the same time.
+            time.sleep(0.05)
+            return TransportResponse(200, {
+                'Content-Disposition': f'attachment; filename="{self.entries[index][0]}"',
+                'Content-Length': str(len(self.contents[index])),
+            }, self.contents[index])
+        return super().handle(method, path, params, body)
+
+    def test_same_name_and_path(self):
+        with tempfile.TemporaryDirectory() as dst_path:
+            manifest = self.api.download_all_documents('locator', dst_path, workers=4)
+            self.assertEqual(
+                [os.path.relpath(entry.filepath, dst_path) for entry in manifest],
+                ['a.txt', 'a (2).txt', 'a (1).txt', os.path.join('sub', 'a.txt')],
+            )
+            for entry, content in zip(manifest, self.contents):
+                with open(entry.filepath, 'rb') as f:
+                    self.assertEqual(f.read(), content)
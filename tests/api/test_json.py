@@ -31,7 +31,9 @@ import os
 from src.pyil2.models.base import ListModel
 from src.pyil2.utils.certificates import PKCS12Certificate
 from src.pyil2.models.errors import ErrorDetailsModel
+from src.pyil2.models.record import OpaqueRecordModel
 from src.pyil2.models.json import (
+    EncryptedTextModel,
     JsonDocumentModel,
     AllowedReadersModel,
     AllowedReadersDetailsModel
@@ -65,6 +67,15 @@ class JsonApiTest(BaseApiTest):
         decrypted = resp_from_get.encrypted_json.decode(self.certificate)
         self.assertDictEqual(decrypted, payload)
 
+    def test_add_json_documents_batch(self):
+        payloads = [{'attr': i} for i in range(5)]
+        resps = self.api.add_json_documents_batch(
+            self.default_chain, payloads, max_in_flight=2)
+        self.assertEqual(len(resps), len(payloads))
+        for resp, payload in zip(resps, payloads):
+            self.assertIsInstance(resp, JsonDocumentModel)
+            self.assertDictEqual(resp.encrypted_json.decode(self.certificate), payload)
+
     def test_add_json_with_key(self):
         payload = {
             'attr': 'value'
@@ -79,6 +90,28 @@ class JsonApiTest(BaseApiTest):
         decrypted = resp.encrypted_json.decode(self.certificate_2)
         self.assertDictEqual(decrypted, payload)
 
+    def test_add_client_encrypted_json_document(self):
+        payload = {
+            'attr': 'value'
+        }
+        resp = self.api.add_client_encrypted_json_document(
+            self.default_chain,
+            payload,
+            [
+                (self.certificate.pub_key, self.certificate.key_id),
+                (self.certificate_2.pub_key, self.certificate_2.key_id),
+            ],
+            application_id=100,
+            payload_type_id=300,
+        )
+        self.assertIsInstance(resp, OpaqueRecordModel)
+
+        encrypted_json = self.api.get_client_encrypted_json_document(
+            self.default_chain, resp.serial)
+        self.assertIsInstance(encrypted_json, EncryptedTextModel)
+        self.assertDictEqual(encrypted_json.decode(self.certificate), payload)
+        self.assertDictEqual(encrypted_json.decode(self.certificate_2), payload)
+
     def test_add_json_with_chain_key(self):
         context_id = f"test_readers_{int(datetime.datetime.now().timestamp())}"
         data = {
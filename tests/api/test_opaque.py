@@ -25,10 +25,19 @@
 # CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
-from .base import BaseApiTest
+from concurrent.futures import Future
+import datetime
+import threading
+import time
+import requests
+from unittest import mock
+from .base import BaseApiTest, FakeApiTest
+from src.pyil2.api.opaque import _FLUSH, OpaqueAppender
 from src.pyil2.models.base import ListModel
 from src.pyil2.models.errors import ErrorDetailsModel
 from src.pyil2.models.record import OpaqueRecordModel
+from src.pyil2.transports import TransportResponse
+from src.pyil2.utils.cache import RecordCache
 
 
 class OpaqueApiTest(BaseApiTest):
@@ -118,3 +127,302 @@ class OpaqueApiTest(BaseApiTest):
         )
         self.assertIsInstance(opaques, ListModel)
         self.assertEqual(len(opaques.items), 0)
+
+    def test_add_opaque_batch(self):
+        payloads = [f'batch{i}'.encode() for i in range(10)]
+        opaques = self.api.add_opaque_batch(
+            chain_id=self.default_chain,
+            application_id=13,
+            payload_type_id=1313,
+            payloads=payloads,
+            max_in_flight=4,
+        )
+        self.assertEqual(len(opaques), len(payloads))
+        for opaque, payload in zip(opaques, payloads):
+            self.assertIsInstance(opaque, OpaqueRecordModel)
+            self.assertEqual(opaque.payload_length, len(payload))
+
+    def test_add_opaque_batch_last_changed_serial(self):
+        opaque = self.api.add_opaque(
+            chain_id=self.default_chain,
+            application_id=13,
+            payload_type_id=1313,
+            payload=b'test'
+        )
+        payloads = [f'batch{i}'.encode() for i in range(10)]
+        opaques = self.api.add_opaque_batch(
+            chain_id=self.default_chain,
+            application_id=13,
+            payload_type_id=1313,
+            payloads=payloads,
+            last_changed_serial=opaque.serial,
+            max_in_flight=4,
+        )
+        serials = [item.serial for item in opaques]
+        self.assertEqual(serials, list(range(opaque.serial + 1, opaque.serial + 11)))
+        for serial, payload in zip(serials, payloads):
+            resp = self.api.get_opaque(self.default_chain, serial)
+            self.assertEqual(resp.payload, payload)
+
+    def test_add_opaque_batch_last_changed_serial_error(self):
+        opaques = self.api.add_opaque_batch(
+            chain_id=self.default_chain,
+            application_id=13,
+            payload_type_id=1313,
+            payloads=[b'test'] * 3,
+            last_changed_serial=0,
+        )
+        self.assertEqual(len(opaques), 3)
+        for opaque in opaques:
+            self.assertIsInstance(opaque, ErrorDetailsModel)
+
+    def test_appender(self):
+        with self.api.appender(
+                chain_id=self.default_chain,
+                application_id=13,
+                payload_type_id=1313,
+                max_batch_size=4,
+                flush_interval=0.1) as appender:
+            futures = [appender.append(f'appender{i}'.encode()) for i in range(10)]
+        self.assertTrue(appender.closed)
+        serials = set()
+        for future in futures:
+            opaque = future.result()
+            self.assertIsInstance(opaque, OpaqueRecordModel)
+            serials.add(opaque.serial)
+        self.assertEqual(len(serials), 10)
+
+    def test_appender_flush(self):
+        appender = self.api.appender(
+            chain_id=self.default_chain,
+            application_id=13,
+            payload_type_id=1313,
+            flush_interval=60,
+        )
+        future = appender.append(b'test')
+        self.assertTrue(appender.flush())
+        self.assertTrue(future.done())
+        self.assertIsInstance(future.result(), OpaqueRecordModel)
+        appender.close()
+        with self.assertRaises(RuntimeError):
+            appender.append(b'test')
+
+
+class OpaqueAppenderFakeTest(FakeApiTest):
+    def setUp(self):
+        super().setUp()
+        self.api = self.client.api('opaque')
+        self.last_serial = 0
+        self.lock = threading.Lock()
+        self.release = threading.Event()
+        self.release.set()
+        self.failing_payloads = set()
+
+    def handle(self, method, path, params, body):
+        self.release.wait(10)
+        if body in self.failing_payloads:
+            raise requests.ConnectionError('connection reset')
+        with self.lock:
+            self.last_serial += 1
+            return self.json_response(200, {
+                'chainId': path.split('/')[1],
+                'serial': self.last_serial,
+                'applicationId': params['appId'],
+                'payloadTypeId': params['payloadTypeId'],
+                'payloadLength': len(body),
+                'createdAt': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            })
+
+    def test_close(self):
+        with self.api.appender('chain', 13, 1313, max_batch_size=4, flush_interval=60) as appender:
+            futures = [appender.append(f'payload{i}'.encode()) for i in range(10)]
+        self.assertTrue(appender.closed)
+        serials = {future.result(0).serial for future in futures}
+        self.assertSetEqual(serials, set(range(1, 11)))
+        self.assertTrue(appender.close())
+
+    def test_failing_transport(self):
+        self.failing_payloads = {b'payload1', b'payload4', b'payload6'}
+        appender = self.api.appender('chain', 13, 1313, max_batch_size=8, flush_interval=60)
+        futures = [appender.append(f'payload{i}'.encode()) for i in range(8)]
+        closing = threading.Thread(target=appender.close, daemon=True)
+        closing.start()
+        closing.join(5)
+        self.assertFalse(closing.is_alive())
+        for i in (1, 4, 6):
+            self.assertIsInstance(futures[i].exception(0), requests.ConnectionError)
+        serials = {futures[i].result(0).serial for i in (0, 2, 3, 5, 7)}
+        self.assertSetEqual(serials, set(range(1, 6)))
+        self.assertEqual(self.last_serial, 5)
+
+    def test_close_timeout(self):
+        self.release.clear()
+        self.addCleanup(self.release.set)
+        appender = self.api.appender('chain', 13, 1313, max_batch_size=1, max_pending=1)
+        first = appender.append(b'first')
+        while appender._queue.qsize():
+            time.sleep(0.01)
+        second = appender.append(b'second')
+        start = time.monotonic()
+        self.assertFalse(appender.close(timeout=0.2))
+        self.assertLess(time.monotonic() - start, 2)
+        self.assertFalse(first.done())
+        self.release.set()
+        self.assertEqual(first.result(5).serial, 1)
+        self.assertEqual(second.result(5).serial, 2)
+
+    def test_worker_error(self):
+        error = RuntimeError('send failed')
+        with mock.patch.object(OpaqueAppender, '_send', side_effect=error), \
+                mock.patch('threading.excepthook'):
+            appender = self.api.appender('chain', 13, 1313, max_batch_size=2, flush_interval=60)
+            futures = [appender.append(b'payload') for _ in range(2)]
+            self.assertIs(futures[0].exception(5), error)
+            self.assertIs(futures[1].exception(5), error)
+            appender._worker.join(5)
+        self.assertTrue(appender.closed)
+        self.assertFalse(appender.flush())
+        self.assertFalse(appender.close())
+        with self.assertRaises(RuntimeError):
+            appender.append(b'payload')
+
+    def test_worker_error_pending(self):
+        appender = OpaqueAppender(self.api, 'chain', 13, 1313)
+        appender._queue.put((None, None))
+        appender._worker.join(5)
+        queued = Future()
+        appender._queue.put((b'payload', queued))
+        marker = Future()
+        appender._queue.put((_FLUSH, marker))
+        error = RuntimeError('worker stopped')
+        appender._fail_pending([], error)
+        self.assertIs(queued.exception(0), error)
+        self.assertFalse(marker.result(0))
+        self.assertTrue(appender.closed)
+
+
+class OpaqueApiFakeTest(FakeApiTest):
+    def setUp(self):
+        super().setUp()
+        self.api = self.client.api('opaque')
+        self.last_serial = 5
+        self.lock = threading.Lock()
+        self.conflicts = 0
+        self.opaque_requests = 0
+        self.bad_payload = None
+        self.raising_payload = None
+
+    def handle(self, method, path, params, body):
+        if path == 'opaque/chain':
+            # Vary the latency of the requests, so they reach the node out of order.
+            time.sleep(int(body) % 3 * 0.01)
+            if body == self.bad_payload:
+                return self.json_response(400, {'title': 'Bad payload', 'status': 400})
+            if body == self.raising_payload:
+                raise requests.ConnectionError('connection reset')
+            with self.lock:
+                expected = params.get('lastChangedRecordSerial')
+                if expected is not None and expected != self.last_serial:
+                    self.conflicts += 1
+                    return self.json_response(409, {'title': 'Conflict', 'status': 409})
+                self.last_serial += 1
+                return self.json_response(200, {
+                    'chainId': 'chain',
+                    'serial': self.last_serial,
+                    'applicationId': params['appId'],
+                    'payloadTypeId': params['payloadTypeId'],
+                    'payloadLength': len(body),
+                    'createdAt': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+                })
+        if path == 'opaque/chain@3':
+            self.opaque_requests += 1
+            return TransportResponse(200, {
+                'Content-Type': 'application/octet-stream',
+                'X-App-Id': '13',
+                'X-Payload-Type-Id': '1313',
+                'X-Created-At': '2024-01-01T00:00:00+00:00',
+            }, b'payload')
+        return super().handle(method, path, params, body)
+
+    def test_add_opaque_batch_last_changed_serial(self):
+        payloads = [str(i).encode() for i in range(20)]
+        resp = self.api.add_opaque_batch(
+            'chain', 13, 1313, payloads, last_changed_serial=5, max_in_flight=4)
+        self.assertEqual([opaque.serial for opaque in resp], list(range(6, 26)))
+        self.assertEqual(self.last_serial, 25)
+
+    def test_add_opaque_batch_wrong_last_changed_serial(self):
+        payloads = [str(i).encode() for i in range(5)]
+        resp = self.api.add_opaque_batch(
+            'chain', 13, 1313, payloads, last_changed_serial=3, max_in_flight=4)
+        for item in resp:
+            self.assertIsInstance(item, ErrorDetailsModel)
+        self.assertEqual(resp[0].status, 409)
+        self.assertEqual(self.conflicts, 1)
+        self.assertEqual(self.last_serial, 5)
+
+    def test_add_opaque_batch_stops_after_failure(self):
+        self.bad_payload = b'2'
+        payloads = [str(i).encode() for i in range(10)]
+        resp = self.api.add_opaque_batch(
+            'chain', 13, 1313, payloads, last_changed_serial=5, max_in_flight=4)
+        self.assertEqual([opaque.serial for opaque in resp[:2]], [6, 7])
+        self.assertEqual(resp[2].status, 400)
+        for item in resp[3:]:
+            self.assertIsInstance(item, ErrorDetailsModel)
+        self.assertEqual(self.last_serial, 7)
+
+    def _add_opaque_batch_in_thread(self, *args, **kwargs):
+        results = []
+        thread = threading.Thread(
+            target=lambda: results.append(self.api.add_opaque_batch(*args, **kwargs)),
+            daemon=True,
+        )
+        thread.start()
+        thread.join(5)
+        self.assertFalse(thread.is_alive())
+        return results[0]
+
+    def test_add_opaque_batch_first_raises(self):
+        self.raising_payload = b'0'
+        payloads = [str(i).encode() for i in range(10)]
+        resp = self._add_opaque_batch_in_thread(
+            'chain', 13, 1313, payloads, last_changed_serial=5, max_in_flight=4)
+        self.assertIsInstance(resp[0], requests.ConnectionError)
+        for item in resp[1:]:
+            self.assertIsInstance(item, ErrorDetailsModel)
+        self.assertEqual(self.last_serial, 5)
+
+    def test_add_opaque_batch_raises(self):
+        self.raising_payload = b'2'
+        payloads = [str(i).encode() for i in range(6)]
+        resp = self._add_opaque_batch_in_thread(
+            'chain', 13, 1313, payloads, last_changed_serial=5, max_in_flight=4)
+        self.assertEqual([opaque.serial for opaque in resp[:2]], [6, 7])
+        self.assertIsInstance(resp[2], requests.ConnectionError)
+        self.assertEqual(self.last_serial, 7)
+
+    def test_add_opaque_batch_raises_without_last_changed_serial(self):
+        self.raising_payload = b'2'
+        payloads = [str(i).encode() for i in range(6)]
+        resp = self._add_opaque_batch_in_thread('chain', 13, 1313, payloads, max_in_flight=4)
+        self.assertIsInstance(resp[2], requests.ConnectionError)
+        self.assertSetEqual(
+            {opaque.serial for i, opaque in enumerate(resp) if i != 2}, set(range(6, 11)))
+
+    def test_add_opaque_batch_without_last_changed_serial(self):
+        payloads = [str(i).encode() for i in range(10)]
+        resp = self.api.add_opaque_batch('chain', 13, 1313, payloads, max_in_flight=4)
+        self.assertSetEqual({opaque.serial for opaque in resp}, set(range(6, 16)))
+        self.assertEqual(self.conflicts, 0)
+
+    def test_get_opaque_cached(self):
+        with RecordCache() as cache:
+            self.client.record_cache = cache
+            opaque = self.api.get_opaque('chain', 3)
+            cached = self.api.get_opaque('chain', 3)
+            self.assertEqual(cached, opaque)
+            self.assertEqual(cached.payload, b'payload')
+            self.assertEqual(cached.application_id, 13)
+            self.assertEqual(self.opaque_requests, 1)
+            self.assertEqual((cache.hits, cache.misses), (1, 1))
@@ -25,7 +25,14 @@
 # CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
-from .base import BaseApiTest
+import json
+import os
+import tempfile
+import time
+from unittest import mock
+import requests
+
+from .base import BaseApiTest, FakeApiTest
 from src.pyil2.models.base import ListModel
 from src.pyil2.models import (
     chain as chain_models,
@@ -33,6 +40,7 @@ from src.pyil2.models import (
     keys as keys_models,
     record as record_models,
 )
+from src.pyil2.utils.cache import RecordCache
 
 
 class RecordApiTest(BaseApiTest):
@@ -114,6 +122,16 @@ class RecordApiTest(BaseApiTest):
         self.assertIsInstance(record, record_models.RecordModel)
         self.assertEqual(record.serial, 0)
 
+    def test_get_record_at_cached(self):
+        with RecordCache() as cache:
+            self.client.record_cache = cache
+            record = self.api.get_record_at(self.default_chain, 0)
+            cached = self.api.get_record_at(self.default_chain, 0)
+            self.assertEqual(cached, record)
+            self.assertEqual(cache.hits, 1)
+            self.assertEqual(cache.misses, 1)
+            self.assertEqual(len(cache), 1)
+
     def test_record_query(self):
         chains = self.api.query_records(
             self.default_chain, query="USE APP #3\nEVERYTHING")
@@ -190,3 +208,239 @@ class RecordApiTest(BaseApiTest):
             self.assertIsInstance(item, record_models.RecordAsJsonModel)
             self.assertIsInstance(item.payload, dict)
             self.assertEqual(chains.items[0].application_id, 3)
+
+    def test_iter_records(self):
+        records = list(self.api.iter_records(self.default_chain, size=10))
+        for serial, item in enumerate(records):
+            self.assertIsInstance(item, record_models.RecordModel)
+            self.assertEqual(item.serial, serial)
+
+    def test_iter_records_read_ahead(self):
+        expected = [item.serial for item in self.api.iter_records(self.default_chain, size=10)]
+        serials = [
+            item.serial
+            for item in self.api.iter_records(self.default_chain, size=10, read_ahead=True)
+        ]
+        self.assertEqual(serials, expected)
+
+    def test_iter_records_parallel(self):
+        expected = [item.serial for item in self.api.iter_records(self.default_chain, size=10)]
+        serials = [
+            item.serial
+            for item in self.api.iter_records(
+                self.default_chain,
+                size=10,
+                workers=4,
+                max_buffered_pages=6,
+            )
+        ]
+        self.assertEqual(serials, expected)
+
+    def test_iter_records_invalid_workers(self):
+        with self.assertRaises(ValueError):
+            self.api.iter_records(self.default_chain, workers=0)
+
+    def test_iter_records_last_to_first(self):
+        serials = [
+            item.serial
+            for item in self.api.iter_records(
+                self.default_chain,
+                last_to_first=True,
+                ommit_payload=True,
+                size=10,
+            )
+        ]
+        self.assertEqual(serials, sorted(serials, reverse=True))
+
+    def test_iter_records_invalid_chain(self):
+        records = list(self.api.iter_records('invalid_chain'))
+        self.assertEqual(len(records), 1)
+        self.assertIsInstance(records[0], errors.ErrorDetailsModel)
+
+    def test_iter_query(self):
+        records = self.api.iter_query(
+            self.default_chain,
+            query="USE APP #3\nEVERYTHING",
+            size=2,
+            read_ahead=True,
+        )
+        for item in records:
+            self.assertIsInstance(item, record_models.RecordModel)
+            self.assertEqual(item.application_id, 3)
+
+    def test_iter_records_as_json(self):
+        for item in self.api.iter_records_as_json(self.default_chain, size=10):
+            self.assertIsInstance(item, record_models.RecordAsJsonModel)
+            self.assertIsInstance(item.payload, dict)
+
+    def test_iter_query_as_json(self):
+        records = self.api.iter_query_as_json(
+            self.default_chain, query="USE APP #3\nEVERYTHING", size=2)
+        for item in records:
+            self.assertIsInstance(item, record_models.RecordAsJsonModel)
+            self.assertEqual(item.application_id, 3)
+
+    def _export_filepath(self):
+        fd, filepath = tempfile.mkstemp(suffix='.jsonl')
+        os.close(fd)
+        self.addCleanup(os.remove, filepath)
+        return filepath
+
+    def test_export_chain(self):
+        filepath = self._export_filepath()
+        count = self.api.export_chain(
+            self.default_chain, filepath, range_size=20, page_size=10, workers=4)
+        self.assertIsInstance(count, int)
+        with open(filepath, encoding='utf-8') as f:
+            serials = [json.loads(line)['serial'] for line in f]
+        self.assertEqual(len(serials), count)
+        self.assertEqual(serials, list(range(count)))
+
+    def test_export_chain_columnar(self):
+        filepath = self._export_filepath()
+        count = self.api.export_chain(
+            self.default_chain,
+            filepath,
+            output_format='columnar',
+            last_serial=29,
+            range_size=10,
+            workers=2,
+        )
+        self.assertEqual(count, 30)
+        with open(filepath, encoding='utf-8') as f:
+            chunks = [json.loads(line) for line in f]
+        self.assertEqual(len(chunks), 3)
+        self.assertEqual(chunks[1]['serial'], list(range(10, 20)))
+
+    def test_export_chain_invalid_format(self):
+        with self.assertRaises(ValueError):
+            self.api.export_chain(self.default_chain, 'records.csv', output_format='csv')
+
+
+class RecordApiFakeTest(FakeApiTest):
+    def setUp(self):
+        super().setUp()
+        self.api = self.client.api('record')
+        self.records = [self._record('chain', serial) for serial in range(25)]
+        self.requested_pages = []
+        self.failed_pages = set()
+        self.record_requests = 0
+        self.record_chain = 'chain'
+
+    def handle(self, method, path, params, body):
+        if path == 'records@chain' and method.lower() == 'get':
+            page, size = params['page'], params['pageSize']
+            self.requested_pages.append(page)
+            total_pages = (len(self.records) + size - 1) // size
+            # The first pages take longer, so the pages are received out of order.
+            time.sleep((total_pages - page) * 0.01)
+            if page in self.failed_pages:
+                return self.json_response(503, {'title': 'Unavailable', 'status': 503})
+            return self.json_response(200, {
+                'page': page,
+                'pageSize': size,
+                'totalNumberOfPages': total_pages,
+                'items': self.records[page * size:(page + 1) * size],
+            })
+        if path == 'records@chain' and method.lower() == 'post':
+            application_id = json.loads(body)['applicationId']
+            time.sleep((10 - application_id) * 0.005)
+            return self.json_response(200, self._record('chain', application_id))
+        if path.startswith('records@chain/'):
+            self.record_requests += 1
+            serial = int(path.split('/')[1])
+            return self.json_response(200, self._record(self.record_chain, serial))
+        return super().handle(method, path, params, body)
+
+    def _record(self, chain_id, serial):
+        return {
+            'applicationId': serial,
+            'chainId': chain_id,
+            'createdAt': '2024-01-01T00:00:00+00:00',
+            'network': self.network,
+            'reference': f'{chain_id}@{serial}',
+            'serial': serial,
+            'type': 'Data',
+        }
+
+    def test_iter_records_order(self):
+        records = list(self.api.iter_records('chain', size=3))
+        self.assertEqual([record.serial for record in records], list(range(25)))
+        self.assertEqual(self.requested_pages, list(range(9)))
+
+    def test_iter_records_read_ahead_order(self):
+        records = list(self.api.iter_records('chain', size=3, read_ahead=True))
+        self.assertEqual([record.serial for record in records], list(range(25)))
+
+    def test_iter_records_parallel_order(self):
+        records = list(self.api.iter_records('chain', size=3, workers=4, max_buffered_pages=4))
+        self.assertEqual([record.serial for record in records], list(range(25)))
+        self.assertEqual(sorted(self.requested_pages), list(range(9)))
+
+    def test_iter_records_parallel_error(self):
+        self.failed_pages.add(3)
+        items = list(self.api.iter_records('chain', size=3, workers=4))
+        self.assertEqual([record.serial for record in items[:-1]], list(range(9)))
+        self.assertIsInstance(items[-1], errors.ErrorDetailsModel)
+        self.assertEqual(items[-1].status, 503)
+
+    def test_add_records_batch_order(self):
+        new_records = [
+            record_models.NewRecordModel(application_id=i, payload_bytes=b'payload')
+            for i in range(10)
+        ]
+        records = self.api.add_records_batch('chain', new_records, max_in_flight=4)
+        self.assertEqual([record.serial for record in records], list(range(10)))
+
+    def test_add_records_batch_raises(self):
+        new_records = [
+            record_models.NewRecordModel(application_id=i, payload_bytes=b'payload')
+            for i in range(10)
+        ]
+        add_record = self.api.add_record
+
+        def add_record_raising(chain_id, new_record):
+            if new_record.application_id == 4:
+                raise requests.ConnectionError('connection reset')
+            return add_record(chain_id, new_record)
+
+        with mock.patch.object(self.api, 'add_record', side_effect=add_record_raising):
+            records = self.api.add_records_batch('chain', new_records, max_in_flight=4)
+        self.assertIsInstance(records[4], requests.ConnectionError)
+        self.assertEqual(
+            [record.serial for i, record in enumerate(records) if i != 4],
+            [0, 1, 2, 3, 5, 6, 7, 8, 9],
+        )
+
+    def test_get_record_at_cached(self):
+        with RecordCache() as cache:
+            self.client.record_cache = cache
+            record = self.api.get_record_at('chain', 3)
+            cached = self.api.get_record_at('chain', 3)
+            self.assertEqual(cached, record)
+            self.assertEqual(self.record_requests, 1)
+            self.assertEqual((cache.hits, cache.misses), (1, 1))
+            self.api.get_record_at('chain', 4)
+            self.assertEqual(self.record_requests, 2)
+            self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+    def test_get_record_at_other_chain(self):
+        self.record_chain = 'other'
+        with RecordCache() as cache:
+            self.client.record_cache = cache
+            self.api.get_record_at('chain', 3)
+            self.api.get_record_at('chain', 3)
+            self.assertEqual(self.record_requests, 2)
+            self.assertEqual(len(cache), 0)
+
+    def test_get_record_at_other_network(self):
+        with RecordCache() as cache:
+            self.client.record_cache = cache
+            cache.put(
+                self.network, 'chain', 3, 'record',
+                json.dumps(self._record('chain', 3) | {'network': 'Other'}).encode(), '{}')
+            record = self.api.get_record_at('chain', 3)
+            self.assertEqual(record.network, self.network)
+            self.assertEqual(self.record_requests, 1)
+            self.assertEqual(self.api.get_record_at('chain', 3), record)
+            self.assertEqual(self.record_requests, 1)
@@ -0,0 +1,100 @@
+# Copyright (c) 2024, InterlockLedger Network
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""
+Benchmark of the IL2Client transports reading records concurrently.
+
+It compares the pooled HTTP/1.1 connections of the default transport with the HTTP/2 \
+    multiplexed connection of the httpx transport. It uses the same environment variables \
+    of the tests (TEST_CERTIFICATE_PATH, TEST_CERTIFICATE_PASS, TEST_HOST and TEST_DEFAULT_CHAIN):
+
+    $ python -m tests.benchmark_transports --reads 2000 --workers 8 32 128
+"""
+import argparse
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from src.pyil2.client import IL2Client
+from src.pyil2.http2 import HTTP2Settings
+from src.pyil2.transports import HttpxTransport, RequestsTransport
+
+
+def _transports(workers: int):
+    yield 'HTTP/1.1 pool (requests)', RequestsTransport(pool_maxsize=workers, pool_block=True)
+    yield 'HTTP/1.1 pool (httpx)', HttpxTransport(http2=False, max_connections=workers)
+    yield 'HTTP/2 (httpx)', HttpxTransport(
+        http2_settings=HTTP2Settings(max_concurrent_streams=workers))
+
+
+def run(host: str, filepath: str, password: str, chain_id: str, reads: int, workers: int):
+    for name, transport in _transports(workers):
+        client = IL2Client(
+            host=host,
+            cert_filepath=filepath,
+            cert_password=password,
+            verify_ca=False,
+            transport=transport,
+        )
+        api = client.api('record')
+        summary = client.api('chain').summary(chain_id)
+        records = summary.last_record + 1
+        api.get_record_at(chain_id, 0)
+        start = time.perf_counter()
+        with ThreadPoolExecutor(workers) as executor:
+            for record in executor.map(
+                    lambda serial: api.get_record_at(chain_id, serial % records),
+                    range(reads)):
+                if record.chain_id != chain_id:
+                    raise RuntimeError(f'Failed to read a record: {record}')
+        elapsed = time.perf_counter() - start
+        stats = client.connection_stats
+        print(
+            f'{name:<26} workers={workers:<4} {elapsed:8.3f}s {reads / elapsed:9.1f} reads/s '
+            f'connections={stats["new_connections"]}'
+        )
+        client.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--reads', type=int, default=1000, help='Number of records read.')
+    parser.add_argument(
+        '--workers', type=int, nargs='+', default=[8, 32], help='Number of concurrent reads.')
+    args = parser.parse_args()
+    for workers in args.workers:
+        run(
+            os.environ['TEST_HOST'],
+            os.environ['TEST_CERTIFICATE_PATH'],
+            os.environ['TEST_CERTIFICATE_PASS'],
+            os.environ['TEST_DEFAULT_CHAIN'],
+            args.reads,
+            workers,
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -28,7 +28,11 @@
 from unittest import TestCase
 import os
 from src.pyil2.models import json as json_models
-from src.pyil2.utils.certificates import PKCS12Certificate
+from src.pyil2.utils.certificates import (
+    CertificateKeyring,
+    PKCS12Certificate,
+)
+from src.pyil2.utils.cache import ReadingKeyCache
 
 
 class BaseEncryptedTest(TestCase):
@@ -104,6 +108,116 @@ class EncryptedTextModelTest(BaseEncryptedTest):
         decrypted = encrypted_text.decode(certificate)
         self.assertIsInstance(decrypted, dict)
 
+    def test_decode_key_cache(self):
+        data = {
+            "cipher": "AES256",
+            "cipherText": self.cipher_text,
+            "readingKeys": [
+                {
+                    "encryptedIV": self.encrypted_iv,
+                    "encryptedKey": self.encrypted_key,
+                    "publicKeyHash": self.public_key_hash,
+                    "readerId": self.reader_id
+                }
+            ]
+        }
+        encrypted_text = json_models.EncryptedTextModel(**data)
+        certificate = PKCS12Certificate(self.cert_filepath, self.cert_password)
+        key_cache = ReadingKeyCache(max_entries=4)
+
+        decrypted = encrypted_text.decode(certificate)
+        self.assertDictEqual(encrypted_text.decode(certificate, key_cache=key_cache), decrypted)
+        self.assertDictEqual(encrypted_text.decode(certificate, key_cache=key_cache), decrypted)
+        self.assertEqual(key_cache.misses, 1)
+        self.assertEqual(key_cache.hits, 1)
+        self.assertEqual(key_cache.invalidate_certificate(certificate), 1)
+        self.assertEqual(len(key_cache), 0)
+
+    def test_decode_keyring(self):
+        data = {
+            "cipher": "AES256",
+            "cipherText": self.cipher_text,
+            "readingKeys": [
+                {
+                    "encryptedIV": self.encrypted_iv,
+                    "encryptedKey": self.encrypted_key,
+                    "publicKeyHash": f'Other{i}#SHA256',
+                    "readerId": self.reader_id
+                }
+                for i in range(100)
+            ] + [
+                {
+                    "encryptedIV": self.encrypted_iv,
+                    "encryptedKey": self.encrypted_key,
+                    "publicKeyHash": self.public_key_hash,
+                    "readerId": self.reader_id
+                }
+            ]
+        }
+        encrypted_text = json_models.EncryptedTextModel(**data)
+        self.assertEqual(len(encrypted_text.reading_key_index), 101)
+        certificate = PKCS12Certificate(self.cert_filepath, self.cert_password)
+        certificate_2 = PKCS12Certificate(self.cert_2_filepath, self.cert_2_password)
+
+        decrypted = encrypted_text.decode(certificate)
+        self.assertIsInstance(decrypted, dict)
+        keyring = CertificateKeyring([certificate_2, certificate])
+        self.assertDictEqual(encrypted_text.decode(keyring), decrypted)
+
+        keyring.remove(certificate)
+        with self.assertRaises(ValueError):
+            encrypted_text.decode(keyring)
+
+    def test_decode_many(self):
+        data = {
+            "cipher": "AES256",
+            "cipherText": self.cipher_text,
+            "readingKeys": [
+                {
+                    "encryptedIV": self.encrypted_iv,
+                    "encryptedKey": self.encrypted_key,
+                    "publicKeyHash": self.public_key_hash,
+                    "readerId": self.reader_id
+                }
+            ]
+        }
+        encrypted_texts = [json_models.EncryptedTextModel(**data) for _ in range(10)]
+        certificate = PKCS12Certificate(self.cert_filepath, self.cert_password)
+        decrypted = encrypted_texts[0].decode(certificate)
+
+        results = json_models.decode_many(encrypted_texts, certificate, workers=3)
+        self.assertListEqual(results, [decrypted] * 10)
+
+        results = json_models.iter_decoded(
+            iter(encrypted_texts), certificate, workers=2, use_processes=True,
+            key_cache=ReadingKeyCache())
+        self.assertListEqual(list(results), [decrypted] * 10)
+
+        with self.assertRaises(ValueError):
+            json_models.decode_many(encrypted_texts, certificate, workers=0)
+
+    def test_encrypt(self):
+        certificate = PKCS12Certificate(self.cert_filepath, self.cert_password)
+        certificate_2 = PKCS12Certificate(self.cert_2_filepath, self.cert_2_password)
+        payload = {'attr': 'value', 'list': [1, 2, 3]}
+
+        encrypted_text = json_models.EncryptedTextModel.encrypt(
+            payload,
+            [
+                (certificate.pub_key, certificate.key_id),
+                (certificate_2.pub_key, certificate_2.key_id),
+            ],
+            workers=2,
+        )
+        self.assertEqual(len(encrypted_text.reading_keys), 2)
+        self.assertDictEqual(encrypted_text.decode(certificate), payload)
+        self.assertDictEqual(encrypted_text.decode(certificate_2), payload)
+
+        with self.assertRaises(ValueError):
+            json_models.EncryptedTextModel.encrypt(payload, [])
+        with self.assertRaises(ValueError):
+            json_models.EncryptedTextModel.encrypt(payload, [('invalid', certificate.key_id)])
+
     def test_decode_invalid_certificate(self):
         data = {
             "cipher": "AES256",
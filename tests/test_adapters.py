@@ -0,0 +1,96 @@
+# Copyright (c) 2024, InterlockLedger Network
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+from concurrent.futures import ThreadPoolExecutor
+import ssl
+from unittest import TestCase
+import requests
+from src.pyil2.adapters import ConnectionStats, IL2HTTPAdapter
+
+
+class ConnectionStatsTest(TestCase):
+    def test_counters(self):
+        stats = ConnectionStats()
+        self.assertDictEqual(stats.as_dict(), {
+            'new_connections': 0,
+            'resumed_connections': 0,
+            'reused_connections': 0,
+            'requests': 0,
+        })
+        stats.count_connection()
+        stats.count_resumed_connection()
+        stats.count_request()
+        stats.count_request()
+        self.assertDictEqual(stats.as_dict(), {
+            'new_connections': 1,
+            'resumed_connections': 1,
+            'reused_connections': 1,
+            'requests': 2,
+        })
+
+    def test_concurrent_counters(self):
+        stats = ConnectionStats()
+        with ThreadPoolExecutor(8) as executor:
+            list(executor.map(lambda _: stats.count_request(), range(1000)))
+        self.assertEqual(stats.as_dict()['requests'], 1000)
+
+
+class IL2HTTPAdapterTest(TestCase):
+    def test_pool_parameters(self):
+        adapter = IL2HTTPAdapter(pool_connections=2, pool_maxsize=32, pool_block=True)
+        self.assertEqual(adapter.poolmanager.connection_pool_kw['maxsize'], 32)
+        self.assertTrue(adapter.poolmanager.connection_pool_kw['block'])
+        self.assertIn('socket_options', adapter.poolmanager.connection_pool_kw)
+
+    def test_without_keep_alive(self):
+        adapter = IL2HTTPAdapter(keep_alive=False)
+        self.assertNotIn('socket_options', adapter.poolmanager.connection_pool_kw)
+
+    def test_ssl_context(self):
+        context = ssl.create_default_context()
+        adapter = IL2HTTPAdapter(ssl_context=context)
+        self.assertIs(adapter.poolmanager.connection_pool_kw['ssl_context'], context)
+        self.assertNotIn('ssl_context', IL2HTTPAdapter().poolmanager.connection_pool_kw)
+
+    def test_ssl_context_pool_options(self):
+        context = ssl.create_default_context()
+        request = requests.Request('GET', 'https://localhost:32020/').prepare()
+        adapter = IL2HTTPAdapter(ssl_context=context)
+        _, pool_kwargs = adapter.build_connection_pool_key_attributes(
+            request, requests.utils.DEFAULT_CA_BUNDLE_PATH)
+        self.assertNotIn('cert_reqs', pool_kwargs)
+        self.assertNotIn('ca_certs', pool_kwargs)
+        pool = adapter.get_connection_with_tls_context(
+            request, requests.utils.DEFAULT_CA_BUNDLE_PATH)
+        adapter.cert_verify(pool, request.url, requests.utils.DEFAULT_CA_BUNDLE_PATH, None)
+        self.assertIsNone(pool.ca_certs)
+        self.assertIsNone(pool.cert_reqs)
+        self.assertIs(pool.conn_kw['ssl_context'], context)
+
+        _, pool_kwargs = IL2HTTPAdapter().build_connection_pool_key_attributes(
+            request, requests.utils.DEFAULT_CA_BUNDLE_PATH)
+        self.assertEqual(pool_kwargs['cert_reqs'], 'CERT_REQUIRED')
@@ -25,9 +25,15 @@
 # CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+import json
 import os
+import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from unittest import TestCase
 from src.pyil2.client import IL2Client
+from src.pyil2.transports import FakeTransport, TransportResponse
+from .api.base import FakeApiTest
 
 
 class IL2ClientTest(TestCase):
@@ -49,3 +55,236 @@ class IL2ClientTest(TestCase):
         )
         resp = client.request('/', 'GET')
         self.assertEqual(resp.status_code, 200)
+
+    def test_shared_ssl_context(self):
+        client = IL2Client(
+            host=self.host,
+            cert_filepath=self.filepath,
+            cert_password=self.password,
+            verify_ca=False,
+            session_mode='per_thread',
+        )
+        with ThreadPoolExecutor(4) as executor:
+            sessions = list(executor.map(
+                lambda _: client.transport._get_session(), range(4)))
+        contexts = {
+            id(session.get_adapter(self.host).poolmanager.connection_pool_kw['ssl_context'])
+            for session in sessions
+        }
+        self.assertEqual(len(contexts), 1)
+        resp = client.request('/', 'GET')
+        self.assertEqual(resp.status_code, 200)
+
+    def test_connection_reuse(self):
+        client = IL2Client(
+            host=self.host,
+            cert_filepath=self.filepath,
+            cert_password=self.password,
+            verify_ca=False,
+            pool_maxsize=4,
+        )
+        for _ in range(3):
+            resp = client.request('/', 'GET')
+            self.assertEqual(resp.status_code, 200)
+        stats = client.connection_stats
+        self.assertEqual(stats['requests'], 3)
+        self.assertEqual(stats['new_connections'], 1)
+        self.assertEqual(stats['reused_connections'], 2)
+
+    def test_without_keep_alive(self):
+        client = IL2Client(
+            host=self.host,
+            cert_filepath=self.filepath,
+            cert_password=self.password,
+            verify_ca=False,
+            keep_alive=False,
+        )
+        for _ in range(2):
+            resp = client.request('/', 'GET')
+            self.assertEqual(resp.status_code, 200)
+        stats = client.connection_stats
+        self.assertEqual(stats['new_connections'], 2)
+        self.assertEqual(stats['reused_connections'], 0)
+
+    def test_tls_session_resumption(self):
+        client = IL2Client(
+            host=self.host,
+            cert_filepath=self.filepath,
+            cert_password=self.password,
+            verify_ca=False,
+            keep_alive=False,
+        )
+        for _ in range(3):
+            resp = client.request('/', 'GET')
+            self.assertEqual(resp.status_code, 200)
+        stats = client.connection_stats
+        self.assertEqual(stats['new_connections'], 3)
+        self.assertGreaterEqual(stats['resumed_connections'], 2)
+
+    def _concurrent_requests(self, client: IL2Client, workers: int = 8, count: int = 64):
+        with ThreadPoolExecutor(workers) as executor:
+            responses = list(executor.map(
+                lambda _: client.request('/', 'GET'),
+                range(count)
+            ))
+        for resp in responses:
+            self.assertEqual(resp.status_code, 200)
+
+    def test_shared_session_concurrent_load(self):
+        client = IL2Client(
+            host=self.host,
+            cert_filepath=self.filepath,
+            cert_password=self.password,
+            verify_ca=False,
+            pool_maxsize=8,
+            pool_block=True,
+        )
+        self._concurrent_requests(client)
+        stats = client.connection_stats
+        self.assertEqual(stats['requests'], 64)
+        self.assertLessEqual(stats['new_connections'], 8)
+
+    def test_per_thread_session_concurrent_load(self):
+        client = IL2Client(
+            host=self.host,
+            cert_filepath=self.filepath,
+            cert_password=self.password,
+            verify_ca=False,
+            session_mode='per_thread',
+        )
+        self._concurrent_requests(client)
+        stats = client.connection_stats
+        self.assertEqual(stats['requests'], 64)
+        self.assertLessEqual(stats['new_connections'], 8)
+        client.close()
+        resp = client.request('/', 'GET')
+        self.assertEqual(resp.status_code, 200)
+
+    def test_httpx_transport(self):
+        client = IL2Client(
+            host=self.host,
+            cert_filepath=self.filepath,
+            cert_password=self.password,
+            verify_ca=False,
+            transport='httpx',
+        )
+        self._concurrent_requests(client)
+        stats = client.connection_stats
+        self.assertEqual(stats['requests'], 64)
+        client.close()
+
+    def test_fake_transport(self):
+        urls = []
+
+        def handler(method, url, headers, params, body):
+            urls.append(url)
+            return TransportResponse(404, content=b'{"title": "Not found", "status": 404}')
+
+        client = IL2Client(
+            host=self.host,
+            cert_filepath=self.filepath,
+            cert_password=self.password,
+            transport=FakeTransport(handler),
+        )
+        resp = client.request('chain', 'GET')
+        self.assertEqual(resp.status, 404)
+        self.assertEqual(urls, [client.host + 'chain'])
+
+
+class IL2ClientParametersTest(TestCase):
+    def test_invalid_session_mode(self):
+        with self.assertRaises(ValueError):
+            IL2Client(
+                host='https://localhost:32032',
+                cert_filepath='invalid.pfx',
+                cert_password='password',
+                session_mode='invalid',
+            )
+
+    def test_invalid_transport(self):
+        with self.assertRaises(ValueError):
+            IL2Client(
+                host='https://localhost:32032',
+                cert_filepath='invalid.pfx',
+                cert_password='password',
+                transport='invalid',
+            )
+
+
+class IL2ClientDownloadTest(FakeApiTest):
+    def setUp(self):
+        super().setUp()
+        folder = tempfile.TemporaryDirectory()
+        self.addCleanup(folder.cleanup)
+        self.folder = folder.name
+        self.filepath = os.path.join(self.folder, 'data.bin')
+        self.content = os.urandom(10000)
+        self.etag = '"v1"'
+        self.ranges = []
+
+    def handle(self, method, path, params, body):
+        headers = {
+            'Content-Disposition': 'attachment; filename=data.bin',
+            'ETag': self.etag,
+        }
+        start = self.range_start
+        self.ranges.append(start)
+        if start is None:
+            headers['Content-Length'] = str(len(self.content))
+            return TransportResponse(200, headers, self.content)
+        headers['Content-Range'] = f'bytes {start}-{len(self.content) - 1}/{len(self.content)}'
+        return TransportResponse(206, headers, self.content[start:])
+
+    def _handle(self, method, url, headers, params, body):
+        match = re.match(r'bytes=(\d+)-', headers.get('Range', ''))
+        self.range_start = int(match.group(1)) if match else None
+        return super()._handle(method, url, headers, params, body)
+
+    def _write_part(self, size, info):
+        with open(self.filepath + '.part', 'wb') as f:
+            f.write(self.content[:size])
+        if info is not None:
+            with open(self.filepath + '.part.json', 'w', encoding='utf-8') as f:
+                json.dump(info, f)
+
+    def _download(self):
+        filepath = self.client.download_file('documents/file', dst_path=self.folder)
+        self.assertEqual(filepath, self.filepath)
+        with open(filepath, 'rb') as f:
+            self.assertEqual(f.read(), self.content)
+        self.assertFalse(os.path.exists(self.filepath + '.part'))
+        self.assertFalse(os.path.exists(self.filepath + '.part.json'))
+
+    def test_download(self):
+        self._download()
+        self.assertEqual(self.ranges, [None])
+
+    def test_resume(self):
+        self._write_part(4000, {'size': len(self.content), 'etag': self.etag})
+        self._download()
+        self.assertEqual(self.ranges, [None, 4000])
+
+    def test_resume_other_file(self):
+        self._write_part(4000, {'size': len(self.content), 'etag': '"v0"'})
+        self._download()
+        self.assertEqual(self.ranges, [None])
+
+        self._write_part(4000, {'size': len(self.content) + 1, 'etag': self.etag})
+        self._download()
+        self.assertEqual(self.ranges, [None, None])
+
+        self._write_part(4000, None)
+        self._download()
+        self.assertEqual(self.ranges, [None, None, None])
+
+    def test_file_changed_while_resuming(self):
+        self._write_part(4000, {'size': len(self.content), 'etag': self.etag})
+        handle = self.handle
+
+        def change(method, path, params, body):
+            resp = handle(method, path, params, body)
+            self.etag = '"v2"'
+            return resp
+        self.handle = change
+        self._download()
+        self.assertEqual(self.ranges, [None, 4000, None])
@@ -0,0 +1,143 @@
+# Copyright (c) 2024, InterlockLedger Network
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+import os
+import socket
+import ssl
+import tempfile
+import threading
+from unittest import TestCase
+import h2.config
+import h2.connection
+import h2.events
+import h2.settings
+import httpx
+from src.pyil2.http2 import (
+    HTTP2Settings,
+    IL2HTTP2Transport,
+    _H2State,
+)
+from .helpers import create_test_certificate
+
+
+class HTTP2SettingsTest(TestCase):
+    def test_defaults(self):
+        settings = HTTP2Settings()
+        self.assertEqual(settings.max_concurrent_streams, 100)
+        self.assertEqual(settings.stream_window_size, 16 * 1024 * 1024)
+        self.assertEqual(settings.connection_window_size, 16 * 1024 * 1024)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            HTTP2Settings(max_concurrent_streams=0)
+        with self.assertRaises(ValueError):
+            HTTP2Settings(stream_window_size=1024)
+        with self.assertRaises(ValueError):
+            HTTP2Settings(connection_window_size=2 ** 31)
+
+    def test_local_settings(self):
+        settings = HTTP2Settings(
+            max_concurrent_streams=8,
+            stream_window_size=256 * 1024,
+            connection_window_size=1024 * 1024,
+        )
+        state = _H2State(settings)
+        state.initiate_connection()
+        codes = h2.settings.SettingCodes
+        self.assertEqual(state.local_settings[codes.MAX_CONCURRENT_STREAMS], 8)
+        self.assertEqual(state.local_settings[codes.INITIAL_WINDOW_SIZE], 256 * 1024)
+        self.assertEqual(state.local_settings[codes.ENABLE_PUSH], 0)
+        self.assertNotIn(codes.ENABLE_CONNECT_PROTOCOL, state.local_settings)
+
+        state.increment_flow_control_window(16 * 1024 * 1024)
+        self.assertEqual(state.inbound_flow_control_window, 1024 * 1024)
+        state.increment_flow_control_window(16 * 1024 * 1024)
+        self.assertEqual(state.inbound_flow_control_window, 1024 * 1024)
+
+
+class IL2HTTP2TransportTest(TestCase):
+    def setUp(self) -> None:
+        self.folder = tempfile.TemporaryDirectory()
+        self.addCleanup(self.folder.cleanup)
+        create_test_certificate(self.folder.name)
+        self.cafile = os.path.join(self.folder.name, 'test.crt')
+        self.server_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        self.server_context.load_cert_chain(
+            self.cafile, os.path.join(self.folder.name, 'test.key'))
+        self.server_context.set_alpn_protocols(['h2'])
+        self.listener = socket.create_server(('127.0.0.1', 0))
+        self.addCleanup(self.listener.close)
+        self.settings = []
+        self.window_increments = []
+        self.server = threading.Thread(target=self._serve, daemon=True)
+        self.server.start()
+
+    def _serve(self) -> None:
+        sock, _ = self.listener.accept()
+        with self.server_context.wrap_socket(sock, server_side=True) as tls:
+            conn = h2.connection.H2Connection(
+                config=h2.config.H2Configuration(client_side=False))
+            conn.initiate_connection()
+            tls.sendall(conn.data_to_send())
+            while data := tls.recv(65536):
+                for event in conn.receive_data(data):
+                    if isinstance(event, h2.events.RemoteSettingsChanged):
+                        self.settings.append({
+                            code: setting.new_value
+                            for code, setting in event.changed_settings.items()
+                        })
+                    elif isinstance(event, h2.events.WindowUpdated) and event.stream_id == 0:
+                        self.window_increments.append(event.delta)
+                    elif isinstance(event, h2.events.StreamEnded):
+                        conn.send_headers(event.stream_id, [
+                            (':status', '200'),
+                            ('content-length', '2'),
+                        ])
+                        conn.send_data(event.stream_id, b'ok', end_stream=True)
+                tls.sendall(conn.data_to_send())
+
+    def test_settings(self):
+        context = ssl.create_default_context(cafile=self.cafile)
+        settings = HTTP2Settings(
+            max_concurrent_streams=8,
+            stream_window_size=256 * 1024,
+            connection_window_size=1024 * 1024,
+        )
+        transport = IL2HTTP2Transport(context, httpx.Limits(max_connections=1), settings)
+        with httpx.Client(transport=transport) as client:
+            port = self.listener.getsockname()[1]
+            resp = client.get(f'https://localhost:{port}/')
+            self.assertEqual(resp.http_version, 'HTTP/2')
+            self.assertEqual(resp.content, b'ok')
+        self.server.join(5)
+
+        codes = h2.settings.SettingCodes
+        self.assertEqual(len(self.settings), 1)
+        self.assertEqual(self.settings[0][codes.MAX_CONCURRENT_STREAMS], 8)
+        self.assertEqual(self.settings[0][codes.INITIAL_WINDOW_SIZE], 256 * 1024)
+        self.assertEqual(self.settings[0][codes.ENABLE_PUSH], 0)
+        self.assertListEqual(self.window_increments, [1024 * 1024 - 65535])
@@ -0,0 +1,107 @@
+# Copyright (c) 2024, InterlockLedger Network
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+import json
+from unittest import TestCase
+from src.pyil2.transports import (
+    FakeTransport,
+    RequestsTransport,
+    TransportResponse,
+)
+
+
+class TransportResponseTest(TestCase):
+    def test_content(self):
+        resp = TransportResponse(200, {'Content-Type': 'application/json'}, b'{"a": 1}')
+        self.assertTrue(resp.ok)
+        self.assertEqual(resp.headers['content-type'], 'application/json')
+        self.assertEqual(resp.json(), {'a': 1})
+        self.assertEqual(list(resp.raw.stream(3)), [b'{"a', b'": ', b'1}'])
+
+    def test_stream(self):
+        closed = []
+        resp = TransportResponse(
+            206,
+            stream=lambda chunk_size: iter([b'abc', b'def']),
+            close=lambda: closed.append(True),
+        )
+        self.assertEqual(list(resp.raw.stream(3, decode_content=False)), [b'abc', b'def'])
+        resp.close()
+        resp.close()
+        self.assertEqual(closed, [True])
+
+    def test_lazy_content(self):
+        closed = []
+        resp = TransportResponse(
+            200,
+            stream=lambda chunk_size: iter([b'abc', b'def']),
+            close=lambda: closed.append(True),
+        )
+        self.assertEqual(resp.content, b'abcdef')
+        self.assertEqual(resp.text, 'abcdef')
+        self.assertEqual(closed, [True])
+
+    def test_empty(self):
+        resp = TransportResponse(404)
+        self.assertFalse(resp.ok)
+        self.assertEqual(resp.content, b'')
+
+
+class FakeTransportTest(TestCase):
+    def test_request(self):
+        requests = []
+
+        def handler(method, url, headers, params, body):
+            requests.append((method, url, headers, params, body))
+            return TransportResponse(201, content=b'{}')
+
+        transport = FakeTransport(handler)
+        resp = transport.request(
+            'POST', 'https://node/records', headers={'Accept': 'application/json'},
+            params={'a': '1'}, json={'b': 2})
+        self.assertEqual(resp.status_code, 201)
+        transport.request('POST', 'https://node/opaque', data=[b'12', memoryview(b'34')])
+        self.assertEqual(requests[0], (
+            'POST', 'https://node/records', {'Accept': 'application/json'}, {'a': '1'},
+            json.dumps({'b': 2}).encode('utf-8'),
+        ))
+        self.assertEqual(requests[1][4], b'1234')
+        self.assertEqual(transport.connection_stats['requests'], 2)
+
+    def test_bind(self):
+        transport = FakeTransport(lambda *args: TransportResponse(200))
+        client = object()
+        transport.bind(client)
+        transport.bind(client)
+        with self.assertRaises(ValueError):
+            transport.bind(object())
+
+
+class RequestsTransportTest(TestCase):
+    def test_invalid_session_mode(self):
+        with self.assertRaises(ValueError):
+            RequestsTransport(session_mode='invalid')
@@ -25,8 +25,17 @@
 # CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+import base64
+import os
 from unittest import TestCase
-from src.pyil2.utils import AppPermissions
+from cryptography.hazmat.primitives import ciphers
+from src.pyil2.utils import (
+    AppPermissions,
+    aes_decrypt,
+    aes_decrypt_chunks,
+    aes_decrypt_into,
+    urlsafe_b64decode_chunks,
+)
 
 
 class AppPermissionsTest(TestCase):
@@ -69,3 +78,47 @@ class AppPermissionsTest(TestCase):
         self.assertEqual(permissions.app_id, 4)
         self.assertListEqual(permissions.action_ids, [])
         self.assertEqual(str(permissions), data)
+
+
+class AesDecryptTest(TestCase):
+    def setUp(self):
+        self.key = os.urandom(32)
+        self.iv = os.urandom(16)
+        self.message = os.urandom(16 * 1000)
+        cipher = ciphers.Cipher(ciphers.algorithms.AES(self.key), ciphers.modes.CBC(self.iv))
+        encryptor = cipher.encryptor()
+        self.encrypted = encryptor.update(self.message) + encryptor.finalize()
+
+    def _chunks(self, size):
+        view = memoryview(self.encrypted)
+        return [view[i:i + size] for i in range(0, len(view), size)]
+
+    def test_aes_decrypt(self):
+        self.assertEqual(aes_decrypt(self.encrypted, self.key, self.iv), self.message)
+
+    def test_aes_decrypt_chunks(self):
+        for size in (1, 100, len(self.encrypted)):
+            decrypted = b''.join(aes_decrypt_chunks(self._chunks(size), self.key, self.iv))
+            self.assertEqual(decrypted, self.message)
+
+    def test_aes_decrypt_into(self):
+        for size in (1, 100, len(self.encrypted)):
+            buffer = bytearray(len(self.encrypted) + 15)
+            length = aes_decrypt_into(self._chunks(size), self.key, self.iv, buffer)
+            self.assertEqual(length, len(self.message))
+            self.assertEqual(buffer[:length], self.message)
+
+    def test_urlsafe_b64decode_chunks(self):
+        text = base64.urlsafe_b64encode(self.message).decode()
+        for size in (1, 100, 3 * len(text)):
+            chunks = list(urlsafe_b64decode_chunks(text, size))
+            self.assertEqual(b''.join(chunks), self.message)
+        self.assertEqual(list(urlsafe_b64decode_chunks('')), [])
+
+    def test_urlsafe_b64decode_chunks_wrapped(self):
+        text = base64.urlsafe_b64encode(self.message).decode()
+        wrapped = '\r\n'.join(text[i:i + 76] for i in range(0, len(text), 76)) + '\n'
+        wrapped = ' ' + wrapped.replace('A', ' A\t')
+        for size in (1, 3, 100, 3 * len(wrapped)):
+            chunks = list(urlsafe_b64decode_chunks(wrapped, size))
+            self.assertEqual(b''.join(chunks), self.message)
@@ -0,0 +1,237 @@
+# Copyright (c) 2024, InterlockLedger Network
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+import os
+import shutil
+import sqlite3
+import tempfile
+import time
+from unittest import TestCase
+from src.pyil2.utils.cache import (
+    CertificateCache,
+    LRUCache,
+    RecordCache,
+)
+
+
+class LRUCacheTest(TestCase):
+    def test_get_put(self):
+        cache = LRUCache(max_entries=2)
+        cache.put('a', 1)
+        self.assertEqual(cache.get('a'), 1)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('b', 0), 0)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 2)
+
+    def test_max_entries(self):
+        cache = LRUCache(max_entries=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+        self.assertEqual(len(cache), 2)
+        self.assertIn('a', cache)
+        self.assertNotIn('b', cache)
+        self.assertIn('c', cache)
+
+    def test_max_bytes(self):
+        cache = LRUCache(max_entries=10, max_bytes=10, sizeof=lambda key, value: len(value))
+        cache.put('a', b'12345')
+        cache.put('b', b'1234')
+        self.assertEqual(cache.size, 9)
+        cache.put('c', b'12')
+        self.assertNotIn('a', cache)
+        self.assertEqual(cache.size, 6)
+        cache.put('d', b'12345678901')
+        self.assertNotIn('d', cache)
+        cache.put('b', b'1')
+        self.assertEqual(cache.size, 3)
+
+    def test_invalidate(self):
+        cache = LRUCache()
+        for key in (('x', 1), ('x', 2), ('y', 1)):
+            cache.put(key, 0)
+        self.assertTrue(cache.invalidate(('y', 1)))
+        self.assertFalse(cache.invalidate(('y', 1)))
+        self.assertEqual(cache.invalidate_where(lambda key: key[0] == 'x'), 2)
+        self.assertEqual(len(cache), 0)
+        cache.put('a', 1)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+    def test_invalid_limits(self):
+        with self.assertRaises(ValueError):
+            LRUCache(max_entries=0)
+        with self.assertRaises(ValueError):
+            LRUCache(max_bytes=10)
+
+
+class CertificateCacheTest(TestCase):
+    def setUp(self) -> None:
+        self.filepath = os.environ.get('TEST_CERTIFICATE_PATH')
+        self.password = os.environ.get('TEST_CERTIFICATE_PASS')
+
+        if not self.filepath or not self.password:
+            self.skipTest(
+                'Skipping TEST_CERTIFICATE_PATH or TEST_CERTIFICATE_PASS are not set as environment variables.')
+
+    def test_get_certificate(self):
+        cache = CertificateCache()
+        certificate = cache.get_certificate(self.filepath, self.password)
+        self.assertIs(cache.get_certificate(self.filepath, self.password), certificate)
+        with self.assertRaises(ValueError):
+            cache.get_certificate(self.filepath, self.password + 'wrong')
+        self.assertEqual(len(cache), 1)
+
+    def test_get_ssl_context(self):
+        cache = CertificateCache()
+        context = cache.get_ssl_context(self.filepath, self.password, verify_ca=False)
+        self.assertIs(
+            cache.get_ssl_context(self.filepath, self.password, verify_ca=False), context)
+        self.assertIsNot(cache.get_ssl_context(self.filepath, self.password), context)
+        self.assertEqual(len(cache), 3)
+        self.assertEqual(cache.invalidate_file(self.filepath), 3)
+        self.assertEqual(len(cache), 0)
+
+    def test_modified_file(self):
+        cache = CertificateCache()
+        with tempfile.TemporaryDirectory() as folder:
+            filepath = os.path.join(folder, 'cert.pfx')
+            shutil.copy(self.filepath, filepath)
+            certificate = cache.get_certificate(filepath, self.password)
+            stat = os.stat(filepath)
+            os.utime(filepath, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+            self.assertIsNot(cache.get_certificate(filepath, self.password), certificate)
+            self.assertEqual(len(cache), 1)
+
+
+class RecordCacheTest(TestCase):
+    def test_get_put(self):
+        with RecordCache() as cache:
+            cache.put('net', 'chain', 1, 'opaque', b'payload', '{"x-app-id": "1"}')
+            self.assertEqual(
+                cache.get('net', 'chain', 1, 'opaque'),
+                (b'payload', '{"x-app-id": "1"}')
+            )
+            self.assertIsNone(cache.get('net', 'chain', 1, 'record'))
+            self.assertIsNone(cache.get('other', 'chain', 1, 'opaque'))
+            self.assertIsNone(cache.get('net', 'other', 1, 'opaque'))
+            self.assertEqual(cache.hits, 1)
+            self.assertEqual(cache.misses, 3)
+
+    def test_max_bytes(self):
+        with RecordCache(max_bytes=30) as cache:
+            cache.put('net', 'chain', 1, 'record', b'1' * 10)
+            cache.put('net', 'chain', 2, 'record', b'2' * 10)
+            cache.put('net', 'chain', 3, 'record', b'3' * 10)
+            cache.get('net', 'chain', 1, 'record')
+            cache.put('net', 'chain', 4, 'record', b'4' * 10)
+            self.assertEqual(cache.size, 30)
+            self.assertIsNotNone(cache.get('net', 'chain', 1, 'record'))
+            self.assertIsNone(cache.get('net', 'chain', 2, 'record'))
+            cache.put('net', 'chain', 5, 'record', b'5' * 31)
+            self.assertIsNone(cache.get('net', 'chain', 5, 'record'))
+            self.assertEqual(len(cache), 3)
+
+    def test_invalidate(self):
+        with RecordCache() as cache:
+            cache.put('net', 'chain', 1, 'record', b'1')
+            cache.put('net', 'chain', 2, 'record', b'2')
+            cache.put('net', 'other', 1, 'record', b'3')
+            cache.put('other', 'chain', 1, 'record', b'4')
+            self.assertEqual(cache.invalidate('net', 'chain', 1), 1)
+            self.assertEqual(cache.invalidate(chain_id='chain'), 2)
+            self.assertEqual(len(cache), 1)
+            self.assertEqual(cache.size, 1)
+            cache.clear()
+            self.assertEqual(len(cache), 0)
+
+    def test_persistence(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'records.db')
+            with RecordCache(path) as cache:
+                cache.put('net', 'chain', 1, 'record', b'content')
+            with RecordCache(path) as cache:
+                self.assertEqual(cache.size, 7)
+                self.assertEqual(cache.get('net', 'chain', 1, 'record'), (b'content', None))
+
+    def test_shared_database(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'records.db')
+            with RecordCache(path, max_bytes=30) as cache, \
+                    RecordCache(path, max_bytes=30) as other:
+                cache.put('net', 'chain', 1, 'record', b'1' * 10)
+                other.put('net', 'chain', 2, 'record', b'2' * 10)
+                cache.put('net', 'chain', 3, 'record', b'3' * 10)
+                self.assertEqual(other.size, 30)
+                # The access of the hit is written by the next put of the same cache.
+                other.get('net', 'chain', 1, 'record')
+                other.put('net', 'chain', 4, 'record', b'4' * 10)
+                self.assertEqual(cache.size, 30)
+                self.assertEqual(other.size, 30)
+                self.assertIsNotNone(cache.get('net', 'chain', 1, 'record'))
+                self.assertIsNone(cache.get('net', 'chain', 2, 'record'))
+                other.invalidate(serial=3)
+                self.assertEqual(cache.size, 20)
+
+    def test_hit_while_locked(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'records.db')
+            with RecordCache(path, max_pending_accesses=2) as cache:
+                cache.put('net', 'chain', 1, 'record', b'content')
+                writer = sqlite3.connect(path, isolation_level=None)
+                writer.execute('BEGIN IMMEDIATE')
+                try:
+                    start = time.monotonic()
+                    for _ in range(3):
+                        self.assertEqual(
+                            cache.get('net', 'chain', 1, 'record'), (b'content', None))
+                    self.assertLess(time.monotonic() - start, 1)
+                finally:
+                    writer.execute('ROLLBACK')
+                    writer.close()
+                self.assertEqual(cache.hits, 3)
+
+    def test_accesses_written_in_batches(self):
+        with RecordCache(max_bytes=30, max_pending_accesses=2) as cache:
+            for serial in (1, 2, 3):
+                cache.put('net', 'chain', serial, 'record', b'x' * 10)
+            cache.get('net', 'chain', 1, 'record')
+            cache.get('net', 'chain', 2, 'record')
+            self.assertEqual(len(cache._accesses), 0)
+            cache.get('net', 'chain', 1, 'record')
+            self.assertEqual(len(cache._accesses), 1)
+            cache.put('net', 'chain', 4, 'record', b'x' * 10)
+            self.assertIsNone(cache.get('net', 'chain', 3, 'record'))
+            self.assertIsNotNone(cache.get('net', 'chain', 1, 'record'))
+
+    def test_invalid_max_bytes(self):
+        with self.assertRaises(ValueError):
+            RecordCache(max_bytes=0)
+        with self.assertRaises(ValueError):
+            RecordCache(max_pending_accesses=0)
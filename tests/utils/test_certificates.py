@@ -25,9 +25,22 @@
 # CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+from concurrent.futures import ThreadPoolExecutor
 import os
-from unittest import TestCase
-from src.pyil2.utils.certificates import PKCS12Certificate
+import pickle
+import socket
+import ssl
+import tempfile
+import threading
+from unittest import TestCase, mock
+from src.pyil2.utils.certificates import (
+    CertificateKeyring,
+    PKCS12Certificate,
+    create_ssl_context,
+    il2_public_key_hash,
+    rsa_public_key_from_il2,
+)
+from ..helpers import create_test_certificate
 
 
 class PKCS12CertificateTest(TestCase):
@@ -51,3 +64,125 @@ class PKCS12CertificateTest(TestCase):
         self.assertIsInstance(certificate.key_id, str)
         self.assertIsInstance(certificate.pub_key_hash, str)
         self.assertIsInstance(certificate.public_modulus, int)
+
+    def test_memoized_values(self):
+        certificate = PKCS12Certificate(
+            path=self.filepath, password=self.password)
+        values = (
+            certificate.key_id,
+            certificate.pub_key_hash,
+            certificate.pub_key,
+            certificate.private_key,
+            certificate.public_certificate,
+        )
+        self.assertIs(certificate.key_id, values[0])
+        self.assertIs(certificate.public_certificate, values[4])
+
+        certificate = PKCS12Certificate(
+            path=self.filepath, password=self.password)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = set(executor.map(
+                lambda _: (
+                    certificate.key_id,
+                    certificate.pub_key_hash,
+                    certificate.pub_key,
+                    certificate.private_key,
+                    certificate.public_certificate,
+                ),
+                range(32),
+            ))
+        self.assertSetEqual(results, {values})
+
+    def test_keyring(self):
+        certificate = PKCS12Certificate(
+            path=self.filepath, password=self.password)
+        keyring = CertificateKeyring([certificate])
+        self.assertEqual(len(keyring), 1)
+        self.assertIn(certificate, keyring)
+        reading_keys = {('Key!other#SHA1', 'other#SHA256'): 'other', certificate.reader_index_key: 'mine'}
+        self.assertEqual(keyring.find(reading_keys), (certificate, 'mine'))
+        self.assertIsNone(keyring.find({('Key!other#SHA1', 'other#SHA256'): 'other'}))
+        self.assertTrue(keyring.remove(certificate))
+        self.assertFalse(keyring.remove(certificate))
+        self.assertIsNone(keyring.find(reading_keys))
+
+    def test_create_ssl_context(self):
+        certificate = PKCS12Certificate(
+            path=self.filepath, password=self.password)
+        no_memfd = {'memfd_create': mock.Mock(side_effect=OSError), 'MFD_CLOEXEC': 1}
+        with mock.patch('tempfile.mkstemp', side_effect=AssertionError):
+            create_ssl_context(certificate)
+            with mock.patch.dict(os.__dict__, no_memfd):
+                create_ssl_context(certificate)
+                with mock.patch('os.path.isdir', return_value=False):
+                    with self.assertRaises(OSError):
+                        create_ssl_context(certificate)
+
+    def test_pickle(self):
+        certificate = PKCS12Certificate(
+            path=self.filepath, password=self.password)
+        with self.assertRaises(TypeError):
+            pickle.dumps(certificate)
+
+    def test_export(self):
+        certificate = PKCS12Certificate(
+            path=self.filepath, password=self.password)
+        copy = PKCS12Certificate._from_export(certificate._export())
+        self.assertEqual(copy.key_id, certificate.key_id)
+        self.assertEqual(copy.pub_key_hash, certificate.pub_key_hash)
+        self.assertEqual(copy.private_key, certificate.private_key)
+
+
+class SharedSSLContextTest(TestCase):
+    def setUp(self) -> None:
+        self.folder = tempfile.TemporaryDirectory()
+        self.addCleanup(self.folder.cleanup)
+        pfx_path = create_test_certificate(self.folder.name)
+        self.cafile = os.path.join(self.folder.name, 'test.crt')
+        self.certificate = PKCS12Certificate(pfx_path, 'password')
+        self.server_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        self.server_context.load_cert_chain(
+            self.cafile, os.path.join(self.folder.name, 'test.key'))
+
+    def _start_server(self) -> int:
+        listener = socket.create_server(('127.0.0.1', 0))
+        self.addCleanup(listener.close)
+
+        def serve():
+            while True:
+                try:
+                    sock, _ = listener.accept()
+                except OSError:
+                    return
+                try:
+                    with self.server_context.wrap_socket(sock, server_side=True) as tls:
+                        tls.sendall(b'x')
+                        tls.recv(1)
+                except OSError:
+                    pass
+        threading.Thread(target=serve, daemon=True).start()
+        return listener.getsockname()[1]
+
+    def _connect(self, context: ssl.SSLContext, port: int) -> bool:
+        sock = socket.create_connection(('127.0.0.1', port))
+        with context.wrap_socket(sock, server_hostname='localhost') as tls:
+            self.assertEqual(tls.recv(1), b'x')
+            return tls.session_reused
+
+    def test_alpn_protocols(self):
+        context = create_ssl_context(
+            self.certificate, cafile=self.cafile, alpn_protocols=['http/1.1', 'h2'])
+        self.assertIsInstance(context, ssl.SSLContext)
+        context.set_alpn_protocols(['http/1.1', 'h2'])
+        with self.assertRaises(ValueError):
+            context.set_alpn_protocols(['http/1.1'])
+
+    def test_session_resumption(self):
+        context = create_ssl_context(self.certificate, cafile=self.cafile)
+        port = self._start_server()
+        other_port = self._start_server()
+        self.assertFalse(self._connect(context, port))
+        self.assertTrue(self._connect(context, port))
+        self.assertFalse(self._connect(context, other_port))
+        self.assertTrue(self._connect(context, other_port))
+        self.assertTrue(self._connect(context, port))
@@ -0,0 +1,202 @@
+# Copyright (c) 2024, InterlockLedger Network
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+import io
+import mmap
+import os
+import tempfile
+from unittest import TestCase
+import requests
+import urllib3
+from src.pyil2.utils.stream import (
+    DownloadStream,
+    UploadStream,
+    content_disposition_filename,
+    map_file,
+)
+
+
+class UploadStreamTest(TestCase):
+    def test_bytes_chunks(self):
+        data = bytes(range(256)) * 10
+        stream = UploadStream(data, chunk_size=1000)
+        chunks = list(stream)
+        self.assertEqual(len(stream), len(data))
+        self.assertEqual([len(chunk) for chunk in chunks], [1000, 1000, 560])
+        self.assertTrue(all(isinstance(chunk, memoryview) for chunk in chunks))
+        self.assertEqual(b''.join(chunks), data)
+
+    def test_memoryview_is_not_copied(self):
+        data = bytearray(b'0123456789')
+        stream = UploadStream(memoryview(data), chunk_size=4)
+        chunks = list(stream)
+        data[0:1] = b'x'
+        self.assertEqual(bytes(chunks[0]), b'x123')
+
+    def test_file_object(self):
+        data = b'0123456789' * 100
+        f = io.BytesIO(data)
+        f.seek(10)
+        stream = UploadStream(f, chunk_size=300)
+        self.assertEqual(stream.size, len(data) - 10)
+        self.assertEqual(b''.join(stream), data[10:])
+
+    def test_iterable_of_chunks(self):
+        stream = UploadStream(iter([b'abc', b'def']))
+        self.assertIsNone(stream.size)
+        with self.assertRaises(TypeError):
+            len(stream)
+        self.assertTrue(stream)
+        self.assertEqual(b''.join(stream), b'abcdef')
+
+    def test_progress(self):
+        progress = []
+        stream = UploadStream(
+            b'0123456789',
+            chunk_size=4,
+            progress=lambda sent, total: progress.append((sent, total)),
+        )
+        list(stream)
+        self.assertEqual(progress, [(4, 10), (8, 10), (10, 10)])
+
+    def test_invalid_chunk_size(self):
+        with self.assertRaises(ValueError):
+            UploadStream(b'', chunk_size=0)
+
+    def test_map_file(self):
+        fd, filepath = tempfile.mkstemp()
+        os.close(fd)
+        self.addCleanup(os.remove, filepath)
+        with open(filepath, 'rb') as f:
+            with map_file(f) as data:
+                self.assertEqual(data, b'')
+        with open(filepath, 'wb') as f:
+            f.write(b'0123456789')
+        with open(filepath, 'rb') as f:
+            with map_file(f) as data:
+                self.assertIsInstance(data, mmap.mmap)
+                stream = UploadStream(data, chunk_size=3)
+                self.assertEqual(b''.join(stream), b'0123456789')
+            self.assertTrue(data.closed)
+
+
+def _response(status_code, body, headers):
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers)
+    response.raw = urllib3.HTTPResponse(
+        body=io.BytesIO(body),
+        headers=headers,
+        status=status_code,
+        preload_content=False,
+    )
+    return response
+
+
+class DownloadStreamTest(TestCase):
+    data = bytes(range(256)) * 40
+
+    def _partial_response(self, start, stop):
+        return _response(206, self.data[start:stop], {
+            'Content-Length': str(len(self.data) - start),
+            'Content-Range': f'bytes {start}-{len(self.data) - 1}/{len(self.data)}',
+            'Content-Disposition': "attachment; filename=data.bin; filename*=UTF-8''data.bin",
+        })
+
+    def test_content_disposition_filename(self):
+        self.assertEqual(
+            content_disposition_filename("attachment; filename=a.txt; filename*=UTF-8''a.txt"),
+            'a.txt'
+        )
+        self.assertEqual(content_disposition_filename('attachment; filename=a.txt'), 'a.txt')
+        self.assertEqual(
+            content_disposition_filename('attachment; filename="my; file.txt"'),
+            'my; file.txt'
+        )
+        self.assertEqual(
+            content_disposition_filename("attachment; filename*=UTF-8''na%C3%AFve%20file.txt"),
+            'na\u00efve file.txt'
+        )
+        self.assertEqual(
+            content_disposition_filename('attachment; filename="../../etc/passwd"'),
+            'passwd'
+        )
+        self.assertIsNone(content_disposition_filename('inline'))
+        self.assertIsNone(content_disposition_filename(None))
+
+    def test_download(self):
+        response = _response(200, self.data, {
+            'Content-Length': str(len(self.data)),
+            'Content-Disposition': 'attachment; filename=data.bin',
+        })
+        stream = DownloadStream(lambda headers: None, response, chunk_size=1000)
+        self.assertEqual(stream.filename, 'data.bin')
+        self.assertEqual(stream.size, len(self.data))
+        chunks = list(stream)
+        self.assertEqual(len(chunks[0]), 1000)
+        self.assertEqual(b''.join(chunks), self.data)
+
+    def test_resume(self):
+        requested = []
+
+        def open_response(headers):
+            start = int(headers['Range'][len('bytes='):-1])
+            requested.append(start)
+            return self._partial_response(start, start + 3000)
+
+        progress = []
+        stream = DownloadStream(
+            open_response,
+            self._partial_response(0, 3000),
+            chunk_size=1000,
+            progress=lambda received, total: progress.append((received, total)),
+        )
+        self.assertEqual(b''.join(stream), self.data)
+        self.assertEqual(requested, [3000, 6000, 9000])
+        self.assertEqual(progress[-1], (len(self.data), len(self.data)))
+
+    def test_resume_without_range_support(self):
+        full_response = _response(200, self.data, {'Content-Length': str(len(self.data))})
+        stream = DownloadStream(
+            lambda headers: full_response,
+            self._partial_response(0, 5000),
+        )
+        self.assertEqual(b''.join(stream), self.data)
+
+    def test_offset(self):
+        stream = DownloadStream(lambda headers: None, self._partial_response(1000, None), offset=1000)
+        self.assertEqual(stream.size, len(self.data))
+        self.assertEqual(b''.join(stream), self.data[1000:])
+
+    def test_max_retries(self):
+        stream = DownloadStream(
+            lambda headers: self._partial_response(0, 0),
+            self._partial_response(0, 100),
+            max_retries=2,
+        )
+        with self.assertRaises(Exception):
+            list(stream)
@@ -0,0 +1,119 @@
+# Copyright (c) 2024, InterlockLedger Network
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+import io
+import os
+import zipfile
+from unittest import TestCase
+from src.pyil2.utils.zipstream import iter_zip_entries
+
+
+class _Unseekable(io.RawIOBase):
+    def __init__(self, buffer: io.BytesIO):
+        self.buffer = buffer
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        return self.buffer.write(b)
+
+
+def _chunks(data, size):
+    for i in range(0, len(data), size):
+        yield data[i:i + size]
+
+
+class ZipStreamTest(TestCase):
+    files = {
+        'a.txt': b'hello world' * 1000,
+        'sub/b.bin': os.urandom(100000),
+        'sub/empty.txt': b'',
+        'sub/deep/naïve.txt': b'utf-8 name',
+    }
+
+    def _zip(self, compression, seekable=True):
+        buffer = io.BytesIO()
+        target = buffer if seekable else _Unseekable(buffer)
+        with zipfile.ZipFile(target, 'w', compression) as z:
+            z.writestr('sub/', b'')
+            for name, content in self.files.items():
+                with z.open(name, 'w') as f:
+                    f.write(content)
+        return buffer.getvalue()
+
+    def _read_all(self, data, chunk_size):
+        return {
+            name: entry.read()
+            for name, entry in iter_zip_entries(_chunks(data, chunk_size))
+        }
+
+    def test_stored(self):
+        data = self._zip(zipfile.ZIP_STORED)
+        for chunk_size in (1, 1000, len(data)):
+            self.assertEqual(self._read_all(data, chunk_size), self.files)
+
+    def test_deflated(self):
+        data = self._zip(zipfile.ZIP_DEFLATED)
+        for chunk_size in (1, 1000, len(data)):
+            self.assertEqual(self._read_all(data, chunk_size), self.files)
+
+    def test_deflated_data_descriptor(self):
+        data = self._zip(zipfile.ZIP_DEFLATED, seekable=False)
+        self.assertEqual(self._read_all(data, 1000), self.files)
+
+    def test_stored_data_descriptor(self):
+        data = self._zip(zipfile.ZIP_STORED, seekable=False)
+        with self.assertRaises(zipfile.BadZipFile):
+            self._read_all(data, 1000)
+
+    def test_unsupported_method(self):
+        data = self._zip(zipfile.ZIP_BZIP2)
+        with self.assertRaises(zipfile.BadZipFile):
+            self._read_all(data, 1000)
+
+    def test_skip_entries(self):
+        data = self._zip(zipfile.ZIP_DEFLATED)
+        contents = {}
+        for name, entry in iter_zip_entries(_chunks(data, 1000)):
+            if name != 'sub/b.bin':
+                contents[name] = entry.read(5)
+        self.assertEqual(list(contents), ['a.txt', 'sub/empty.txt', 'sub/deep/naïve.txt'])
+        self.assertEqual(contents['a.txt'], b'hello')
+
+    def test_bad_crc(self):
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_STORED) as z:
+            z.writestr('a.txt', b'abcdef')
+        data = buffer.getvalue().replace(b'abcdef', b'abcdeX')
+        with self.assertRaises(zipfile.BadZipFile):
+            self._read_all(data, 1000)
+
+    def test_not_zip(self):
+        with self.assertRaises(zipfile.BadZipFile):
+            self._read_all(b'not a zip file', 1000)
+        self.assertEqual(self._read_all(b'', 1000), {})